@@ -0,0 +1,12 @@
+# cache/__init__.py
+from .device_filter import BloomFilter, DeviceFilter, device_filter
+from .registry_replica import DeviceRegistryReplica, RegistryEntry, registry_replica
+
+__all__ = [
+    "BloomFilter",
+    "DeviceFilter",
+    "device_filter",
+    "DeviceRegistryReplica",
+    "RegistryEntry",
+    "registry_replica",
+]
@@ -0,0 +1,239 @@
+# app/cache/registry_replica.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from ..config import get_settings
+from ..db import async_session_maker
+from ..models import DeviceRegistry
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Re-read a small window behind the watermark so rows committed late with an
+# earlier updated_at (now() is transaction start time) are not missed.
+DELTA_OVERLAP_SECONDS = 5.0
+
+
+@dataclass(slots=True, frozen=True)
+class RegistryEntry:
+    """Minimal registry row kept in memory for authentication."""
+
+    device_uuid: UUID
+    api_key_hash: str
+    updated_at: datetime
+
+
+class DeviceRegistryReplica:
+    """
+    Process-local, bounded replica of app.device_registry.
+
+    - Loaded once at startup, then kept current by delta queries on updated_at.
+    - A periodic full reload drops devices deleted from the registry.
+    - Bounded by max_entries; least recently used devices are evicted first.
+    - Lookups bypass the replica when it is older than max_staleness.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        refresh_seconds: float,
+        full_reload_seconds: float,
+        max_staleness_seconds: float,
+    ) -> None:
+        self.max_entries = max_entries
+        self.refresh_seconds = refresh_seconds
+        self.full_reload_seconds = full_reload_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+
+        self._entries: OrderedDict[UUID, RegistryEntry] = OrderedDict()
+        self._watermark: Optional[datetime] = None
+        self._last_refresh_at: Optional[float] = None      # monotonic
+        self._last_full_reload_at: Optional[float] = None  # monotonic
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.hits = 0
+        self.misses = 0
+        self.stale_bypasses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.full_reloads = 0
+        self.refresh_errors = 0
+
+    # ------------------------------
+    # Lookup path
+    # ------------------------------
+    @property
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the last successful refresh; None if never loaded."""
+        if self._last_refresh_at is None:
+            return None
+        return time.monotonic() - self._last_refresh_at
+
+    def get(self, device_uuid: UUID) -> Optional[RegistryEntry]:
+        """
+        Return the cached entry for a device, or None on miss.
+
+        A None result means "ask the database", never "device does not exist".
+        """
+        staleness = self.staleness_seconds
+        if staleness is None or staleness > self.max_staleness_seconds:
+            self.stale_bypasses += 1
+            return None
+
+        entry = self._entries.get(device_uuid)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(device_uuid)
+        self.hits += 1
+        return entry
+
+    def put(self, entry: RegistryEntry) -> None:
+        """Insert or replace an entry, evicting the least recently used on overflow."""
+        self._entries[entry.device_uuid] = entry
+        self._entries.move_to_end(entry.device_uuid)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ------------------------------
+    # Refresh path
+    # ------------------------------
+    async def full_reload(self) -> int:
+        """Replace the replica with the most recently updated registry rows."""
+        stmt = (
+            select(
+                DeviceRegistry.device_uuid,
+                DeviceRegistry.api_key_hash,
+                DeviceRegistry.updated_at,
+            )
+            .order_by(DeviceRegistry.updated_at.desc())
+            .limit(self.max_entries)
+        )
+
+        async with async_session_maker() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        entries: OrderedDict[UUID, RegistryEntry] = OrderedDict()
+        # oldest first, so the most recently updated rows are evicted last
+        for row in reversed(rows):
+            entries[row.device_uuid] = RegistryEntry(
+                row.device_uuid, row.api_key_hash, row.updated_at
+            )
+
+        self._entries = entries
+        self._watermark = rows[0].updated_at if rows else self._watermark
+        now = time.monotonic()
+        self._last_refresh_at = now
+        self._last_full_reload_at = now
+        self.full_reloads += 1
+
+        logger.info("Device registry replica loaded, entries=%d", len(entries))
+        return len(entries)
+
+    async def refresh_delta(self) -> int:
+        """Apply registry rows updated since the last watermark."""
+        if self._watermark is None:
+            return await self.full_reload()
+
+        since = self._watermark - timedelta(seconds=DELTA_OVERLAP_SECONDS)
+        stmt = (
+            select(
+                DeviceRegistry.device_uuid,
+                DeviceRegistry.api_key_hash,
+                DeviceRegistry.updated_at,
+            )
+            .where(DeviceRegistry.updated_at >= since)
+            .order_by(DeviceRegistry.updated_at)
+        )
+
+        async with async_session_maker() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        for row in rows:
+            self.put(RegistryEntry(row.device_uuid, row.api_key_hash, row.updated_at))
+            if row.updated_at > self._watermark:
+                self._watermark = row.updated_at
+
+        self._last_refresh_at = time.monotonic()
+        self.refreshes += 1
+
+        logger.debug("Device registry replica delta applied, rows=%d", len(rows))
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                last_full = self._last_full_reload_at
+                if last_full is None or time.monotonic() - last_full >= self.full_reload_seconds:
+                    await self.full_reload()
+                else:
+                    await self.refresh_delta()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.refresh_errors += 1
+                logger.exception("Device registry replica refresh failed")
+
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def start(self) -> None:
+        """Start the background refresh loop (initial load happens on first tick)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    def stats(self) -> dict:
+        """Snapshot of replica metrics."""
+        lookups = self.hits + self.misses + self.stale_bypasses
+        staleness = self.staleness_seconds
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_bypasses": self.stale_bypasses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "full_reloads": self.full_reloads,
+            "refresh_errors": self.refresh_errors,
+            "staleness_seconds": round(staleness, 3) if staleness is not None else None,
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+        }
+
+
+registry_replica = DeviceRegistryReplica(
+    max_entries=settings.registry_replica_max_entries,
+    refresh_seconds=settings.registry_replica_refresh_seconds,
+    full_reload_seconds=settings.registry_replica_full_reload_seconds,
+    max_staleness_seconds=settings.registry_replica_max_staleness_seconds,
+)
@@ -96,6 +96,169 @@ class Settings(BaseSettings):
         description="The number of uvicorn workers.",
     )
 
+    # ------------------------------
+    # Device registry replica
+    # ------------------------------
+    registry_replica_enabled: bool = Field(
+        default=True,
+        alias="REGISTRY_REPLICA_ENABLED",
+        description="Serve device authentication from an in-process registry replica.",
+    )
+
+    registry_replica_max_entries: int = Field(
+        default=100_000,
+        ge=1,
+        alias="REGISTRY_REPLICA_MAX_ENTRIES",
+        description="Max devices kept in the replica; least recently used are evicted.",
+    )
+
+    registry_replica_refresh_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="REGISTRY_REPLICA_REFRESH_SECONDS",
+        description="Interval between delta refreshes keyed on updated_at.",
+    )
+
+    registry_replica_full_reload_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        alias="REGISTRY_REPLICA_FULL_RELOAD_SECONDS",
+        description="Interval between full reloads (drops deleted devices).",
+    )
+
+    registry_replica_max_staleness_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="REGISTRY_REPLICA_MAX_STALENESS_SECONDS",
+        description="Bypass the replica when the last successful refresh is older than this.",
+    )
+
+    # ------------------------------
+    # Device filter (negative lookups)
+    # ------------------------------
+    device_filter_enabled: bool = Field(
+        default=True,
+        alias="DEVICE_FILTER_ENABLED",
+        description="Reject unknown device UUIDs with an in-process Bloom filter.",
+    )
+
+    device_filter_false_positive_rate: float = Field(
+        default=0.001,
+        gt=0,
+        lt=1,
+        alias="DEVICE_FILTER_FALSE_POSITIVE_RATE",
+        description="Target false-positive rate of the device filter.",
+    )
+
+    device_filter_refresh_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="DEVICE_FILTER_REFRESH_SECONDS",
+        description="Interval between delta refreshes of newly registered devices.",
+    )
+
+    device_filter_rebuild_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        alias="DEVICE_FILTER_REBUILD_SECONDS",
+        description="Interval between full filter rebuilds from device_registry.",
+    )
+
+    device_filter_max_staleness_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="DEVICE_FILTER_MAX_STALENESS_SECONDS",
+        description="Fail open when the last successful filter refresh is older than this.",
+    )
+
+    # ------------------------------
+    # Write coalescer (micro-batched inserts)
+    # ------------------------------
+    write_coalescer_enabled: bool = Field(
+        default=False,
+        alias="WRITE_COALESCER_ENABLED",
+        description="Coalesce concurrent telemetry POSTs into multi-row inserts.",
+    )
+
+    write_coalescer_flush_ms: float = Field(
+        default=5.0,
+        gt=0,
+        alias="WRITE_COALESCER_FLUSH_MS",
+        description="Max time a queued row waits before its batch is flushed.",
+    )
+
+    write_coalescer_max_rows: int = Field(
+        default=500,
+        ge=1,
+        le=5000,                      # one INSERT stays under the 32767 bind-parameter limit
+        alias="WRITE_COALESCER_MAX_ROWS",
+        description="Flush as soon as this many rows are queued.",
+    )
+
+    write_coalescer_max_pending: int = Field(
+        default=10_000,
+        ge=1,
+        alias="WRITE_COALESCER_MAX_PENDING",
+        description="Max queued rows; further POSTs are rejected with 503.",
+    )
+
+    # ------------------------------
+    # Gateway bulk ingest
+    # ------------------------------
+    bulk_copy_chunk_rows: int = Field(
+        default=5000,
+        ge=1,
+        alias="BULK_COPY_CHUNK_ROWS",
+        description="Rows buffered per binary COPY chunk during gateway bulk ingest.",
+    )
+
+    bulk_max_line_bytes: int = Field(
+        default=4096,
+        ge=64,
+        alias="BULK_MAX_LINE_BYTES",
+        description="Max size of a single NDJSON line in a gateway bulk request.",
+    )
+
+    # ------------------------------
+    # Telemetry export (streaming reads)
+    # ------------------------------
+    export_chunk_rows: int = Field(
+        default=1000,
+        ge=1,
+        alias="EXPORT_CHUNK_ROWS",
+        description="Rows fetched per server-side cursor round trip when streaming.",
+    )
+
+    export_max_rows: int = Field(
+        default=1_000_000,
+        ge=5000,
+        alias="EXPORT_MAX_ROWS",
+        description="Max `limit` accepted for NDJSON/CSV streaming exports.",
+    )
+
+    # ------------------------------
+    # Per-device count reconciliation
+    # ------------------------------
+    device_count_reconcile_enabled: bool = Field(
+        default=True,
+        alias="DEVICE_COUNT_RECONCILE_ENABLED",
+        description="Periodically verify and repair telemetry_device_count.",
+    )
+
+    device_count_reconcile_interval_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        alias="DEVICE_COUNT_RECONCILE_INTERVAL_SECONDS",
+        description="Interval between reconciliation passes.",
+    )
+
+    device_count_reconcile_batch_devices: int = Field(
+        default=100,
+        ge=1,
+        alias="DEVICE_COUNT_RECONCILE_BATCH_DEVICES",
+        description="Devices verified per reconciliation transaction.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
@@ -1,5 +1,15 @@
-from .presgres import get_db
+from .presgres import get_db, async_session_maker
+from .bulk import copy_telemetry_records
+from .device_count import DeviceCountReconciler, device_count_reconciler
+from .coalescer import TelemetryWriteCoalescer, WriteQueueFull, telemetry_coalescer
 
 __all__ = [
     "get_db",
+    "async_session_maker",
+    "copy_telemetry_records",
+    "DeviceCountReconciler",
+    "device_count_reconciler",
+    "TelemetryWriteCoalescer",
+    "WriteQueueFull",
+    "telemetry_coalescer",
 ]
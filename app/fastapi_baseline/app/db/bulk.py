@@ -0,0 +1,52 @@
+# app/db/bulk.py
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import asyncpg
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import TelemetryEvent
+
+TELEMETRY_COPY_COLUMNS = (
+    "device_uuid",
+    "x_coord",
+    "y_coord",
+    "device_time",
+    "system_time_utc",
+)
+
+
+async def copy_telemetry_records(
+    session: AsyncSession,
+    records: Sequence[tuple],
+) -> int:
+    """
+    Load telemetry rows with asyncpg binary COPY on the session's connection.
+
+    Runs inside the session's current transaction; the caller commits.
+    Each record is a tuple ordered as TELEMETRY_COPY_COLUMNS.
+
+    The raw asyncpg call bypasses SQLAlchemy's exception translation, so
+    driver errors are re-raised as DBAPIError for callers that catch
+    SQLAlchemyError.
+    """
+    if not records:
+        return 0
+
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+
+    try:
+        await raw.driver_connection.copy_records_to_table(
+            TelemetryEvent.__tablename__,
+            schema_name=TelemetryEvent.__table__.schema,
+            columns=TELEMETRY_COPY_COLUMNS,
+            records=records,
+        )
+    except (asyncpg.PostgresError, asyncpg.InterfaceError) as exc:
+        raise DBAPIError(
+            f"COPY {TelemetryEvent.__table__.fullname}", None, exc,
+        ) from exc
+    return len(records)
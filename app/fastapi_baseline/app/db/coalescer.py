@@ -0,0 +1,224 @@
+# app/db/coalescer.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import Row, insert
+
+from ..config import get_settings
+from ..models import TelemetryEvent
+from .presgres import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class WriteQueueFull(Exception):
+    """Raised when the coalescer cannot accept more pending rows."""
+
+
+class TelemetryWriteCoalescer:
+    """
+    In-process micro-batching writer for telemetry_event.
+
+    - Concurrent requests enqueue one row each and await a future.
+    - A single background task drains the queue and flushes once max_rows are
+      pending or flush_ms has passed since the first queued row.
+    - Each flush is one multi-row INSERT ... RETURNING in one transaction, so
+      throughput scales with batch size instead of pool connections. Rows are
+      sent in device_uuid order, so triggers lock rows in the same order as
+      other writers (see V025).
+    - A failed flush fails every request in that batch; none of its rows are stored.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_ms: float,
+        max_rows: int,
+        max_pending: int,
+    ) -> None:
+        self.flush_seconds = flush_ms / 1000
+        self.max_rows = max_rows
+        self.max_pending = max_pending
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._collecting: list[tuple[dict[str, Any], asyncio.Future]] = []
+
+        # metrics
+        self.submitted = 0
+        self.rejected = 0
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.flush_errors = 0
+        self.max_batch = 0
+        self.last_flush_ms: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def submit(self, row: dict[str, Any]) -> Row:
+        """
+        Queue one telemetry row and wait until it is committed.
+
+        Returns the stored row (as from INSERT ... RETURNING).
+        Raises WriteQueueFull when max_pending rows are already waiting.
+        """
+        if self._queue is None:
+            raise RuntimeError("Write coalescer is not running.")
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((row, future))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise WriteQueueFull() from None
+
+        self.submitted += 1
+        return await future
+
+    # ------------------------------
+    # Flush path
+    # ------------------------------
+    async def _write(self, rows: Sequence[dict[str, Any]]) -> list[Row]:
+        """Insert rows in one transaction, returning them in parameter order."""
+        stmt = insert(TelemetryEvent).returning(
+            TelemetryEvent.device_uuid,
+            TelemetryEvent.x_coord,
+            TelemetryEvent.y_coord,
+            TelemetryEvent.device_time,
+            TelemetryEvent.system_time_utc,
+            sort_by_parameter_order=True,
+        ).execution_options(
+            # one INSERT statement per transaction, not one per 1000-row page
+            insertmanyvalues_page_size=max(len(rows), 1),
+        )
+
+        order = sorted(range(len(rows)), key=lambda i: rows[i]["device_uuid"])
+
+        async with async_session_maker() as session:
+            result = await session.execute(stmt, [rows[i] for i in order])
+            by_device = result.all()
+            await session.commit()
+
+        stored: list[Row] = [None] * len(rows)  # type: ignore[list-item]
+        for position, index in enumerate(order):
+            stored[index] = by_device[position]
+        return stored
+
+    async def _collect(self) -> list[tuple[dict[str, Any], asyncio.Future]]:
+        """Wait for the first row, then gather more until max_rows or the deadline."""
+        queue = self._queue
+        batch = self._collecting = [await queue.get()]
+        deadline = time.monotonic() + self.flush_seconds
+
+        while len(batch) < self.max_rows:
+            # take whatever is already queued without yielding
+            while len(batch) < self.max_rows and not queue.empty():
+                batch.append(queue.get_nowait())
+            if len(batch) >= self.max_rows:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        self._collecting = []
+        return batch
+
+    async def _flush(self, batch: list[tuple[dict[str, Any], asyncio.Future]]) -> None:
+        # requests whose client went away no longer need their row written
+        batch = [(row, future) for row, future in batch if not future.cancelled()]
+        if not batch:
+            return
+
+        started = time.perf_counter()
+        try:
+            stored = await self._write([row for row, _ in batch])
+        except asyncio.CancelledError:
+            # shutdown mid-flush: the outcome is unknown, so fail the requests
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Write coalescer stopped during flush."))
+            raise
+        except Exception as exc:
+            self.flush_errors += 1
+            logger.exception("Telemetry write coalescer flush failed, rows=%d", len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), row in zip(batch, stored):
+            if not future.done():
+                future.set_result(row)
+
+        self.flushes += 1
+        self.flushed_rows += len(batch)
+        self.max_batch = max(self.max_batch, len(batch))
+        self.last_flush_ms = round((time.perf_counter() - started) * 1000, 3)
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            await self._flush(batch)
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop, writing any rows still queued."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+        queue, self._queue = self._queue, None
+        pending, self._collecting = self._collecting, []
+        while not queue.empty():
+            pending.append(queue.get_nowait())
+        for start in range(0, len(pending), self.max_rows):
+            await self._flush(pending[start:start + self.max_rows])
+
+    def stats(self) -> dict:
+        """Snapshot of coalescer metrics."""
+        return {
+            "running": self.running,
+            "pending": self._queue.qsize() if self._queue else 0,
+            "flush_ms": self.flush_seconds * 1000,
+            "max_rows": self.max_rows,
+            "max_pending": self.max_pending,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "avg_batch": round(self.flushed_rows / self.flushes, 2) if self.flushes else None,
+            "max_batch": self.max_batch,
+            "flush_errors": self.flush_errors,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+telemetry_coalescer = TelemetryWriteCoalescer(
+    flush_ms=settings.write_coalescer_flush_ms,
+    max_rows=settings.write_coalescer_max_rows,
+    max_pending=settings.write_coalescer_max_pending,
+)
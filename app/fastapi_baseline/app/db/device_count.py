@@ -0,0 +1,184 @@
+# app/db/device_count.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ..config import get_settings
+from .presgres import engine
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Shared by every API worker so only one of them reconciles at a time.
+RECONCILE_LOCK_KEY = 0x74656C63  # "telc"
+
+TRY_LOCK_SQL = text("SELECT pg_try_advisory_lock(:key)")
+UNLOCK_SQL = text("SELECT pg_advisory_unlock(:key)")
+
+RECONCILE_BATCH_SQL = text(
+    "SELECT checked_device_uuid, stored_count, actual_count "
+    "FROM app.fn_reconcile_telemetry_device_count(:after, :limit)"
+)
+
+
+class DeviceCountReconciler:
+    """
+    Periodic verification of app.telemetry_device_count against telemetry_event.
+
+    - Each pass walks device_registry in device_uuid order, batch_devices per
+      transaction, via app.fn_reconcile_telemetry_device_count.
+    - That function locks each counter row before counting, so concurrent
+      inserts are neither lost nor double counted, and fixes any drift.
+    - A session-level advisory lock, held on one connection for the whole
+      pass, lets only one worker or replica reconcile at a time; a worker
+      that misses it skips its pass.
+    """
+
+    def __init__(self, *, interval_seconds: float, batch_devices: int) -> None:
+        self.interval_seconds = interval_seconds
+        self.batch_devices = batch_devices
+
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.passes = 0
+        self.skipped_passes = 0
+        self.checked = 0
+        self.repaired = 0
+        self.drift = 0
+        self.errors = 0
+        self.last_pass_ms: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    @asynccontextmanager
+    async def _exclusive(self) -> AsyncIterator[Optional[AsyncConnection]]:
+        """
+        Yield a connection holding the reconcile lock for the whole pass,
+        or None when another worker holds it.
+        """
+        lock = {"key": RECONCILE_LOCK_KEY}
+        async with engine.connect() as conn:
+            locked = (await conn.execute(TRY_LOCK_SQL, lock)).scalar_one()
+            await conn.commit()
+            if not locked:
+                yield None
+                return
+
+            try:
+                yield conn
+            finally:
+                try:
+                    await conn.rollback()
+                    await conn.execute(UNLOCK_SQL, lock)
+                    await conn.commit()
+                except Exception:
+                    # never return a connection to the pool still holding the lock
+                    logger.warning("Failed to release device count reconcile lock", exc_info=True)
+                    await conn.invalidate()
+
+    async def _reconcile_batch(self, conn: AsyncConnection, after: Optional[UUID]) -> list:
+        """Reconcile one batch in its own transaction."""
+        result = await conn.execute(
+            RECONCILE_BATCH_SQL, {"after": after, "limit": self.batch_devices},
+        )
+        rows = result.all()
+        await conn.commit()
+        return rows
+
+    async def reconcile(self) -> int:
+        """Run one full pass; returns the number of repaired counters."""
+        async with self._exclusive() as conn:
+            if conn is None:
+                self.skipped_passes += 1
+                return 0
+            return await self._reconcile_pass(conn)
+
+    async def _reconcile_pass(self, conn: AsyncConnection) -> int:
+        started = time.perf_counter()
+        after: Optional[UUID] = None
+        repaired = 0
+
+        while True:
+            rows = await self._reconcile_batch(conn, after)
+
+            for row in rows:
+                if row.stored_count != row.actual_count:
+                    repaired += 1
+                    self.drift += abs(row.actual_count - row.stored_count)
+                    logger.warning(
+                        "Repaired telemetry device count drift",
+                        extra={
+                            "device_uuid": str(row.checked_device_uuid),
+                            "stored_count": row.stored_count,
+                            "actual_count": row.actual_count,
+                        },
+                    )
+            self.checked += len(rows)
+
+            if len(rows) < self.batch_devices:
+                break
+            after = rows[-1].checked_device_uuid
+
+        self.passes += 1
+        self.repaired += repaired
+        self.last_pass_ms = round((time.perf_counter() - started) * 1000, 3)
+        return repaired
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.reconcile()
+            except Exception:
+                self.errors += 1
+                logger.exception("Telemetry device count reconciliation failed")
+
+    async def start(self) -> None:
+        """Start periodic reconciliation."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic reconciliation."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    def stats(self) -> dict:
+        """Snapshot of reconciliation metrics."""
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "batch_devices": self.batch_devices,
+            "passes": self.passes,
+            "skipped_passes": self.skipped_passes,
+            "checked": self.checked,
+            "repaired": self.repaired,
+            "drift": self.drift,
+            "errors": self.errors,
+            "last_pass_ms": self.last_pass_ms,
+        }
+
+
+device_count_reconciler = DeviceCountReconciler(
+    interval_seconds=settings.device_count_reconcile_interval_seconds,
+    batch_devices=settings.device_count_reconcile_batch_devices,
+)
@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from .cache import device_filter, registry_replica
 from .config import get_settings, setup_logging
-from .routers import home, health, device, telemetry
+from .db import device_count_reconciler, telemetry_coalescer
+from .routers import home, health, device, telemetry, gateway, metrics
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -16,6 +19,24 @@ logger = logging.getLogger(__name__)
 API_PREFIX = "/api"
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.registry_replica_enabled:
+        await registry_replica.start()
+    if settings.device_filter_enabled:
+        await device_filter.start()
+    if settings.write_coalescer_enabled:
+        await telemetry_coalescer.start()
+    if settings.device_count_reconcile_enabled:
+        await device_count_reconciler.start()
+    yield
+    await device_count_reconciler.stop()
+    await telemetry_coalescer.stop()
+    await device_filter.stop()
+    await registry_replica.stop()
+
+
 app = FastAPI(
     title="IoT Device Management API",
     version="0.1.0",
@@ -25,6 +46,7 @@ app = FastAPI(
         "and API keys, while administrative endpoints are intended for internal "
         "operations and tooling."
     ),
+    lifespan=lifespan,
 )
 
 @app.exception_handler(SQLAlchemyError)
@@ -44,6 +66,7 @@ app.add_middleware(
     allow_credentials=False,  # no cookies for devices
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["Content-Type", "x-api-key"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # ====================
@@ -60,3 +83,9 @@ app.include_router(device.router, prefix=API_PREFIX)
 
 # Telemetry ingestion and listing endpoints
 app.include_router(telemetry.router, prefix=API_PREFIX)
+
+# Gateway bulk ingestion endpoints
+app.include_router(gateway.router, prefix=API_PREFIX)
+
+# Runtime metrics of in-process subsystems
+app.include_router(metrics.router, prefix=API_PREFIX)
@@ -1,12 +1,20 @@
 # models/__init__.py
 from .base import Base
 from .device_registry import DeviceRegistry
+from .gateway_registry import GatewayRegistry
+from .telemetry_count_stripe import TelemetryCountStripe
+from .telemetry_device_count import TelemetryDeviceCount
 from .telemetry_event import TelemetryEvent
 from .telemetry_latest import TelemetryLatest
+from .telemetry_rollup_minute import TelemetryRollupMinute
 
 __all__ = [
     "Base",
     "DeviceRegistry",
+    "GatewayRegistry",
+    "TelemetryCountStripe",
+    "TelemetryDeviceCount",
     "TelemetryEvent",
     "TelemetryLatest",
+    "TelemetryRollupMinute",
 ]
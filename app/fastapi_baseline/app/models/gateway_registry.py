@@ -0,0 +1,69 @@
+# app/models/gateway_registry.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID as UUID_Type
+
+from sqlalchemy import BigInteger, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class GatewayRegistry(Base):
+    """
+    Registry of field gateways allowed to bulk ingest telemetry for devices.
+
+    Gateways are trusted fleet-wide: they are not bound to specific devices
+    and may write telemetry for any registered device.
+    """
+
+    __tablename__ = "gateway_registry"
+    __table_args__ = {"schema": "app"}
+
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        doc="Surrogate key generated by the database.",
+    )
+
+    alias: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        doc="debug alias for the gateway.",
+    )
+
+    gateway_uuid: Mapped[UUID_Type] = mapped_column(
+        PG_UUID(as_uuid=True),
+        nullable=False,
+        unique=True,
+        doc="Public-facing UUID used by the gateway and for authentication.",
+    )
+
+    api_key_hash: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        doc="Hashed API key. Plaintext API keys are never stored.",
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Timestamp when the gateway was registered (UTC).",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Timestamp when this registry row was last updated (UTC).",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<GatewayRegistry id={self.id} "
+            f"alias={self.alias!r} uuid={self.gateway_uuid}>"
+        )
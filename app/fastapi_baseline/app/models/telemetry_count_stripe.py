@@ -0,0 +1,45 @@
+# app/models/telemetry_count_stripe.py
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class TelemetryCountStripe(Base):
+    """
+    One stripe of the global telemetry_event count.
+
+    Statement-level triggers add each statement's row count to the stripe of
+    the writing connection; the total is the sum over all stripes.
+    """
+
+    __tablename__ = "telemetry_count_stripe"
+    __table_args__ = {"schema": "app"}
+
+    stripe: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        doc="Stripe number (pg_backend_pid() % stripes of the writer).",
+    )
+
+    event_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+        doc="Events counted in this stripe.",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Server-side UTC time when the stripe last changed.",
+    )
+
+    def __repr__(self) -> str:
+        return f"<TelemetryCountStripe stripe={self.stripe} event_count={self.event_count}>"
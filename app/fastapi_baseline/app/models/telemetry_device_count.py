@@ -0,0 +1,50 @@
+# app/models/telemetry_device_count.py
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID as UUID_Type
+
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class TelemetryDeviceCount(Base):
+    """
+    Per-device telemetry_event counter.
+
+    Maintained by statement-level triggers on telemetry_event (one aggregated
+    delta per device per statement) and repaired by the reconciliation job.
+    """
+
+    __tablename__ = "telemetry_device_count"
+    __table_args__ = {"schema": "app"}
+
+    device_uuid: Mapped[UUID_Type] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        doc="Device UUID (primary key).",
+    )
+
+    event_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        server_default="0",
+        doc="Number of telemetry_event rows stored for the device.",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Server-side UTC time when the counter last changed.",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TelemetryDeviceCount device_uuid={self.device_uuid} "
+            f"event_count={self.event_count}>"
+        )
@@ -0,0 +1,75 @@
+# app/models/telemetry_rollup_minute.py
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID as UUID_Type
+
+from sqlalchemy import BigInteger, DateTime, Float
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from .base import Base
+
+
+class TelemetryRollupMinute(Base):
+    """
+    Per-device, per-minute telemetry_event aggregates.
+
+    Maintained by statement-level triggers on telemetry_event. Sums and
+    counts are stored instead of averages so minutes can be merged into
+    coarser buckets exactly.
+    """
+
+    __tablename__ = "telemetry_rollup_minute"
+    __table_args__ = {"schema": "app"}
+
+    device_uuid: Mapped[UUID_Type] = mapped_column(
+        PG_UUID(as_uuid=True),
+        primary_key=True,
+        doc="Device UUID.",
+    )
+
+    bucket_start: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        doc="Start of the minute (system_time_utc truncated to the minute).",
+    )
+
+    event_count: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        doc="Number of events in the minute.",
+    )
+
+    sum_x: Mapped[float] = mapped_column(Float, nullable=False, doc="Sum of x_coord.")
+    sum_y: Mapped[float] = mapped_column(Float, nullable=False, doc="Sum of y_coord.")
+    min_x: Mapped[float] = mapped_column(Float, nullable=False, doc="Minimum x_coord.")
+    max_x: Mapped[float] = mapped_column(Float, nullable=False, doc="Maximum x_coord.")
+    min_y: Mapped[float] = mapped_column(Float, nullable=False, doc="Minimum y_coord.")
+    max_y: Mapped[float] = mapped_column(Float, nullable=False, doc="Maximum y_coord.")
+
+    first_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Earliest system_time_utc in the minute.",
+    )
+
+    last_time: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        doc="Latest system_time_utc in the minute.",
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        doc="Server-side UTC time when the row last changed.",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TelemetryRollupMinute device_uuid={self.device_uuid} "
+            f"bucket_start={self.bucket_start} event_count={self.event_count}>"
+        )
@@ -0,0 +1,324 @@
+# app/routers/gateway.py
+from __future__ import annotations
+
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Request,
+    Response,
+    status,
+)
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import device_filter, registry_replica
+from ..config import get_settings
+from ..db import copy_telemetry_records, get_db
+from ..models import DeviceRegistry, GatewayRegistry
+from ..schemas import TelemetryBulkError, TelemetryBulkRecord, TelemetryBulkResult
+from .telemetry import verify_api_key
+
+settings = get_settings()
+
+router = APIRouter(
+    prefix="/gateways",
+    tags=["gateways"],
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_REPORTED_ERRORS = 20            # Cap on rejected lines echoed back
+MAX_KNOWN_DEVICES = 100_000         # Cap on per-request device validation cache
+
+
+# ============================================================
+# Helper functions
+# ============================================================
+async def get_authenticated_gateway(
+    gateway_uuid: UUID = Path(
+        ...,
+        description="Gateway UUID registered in the gateway registry.",
+    ),
+    api_key: str = Header(
+        alias="X-API-Key",
+        description="Plain-text API key issued to this gateway.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> GatewayRegistry:
+    """
+    Authenticate a gateway using its UUID and API key.
+
+    Errors:
+    - 404 if the gateway is not found in the registry.
+    - 401 if the API key is invalid.
+    """
+    stmt = select(GatewayRegistry).where(
+        GatewayRegistry.gateway_uuid == gateway_uuid)
+
+    try:
+        result = await db.execute(stmt)
+        gateway = result.scalar_one_or_none()
+    except SQLAlchemyError as exc:
+        logger.exception(
+            "Database error while authenticating gateway",
+            extra={"gateway_uuid": str(gateway_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to authenticate gateway.",
+        ) from exc
+
+    if gateway is None:
+        logger.warning(
+            "Gateway not found in registry",
+            extra={"gateway_uuid": str(gateway_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Gateway not found.",
+        )
+
+    if not verify_api_key(api_key=api_key, stored_hash=gateway.api_key_hash):
+        logger.warning(
+            "Invalid API key for gateway",
+            extra={"gateway_uuid": str(gateway_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key.",
+        )
+
+    return gateway
+
+
+async def iter_ndjson_lines(
+    request: Request,
+    max_line_bytes: int,
+) -> AsyncIterator[tuple[int, bytes]]:
+    """
+    Yield (line_number, line) from a streamed NDJSON body.
+
+    Only one partial line is buffered at a time, so memory stays bounded by
+    max_line_bytes plus one network chunk regardless of body size.
+    """
+    def too_large(line_no: int) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"NDJSON line {line_no} exceeds {max_line_bytes} bytes.",
+        )
+
+    buffer = b""
+    line_no = 0
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+
+        for line in lines:
+            line_no += 1
+            if len(line) > max_line_bytes:
+                raise too_large(line_no)
+            yield line_no, line
+
+        if len(buffer) > max_line_bytes:
+            raise too_large(line_no + 1)
+
+    if buffer:
+        yield line_no + 1, buffer
+
+
+async def filter_registered_devices(
+    db: AsyncSession,
+    device_uuids: set[UUID],
+    known: set[UUID],
+) -> set[UUID]:
+    """
+    Return the subset of device_uuids that are registered.
+
+    Devices already in `known` or in the registry replica skip the database,
+    devices the filter rules out are dropped, and the rest are checked with a
+    single IN query and added to `known`.
+    """
+    device_uuids = {u for u in device_uuids if device_filter.might_contain(u)}
+    pending = {
+        u for u in device_uuids
+        if u not in known and registry_replica.get(u) is None
+    }
+
+    if pending:
+        result = await db.execute(
+            select(DeviceRegistry.device_uuid)
+            .where(DeviceRegistry.device_uuid.in_(pending))
+        )
+        found = set(result.scalars().all())
+    else:
+        found = set()
+
+    registered = (device_uuids - pending) | found
+    if len(known) < MAX_KNOWN_DEVICES:
+        known.update(registered)
+    return registered
+
+
+# ============================================================
+# POST /gateways/{gateway_uuid}/telemetry
+# ============================================================
+@router.post(
+    "/{gateway_uuid}/telemetry",
+    summary="Bulk ingest telemetry from a gateway (NDJSON)",
+    description=(
+        "Stream telemetry for many devices in one request. The body is NDJSON "
+        "(`application/x-ndjson`), one object per line with `device_uuid`, `x_coord`, "
+        "`y_coord` and optional `device_time`. The gateway authenticates using the "
+        "`X-API-Key` header.\n\n"
+        "Lines are validated as they arrive and written to `telemetry_event` with binary "
+        "COPY in fixed-size chunks, each committed on its own. Invalid lines and lines "
+        "for unregistered devices are skipped and reported. If the request fails midway, "
+        "the error names the last committed line so the gateway can resend the rest.\n\n"
+        "The response is `201` when at least one line was stored, even if others were "
+        "rejected, and `422` with the same body when no line was stored.\n\n"
+        "Gateways are trusted fleet-wide: a gateway may write telemetry for any "
+        "registered device."
+    ),
+    response_model=TelemetryBulkResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def bulk_ingest_telemetry(
+    request: Request,
+    response: Response,
+    gateway: GatewayRegistry = Depends(get_authenticated_gateway),
+    db: AsyncSession = Depends(get_db),
+) -> TelemetryBulkResult:
+    """
+    Gateway-facing bulk ingestion endpoint.
+
+    Memory use is bounded by `BULK_COPY_CHUNK_ROWS` and `BULK_MAX_LINE_BYTES`,
+    not by the request body size.
+
+    Each chunk is committed as soon as it is copied, so the row locks taken
+    by the telemetry_event statement triggers (device counters, count
+    stripe, minute rollups) are held for one chunk, not the whole upload.
+    """
+    now_utc = datetime.now(timezone.utc)
+    chunk_rows = settings.bulk_copy_chunk_rows
+
+    accepted = 0
+    rejected = 0
+    chunks = 0
+    last_line = 0           # last line read from the body
+    committed_line = 0      # every line up to here is committed or rejected
+    errors: list[TelemetryBulkError] = []
+    known: set[UUID] = set()
+    pending: list[tuple[int, TelemetryBulkRecord]] = []
+
+    def reject(line_no: int, detail: str) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(TelemetryBulkError(line=line_no, detail=detail))
+
+    async def flush() -> None:
+        nonlocal accepted, chunks, committed_line
+        registered = await filter_registered_devices(
+            db, {record.device_uuid for _, record in pending}, known
+        )
+
+        records: list[tuple] = []
+        for line_no, record in pending:
+            if record.device_uuid not in registered:
+                reject(line_no, "Device not found.")
+                continue
+
+            device_time = record.device_time or now_utc
+            if device_time.tzinfo is None:
+                device_time = device_time.replace(tzinfo=timezone.utc)
+
+            records.append((
+                record.device_uuid,
+                record.x_coord,
+                record.y_coord,
+                device_time,
+                now_utc,
+            ))
+
+        # device order, so row triggers lock like concurrent writers (see V025)
+        records.sort(key=lambda r: r[0])
+        copied = await copy_telemetry_records(db, records)
+        await db.commit()
+
+        accepted += copied
+        chunks += 1 if records else 0
+        committed_line = last_line
+        pending.clear()
+
+    def progress() -> str:
+        return (
+            f"{accepted} rows through line {committed_line} were committed; "
+            f"resend from line {committed_line + 1}."
+        )
+
+    try:
+        async for line_no, line in iter_ndjson_lines(request, settings.bulk_max_line_bytes):
+            last_line = line_no
+            if not line.strip():
+                continue
+
+            try:
+                record = TelemetryBulkRecord.model_validate_json(line)
+            except ValidationError as exc:
+                reject(line_no, exc.errors(include_url=False)[0]["msg"])
+                continue
+
+            pending.append((line_no, record))
+            if len(pending) >= chunk_rows:
+                await flush()
+
+        if pending:
+            await flush()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger.exception(
+            "Database error during gateway bulk ingest",
+            extra={"gateway_uuid": str(gateway.gateway_uuid), "accepted": accepted},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to store telemetry; {progress()}",
+        ) from exc
+    except HTTPException as exc:
+        await db.rollback()
+        if accepted:
+            exc.detail = f"{exc.detail} {progress()}"
+        raise
+
+    logger.info(
+        "Gateway bulk ingest completed",
+        extra={
+            "gateway_uuid": str(gateway.gateway_uuid),
+            "accepted": accepted,
+            "rejected": rejected,
+            "chunks": chunks,
+        },
+    )
+
+    if accepted == 0:
+        # Nothing stored: a 2xx would hide a gateway sending only bad lines.
+        response.status_code = status.HTTP_422_UNPROCESSABLE_CONTENT
+
+    return TelemetryBulkResult(
+        gateway_uuid=gateway.gateway_uuid,
+        accepted=accepted,
+        rejected=rejected,
+        chunks=chunks,
+        errors=errors,
+    )
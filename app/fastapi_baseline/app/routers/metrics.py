@@ -0,0 +1,65 @@
+# app/routers/metrics.py
+import logging
+from fastapi import APIRouter
+
+from ..cache import device_filter, registry_replica
+from ..config import get_settings
+from ..db import device_count_reconciler, telemetry_coalescer
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+@router.get("/registry", summary="Device registry replica metrics")
+async def registry_metrics() -> dict:
+    """
+    Hit/miss/staleness counters of the in-process device registry replica.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.registry_replica_enabled,
+        **registry_replica.stats(),
+    }
+
+
+@router.get("/device-filter", summary="Device filter metrics")
+async def device_filter_metrics() -> dict:
+    """
+    Size and rejection counters of the unknown-device Bloom filter.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.device_filter_enabled,
+        **device_filter.stats(),
+    }
+
+
+@router.get("/write-coalescer", summary="Telemetry write coalescer metrics")
+async def write_coalescer_metrics() -> dict:
+    """
+    Queue depth, batch size and flush latency of the telemetry write coalescer.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.write_coalescer_enabled,
+        **telemetry_coalescer.stats(),
+    }
+
+
+@router.get("/device-count", summary="Per-device count reconciliation metrics")
+async def device_count_metrics() -> dict:
+    """
+    Pass, repair and drift counters of the telemetry_device_count reconciler.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.device_count_reconcile_enabled,
+        **device_count_reconciler.stats(),
+    }
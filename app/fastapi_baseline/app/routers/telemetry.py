@@ -1,10 +1,16 @@
 # app/routers/telemetry.py
 from __future__ import annotations
 
+import base64
+import csv
 import hashlib
 import hmac
+import io
+import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
+from typing import Literal
 from uuid import UUID
 
 from fastapi import (
@@ -13,23 +19,40 @@ from fastapi import (
     Header,
     Path,
     Query,
+    Response,
     APIRouter,
     HTTPException,
     status,
 )
-from sqlalchemy import select, func
+from fastapi.responses import StreamingResponse
+from sqlalchemy import BigInteger, Select, cast, insert, literal_column, or_, select, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_db
-from ..models import DeviceRegistry, TelemetryEvent, TelemetryLatest
+from ..cache import RegistryEntry, device_filter, registry_replica
+from ..config import get_settings
+from ..db import WriteQueueFull, async_session_maker, get_db, telemetry_coalescer
+from ..models import (
+    DeviceRegistry,
+    TelemetryCountStripe,
+    TelemetryDeviceCount,
+    TelemetryEvent,
+    TelemetryLatest,
+    TelemetryRollupMinute,
+)
 from ..schemas import (
     TelemetryCreate,
     TelemetryItem,
     TelemetryCountItem,
+    TelemetryTotalCountItem,
     TelemetryLatestItem,
+    TelemetryBatchItemResult,
+    TelemetryBatchResult,
+    TelemetryAggregateItem,
 )
 
+settings = get_settings()
+
 router = APIRouter(
     prefix="/telemetry",
     tags=["telemetry"],
@@ -40,8 +63,47 @@ logger = logging.getLogger(__name__)
 DEFAULT_LATEST_SECONDS = 1800       # 30 minutes
 MAX_LATEST_SECONDS = 24 * 3600      # 24 hours
 
+MAX_BATCH_ITEMS = 1000              # Max points per batch ingestion request
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"  # Response header carrying the next page cursor
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+MAX_LIST_LIMIT = 5000               # Max rows per JSON page
+EXPORT_MEDIA_TYPES = ("application/x-ndjson", "text/csv")
+AGGREGATE_RESOLUTIONS = {
+    "1m": timedelta(minutes=1),
+    "5m": timedelta(minutes=5),
+    "1h": timedelta(hours=1),
+}
+
+EXPORT_CSV_FIELDS = ("device_uuid", "x_coord", "y_coord", "device_time", "system_time_utc")
+
 TELEMETRY_CACHE_TTL_SECONDS = 60    # Short TTL to limit staleness
 
+# Core column lists: hot paths select/return plain rows, not ORM instances
+DEVICE_AUTH_COLUMNS = (
+    DeviceRegistry.device_uuid,
+    DeviceRegistry.api_key_hash,
+    DeviceRegistry.updated_at,
+)
+
+TELEMETRY_ITEM_COLUMNS = (
+    TelemetryEvent.device_uuid,
+    TelemetryEvent.x_coord,
+    TelemetryEvent.y_coord,
+    TelemetryEvent.device_time,
+    TelemetryEvent.system_time_utc,
+)
+
+TELEMETRY_LATEST_COLUMNS = (
+    TelemetryLatest.device_uuid,
+    TelemetryLatest.alias,
+    TelemetryLatest.x_coord,
+    TelemetryLatest.y_coord,
+    TelemetryLatest.device_time,
+    TelemetryLatest.system_time_utc,
+)
+
 
 # ============================================================
 # Helper functions
@@ -107,6 +169,157 @@ def normalize_time_window(
     return start_time, end_time
 
 
+def encode_cursor(system_time_utc: datetime, event_id: int) -> str:
+    """
+    Encode the position of a telemetry row as an opaque page cursor.
+
+    The cursor is the row's (system_time_utc, id) keyset, so the next page
+    seeks directly into the (device_uuid, system_time_utc) index.
+    """
+    micros = (system_time_utc - EPOCH_UTC) // timedelta(microseconds=1)
+    raw = f"{micros}:{event_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a page cursor produced by encode_cursor.
+
+    Raises HTTP 400 if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        micros, event_id = base64.urlsafe_b64decode(padded).decode("ascii").split(":")
+        return EPOCH_UTC + timedelta(microseconds=int(micros)), int(event_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        ) from exc
+
+
+def negotiate_export_format(accept: str | None) -> str | None:
+    """
+    Return the streaming media type requested by the Accept header, if any.
+
+    Only explicit `application/x-ndjson` or `text/csv` select streaming;
+    anything else (including `*/*`) keeps the JSON response.
+    """
+    if not accept:
+        return None
+    for part in accept.split(","):
+        media_type = part.split(";", 1)[0].strip().lower()
+        if media_type in EXPORT_MEDIA_TYPES:
+            return media_type
+    return None
+
+
+def format_export_chunk(rows, media_type: str) -> str:
+    """Render a chunk of telemetry rows as NDJSON lines or CSV records."""
+    if media_type == "text/csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows(
+            (
+                row.device_uuid,
+                row.x_coord,
+                row.y_coord,
+                row.device_time.isoformat(),
+                row.system_time_utc.isoformat(),
+            )
+            for row in rows
+        )
+        return buffer.getvalue()
+
+    return "".join(
+        json.dumps({
+            "device_uuid": str(row.device_uuid),
+            "x_coord": row.x_coord,
+            "y_coord": row.y_coord,
+            "device_time": row.device_time.isoformat(),
+            "system_time_utc": row.system_time_utc.isoformat(),
+        }) + "\n"
+        for row in rows
+    )
+
+
+async def stream_telemetry_export(
+    stmt: Select,
+    media_type: str,
+    chunk_rows: int,
+) -> AsyncIterator[str]:
+    """
+    Stream query results through a server-side cursor, one chunk at a time.
+
+    Uses its own session so the connection is held only while streaming,
+    and at most chunk_rows rows are in memory at once.
+    """
+    if media_type == "text/csv":
+        yield ",".join(EXPORT_CSV_FIELDS) + "\n"
+
+    async with async_session_maker() as session:
+        try:
+            result = await session.stream(stmt.execution_options(yield_per=chunk_rows))
+            async for rows in result.partitions():
+                yield format_export_chunk(rows, media_type)
+        except SQLAlchemyError:
+            # headers are already sent; re-raise so the server aborts the
+            # transfer and the client sees an incomplete response, not a
+            # truncated export that looks complete
+            logger.exception("Database error while streaming telemetry export")
+            raise
+
+
+def build_aggregate_query(
+    device_uuid: UUID,
+    start_time: datetime,
+    end_time: datetime,
+    resolution: str,
+    limit: int,
+) -> Select:
+    """
+    Aggregate telemetry_rollup_minute rows into buckets of the given resolution.
+
+    The window start is aligned down to its bucket so the first bucket is
+    complete. Buckets are epoch-aligned with date_bin; the interval is
+    inlined (from AGGREGATE_RESOLUTIONS only) so the GROUP BY expression
+    matches the select list.
+    """
+    width = AGGREGATE_RESOLUTIONS[resolution]
+    aligned_start = EPOCH_UTC + (start_time - EPOCH_UTC) // width * width
+
+    rollup = TelemetryRollupMinute
+    bucket = func.date_bin(
+        literal_column(f"INTERVAL '{int(width.total_seconds())} seconds'"),
+        rollup.bucket_start,
+        literal_column("TIMESTAMPTZ '1970-01-01 00:00:00+00'"),
+    )
+    event_count = func.sum(rollup.event_count)
+
+    return (
+        select(
+            bucket.label("bucket_start"),
+            cast(event_count, BigInteger).label("count"),
+            func.min(rollup.min_x).label("min_x"),
+            func.max(rollup.max_x).label("max_x"),
+            (func.sum(rollup.sum_x) / event_count).label("avg_x"),
+            func.min(rollup.min_y).label("min_y"),
+            func.max(rollup.max_y).label("max_y"),
+            (func.sum(rollup.sum_y) / event_count).label("avg_y"),
+            func.min(rollup.first_time).label("first_time"),
+            func.max(rollup.last_time).label("last_time"),
+        )
+        .where(
+            rollup.device_uuid == device_uuid,
+            rollup.bucket_start >= aligned_start,
+            rollup.bucket_start <= end_time,
+        )
+        .group_by(bucket)
+        .order_by(bucket.desc())
+        .limit(limit)
+    )
+
+
 async def get_authenticated_device(
     device_uuid: UUID = Path(
         ...,
@@ -122,9 +335,11 @@ async def get_authenticated_device(
     Authenticate a device using its UUID and API key.
 
     Steps:
-    1. Look up the device by device_uuid in DeviceRegistry.
-    2. Verify the provided API key against the stored hash.
-    3. Return the DeviceRegistry ORM instance on success.
+    0. Reject UUIDs the device filter proves are not registered.
+    1. Look up the device in the in-process registry replica.
+    2. On replica miss, look up the device by device_uuid in DeviceRegistry.
+    3. Verify the provided API key against the stored hash.
+    4. Return the DeviceRegistry instance on success.
 
     Errors:
     - 404 if the device is not found in the registry.
@@ -135,25 +350,10 @@ async def get_authenticated_device(
         extra={"device_uuid": str(device_uuid)},
     )
 
-    stmt = select(DeviceRegistry).where(
-        DeviceRegistry.device_uuid == device_uuid)
-
-    try:
-        result = await db.execute(stmt)
-        device = result.scalar_one_or_none()
-    except SQLAlchemyError as exc:
-        logger.exception(
-            "Database error while authenticating device",
-            extra={"device_uuid": str(device_uuid)},
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to authenticate device.",
-        ) from exc
-
-    if device is None:
-        logger.warning(
-            "Device not found in registry",
+    # reject unregistered devices without any backend I/O
+    if settings.device_filter_enabled and not device_filter.might_contain(device_uuid):
+        logger.debug(
+            "Device rejected by device filter",
             extra={"device_uuid": str(device_uuid)},
         )
         raise HTTPException(
@@ -161,6 +361,56 @@ async def get_authenticated_device(
             detail="Device not found.",
         )
 
+    device: DeviceRegistry | None = None
+
+    # try in-process replica
+    if settings.registry_replica_enabled:
+        entry = registry_replica.get(device_uuid)
+        if entry is not None:
+            device = DeviceRegistry(
+                device_uuid=entry.device_uuid,
+                api_key_hash=entry.api_key_hash,
+            )
+
+    # query db
+    if device is None:
+        stmt = select(*DEVICE_AUTH_COLUMNS).where(
+            DeviceRegistry.device_uuid == device_uuid)
+
+        try:
+            result = await db.execute(stmt)
+            row = result.one_or_none()
+        except SQLAlchemyError as exc:
+            logger.exception(
+                "Database error while authenticating device",
+                extra={"device_uuid": str(device_uuid)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to authenticate device.",
+            ) from exc
+
+        if row is None:
+            logger.warning(
+                "Device not found in registry",
+                extra={"device_uuid": str(device_uuid)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Device not found.",
+            )
+
+        # transient instance: not tracked by the session's identity map
+        device = DeviceRegistry(
+            device_uuid=row.device_uuid,
+            api_key_hash=row.api_key_hash,
+        )
+
+        if settings.registry_replica_enabled:
+            registry_replica.put(
+                RegistryEntry(row.device_uuid, row.api_key_hash, row.updated_at)
+            )
+
     if not verify_api_key(api_key=api_key, stored_hash=device.api_key_hash):
         logger.warning(
             "Invalid API key for device",
@@ -186,22 +436,42 @@ async def get_authenticated_device(
     "/count",
     summary="Get telemetry registry statistics",
     description=(
-        "Return high-level statistics about telemetry storage. "
+        "Return the total number of stored telemetry events and the time it was taken.\n\n"
+        "By default the total is read from trigger-maintained counters in constant time. "
+        "`exact=true` runs a full COUNT(*) instead; it is slow on large tables and meant "
+        "for audits."
     ),
+    response_model=TelemetryTotalCountItem,
 )
 async def get_telemetry_count(
+    exact: bool = Query(
+        default=False,
+        description="Run a full COUNT(*) scan instead of reading the maintained counter.",
+    ),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, int]:
+) -> TelemetryTotalCountItem:
     """
-    Return summary statistics for telemetry storage.
+    Return the total telemetry event count.
+
+    The maintained total is the sum of the 16 telemetry_count_stripe rows,
+    so its cost does not grow with telemetry_event.
     """
-    logger.debug("Fetching telemetry count (total telemetry event count)")
+    logger.debug(
+        "Fetching telemetry count (total telemetry event count)",
+        extra={"exact": exact},
+    )
 
-    stmt = select(func.count()).select_from(TelemetryEvent)
+    if exact:
+        stmt = select(func.count(), func.now()).select_from(TelemetryEvent)
+    else:
+        stmt = select(
+            func.coalesce(func.sum(TelemetryCountStripe.event_count), 0),
+            func.now(),
+        )
 
     try:
         result = await db.execute(stmt)
-        telemetry_count = result.scalar_one()
+        telemetry_count, as_of = result.one()
     except SQLAlchemyError as exc:
         logger.exception("Database error while fetching telemetry count")
         raise HTTPException(
@@ -211,10 +481,14 @@ async def get_telemetry_count(
 
     logger.debug(
         "Telemetry count fetched successfully",
-        extra={"telemetry_count": telemetry_count},
+        extra={"telemetry_count": telemetry_count, "exact": exact},
     )
 
-    return {"telemetry_count": telemetry_count}
+    return TelemetryTotalCountItem(
+        telemetry_count=telemetry_count,
+        as_of=as_of,
+        exact=exact,
+    )
 
 
 # ============================================================
@@ -228,11 +502,16 @@ async def get_telemetry_count(
         "The device must authenticate using the `X-API-Key` header. The time window can "
         "be specified using `start_time` and `end_time`, or by using `latest_seconds` "
         "to request data from a recent lookback period.\n\n"
-        "Results are ordered by `system_time_utc` in descending order (most recent first)."
+        "Results are ordered by `system_time_utc` in descending order (most recent first).\n\n"
+        "When a page is full, the response carries an opaque `X-Next-Cursor` header. "
+        "Pass it back as `cursor` with the same window to fetch the next (older) page.\n\n"
+        "With `Accept: application/x-ndjson` or `Accept: text/csv` the rows are streamed "
+        "from a server-side cursor instead, and `limit` may go up to `EXPORT_MAX_ROWS`."
     ),
     response_model=list[TelemetryItem],
 )
 async def list_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     start_time: datetime | None = Query(
         default=None,
@@ -261,8 +540,19 @@ async def list_telemetry_for_device(
     limit: int = Query(
         default=100,
         ge=1,
-        le=5000,
-        description="Maximum number of telemetry records to return.",
+        le=settings.export_max_rows,
+        description=(
+            f"Maximum number of telemetry records to return (at most {MAX_LIST_LIMIT} "
+            "for JSON; higher values require a streaming `Accept` type)."
+        ),
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from a previous response's `X-Next-Cursor` header.",
+    ),
+    accept: str | None = Header(
+        default=None,
+        description="`application/x-ndjson` or `text/csv` to stream the results.",
     ),
     db: AsyncSession = Depends(get_db),
 ) -> list[TelemetryItem]:
@@ -278,6 +568,17 @@ async def list_telemetry_for_device(
         end_time=end_time,
         latest_seconds=latest_seconds,
     )
+    after = decode_cursor(cursor) if cursor else None
+    export_format = negotiate_export_format(accept)
+
+    if export_format is None and limit > MAX_LIST_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"limit above {MAX_LIST_LIMIT} requires "
+                "Accept: application/x-ndjson or text/csv."
+            ),
+        )
 
     logger.debug(
         "Listing telemetry for device",
@@ -298,19 +599,39 @@ async def list_telemetry_for_device(
 
     # SQL statement
     stmt = (
-        select(TelemetryEvent)
+        select(*TELEMETRY_ITEM_COLUMNS, TelemetryEvent.id)
         .where(
             TelemetryEvent.device_uuid == device.device_uuid,
             TelemetryEvent.system_time_utc >= start_time,
             TelemetryEvent.system_time_utc <= end_time,
         )
-        .order_by(TelemetryEvent.system_time_utc.desc())
+        .order_by(TelemetryEvent.system_time_utc.desc(), TelemetryEvent.id.desc())
         .limit(limit)
     )
 
+    # keyset seek: continue strictly after the previous page's last row
+    if after is not None:
+        after_time, after_id = after
+        stmt = stmt.where(
+            TelemetryEvent.system_time_utc <= after_time,
+            or_(
+                TelemetryEvent.system_time_utc < after_time,
+                TelemetryEvent.id < after_id,
+            ),
+        )
+
+    # streaming export: hand the query to a server-side cursor
+    if export_format is not None:
+        # release any connection held by authentication before streaming
+        await db.close()
+        return StreamingResponse(
+            stream_telemetry_export(stmt, export_format, settings.export_chunk_rows),
+            media_type=export_format,
+        )
+
     try:
         result = await db.execute(stmt)
-        rows = result.scalars().all()
+        rows = result.all()
     except SQLAlchemyError as exc:
         logger.exception(
             "Database error while listing telemetry",
@@ -321,11 +642,19 @@ async def list_telemetry_for_device(
             detail="Failed to retrieve telemetry.",
         ) from exc
 
-    # Convert ORM rows -> DTOs
+    # Convert rows -> DTOs
     items: list[TelemetryItem] = [
         TelemetryItem.model_validate(row) for row in rows
     ]
 
+    # a full page may have more rows behind it
+    next_cursor = (
+        encode_cursor(rows[-1].system_time_utc, rows[-1].id)
+        if len(rows) == limit else None
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
     logger.debug(
         "Telemetry listing succeeded",
         extra={
@@ -366,24 +695,64 @@ async def create_telemetry_for_device(
     The device is authenticated via `get_authenticated_device`. The server
     sets `system_time_utc` to the current UTC time. If `device_time` is not
     provided in the payload, it is set to the same value as `system_time_utc`.
+
+    When the write coalescer is running, the row is queued and written with
+    other concurrent requests in one multi-row INSERT; the response is sent
+    once that batch commits.
     """
     now_utc = datetime.now(timezone.utc)
     device_time = payload.device_time or now_utc
 
-    telemetry = TelemetryEvent(
-        device_uuid=device.device_uuid,
-        x_coord=payload.x_coord,
-        y_coord=payload.y_coord,
-        device_time=device_time,
-        system_time_utc=now_utc,
-    )
+    # coalesced path: share one multi-row INSERT with concurrent requests
+    if telemetry_coalescer.running:
+        # release any connection held by authentication while the batch fills
+        await db.close()
+        try:
+            stored = await telemetry_coalescer.submit({
+                "device_uuid": device.device_uuid,
+                "x_coord": payload.x_coord,
+                "y_coord": payload.y_coord,
+                "device_time": device_time,
+                "system_time_utc": now_utc,
+            })
+        except WriteQueueFull as exc:
+            logger.warning(
+                "Telemetry write queue full",
+                extra={"device_uuid": str(device.device_uuid)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Telemetry write queue is full. Retry later.",
+            ) from exc
+        except Exception as exc:
+            logger.error(
+                "Coalesced telemetry write failed",
+                extra={"device_uuid": str(device.device_uuid)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to store telemetry.",
+            ) from exc
+
+        return TelemetryItem.model_validate(stored)
 
-    db.add(telemetry)
+    stmt = (
+        insert(TelemetryEvent)
+        .values(
+            device_uuid=device.device_uuid,
+            x_coord=payload.x_coord,
+            y_coord=payload.y_coord,
+            device_time=device_time,
+            system_time_utc=now_utc,
+        )
+        .returning(*TELEMETRY_ITEM_COLUMNS)
+    )
 
     # commit db
     try:
+        result = await db.execute(stmt)
+        stored = result.one()
         await db.commit()
-        await db.refresh(telemetry)
     except SQLAlchemyError as exc:
         await db.rollback()
         logger.exception(
@@ -399,16 +768,102 @@ async def create_telemetry_for_device(
         "Telemetry stored successfully",
         extra={
             "device_uuid": str(device.device_uuid),
-            "system_time_utc": telemetry.system_time_utc.isoformat(),
+            "system_time_utc": stored.system_time_utc.isoformat(),
         },
     )
 
-    # Convert ORM
-    item = TelemetryItem.model_validate(telemetry)
+    # Row -> DTO
+    item = TelemetryItem.model_validate(stored)
 
     return item
 
 
+# ============================================================
+# POST /telemetry/{device_uuid}/batch
+# ============================================================
+@router.post(
+    "/{device_uuid}/batch",
+    summary="Ingest a batch of telemetry for a device",
+    description=(
+        "Ingest an array of telemetry events for a specific device identified by its UUID. "
+        "The device authenticates once using the `X-API-Key` header and all points are "
+        "written in a single multi-row INSERT within one transaction. Intended for devices "
+        "replaying points buffered while offline.\n\n"
+        f"At most {MAX_BATCH_ITEMS} points are accepted per request. Every point receives "
+        "the same `system_time_utc`; points without `device_time` default to it."
+    ),
+    response_model=TelemetryBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_telemetry_batch_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    payload: list[TelemetryCreate] = Body(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Array of telemetry payloads, each with coordinates and optional device timestamp.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> TelemetryBatchResult:
+    """
+    Ingest a batch of telemetry events for the authenticated device.
+
+    All points are stored atomically: either every point is created or the
+    request fails with no rows written.
+    """
+    now_utc = datetime.now(timezone.utc)
+
+    rows = [
+        {
+            "device_uuid": device.device_uuid,
+            "x_coord": point.x_coord,
+            "y_coord": point.y_coord,
+            "device_time": point.device_time or now_utc,
+            "system_time_utc": now_utc,
+        }
+        for point in payload
+    ]
+
+    stmt = insert(TelemetryEvent).returning(
+        *TELEMETRY_ITEM_COLUMNS,
+        sort_by_parameter_order=True,
+    )
+
+    # commit db
+    try:
+        result = await db.execute(stmt, rows)
+        stored = result.all()
+        await db.commit()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger.exception(
+            "Database error while storing telemetry batch",
+            extra={"device_uuid": str(device.device_uuid), "batch_size": len(rows)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store telemetry batch.",
+        ) from exc
+
+    items = [TelemetryItem.model_validate(row) for row in stored]
+
+    logger.debug(
+        "Telemetry batch stored successfully",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "batch_size": len(items),
+        },
+    )
+
+    return TelemetryBatchResult(
+        device_uuid=device.device_uuid,
+        accepted=len(items),
+        results=[
+            TelemetryBatchItemResult(index=index, status="created", item=item)
+            for index, item in enumerate(items)
+        ],
+    )
+
+
 # ============================================================
 # GET /telemetry/latest/{device_uuid}
 # ============================================================
@@ -445,13 +900,13 @@ async def get_latest_telemetry_for_device(
     )
 
     # SQL statement
-    stmt = select(TelemetryLatest).where(
+    stmt = select(*TELEMETRY_LATEST_COLUMNS).where(
         TelemetryLatest.device_uuid == device.device_uuid
     )
 
     try:
         result = await db.execute(stmt)
-        latest = result.scalar_one_or_none()
+        latest = result.one_or_none()
     except SQLAlchemyError as exc:
         logger.exception(
             "Database error while fetching latest telemetry",
@@ -472,7 +927,7 @@ async def get_latest_telemetry_for_device(
             detail="No telemetry available for this device.",
         )
 
-    # ORM -> DTO
+    # Row -> DTO
     item = TelemetryLatestItem.model_validate(latest)
 
     logger.debug(
@@ -507,23 +962,22 @@ async def get_telemetry_count_for_device(
     Return the total telemetry event count for the authenticated device.
 
     This is a debug/operational endpoint and is not meant for production-facing
-    client use (e.g. mobile apps). It simply performs a COUNT(*) on telemetry_event
-    filtered by device_uuid.
+    client use (e.g. mobile apps). It reads the trigger-maintained counter in
+    telemetry_device_count (one primary-key lookup) instead of a COUNT(*).
     """
     logger.debug(
         "Fetching telemetry event count for device",
         extra={"device_uuid": str(device.device_uuid)},
     )
 
-    stmt = (
-        select(func.count())
-        .select_from(TelemetryEvent)
-        .where(TelemetryEvent.device_uuid == device.device_uuid)
+    stmt = select(TelemetryDeviceCount.event_count).where(
+        TelemetryDeviceCount.device_uuid == device.device_uuid
     )
 
     try:
         result = await db.execute(stmt)
-        total_events = result.scalar_one()
+        # no counter row yet: the device has never sent telemetry
+        total_events = result.scalar_one_or_none() or 0
     except SQLAlchemyError as exc:
         logger.exception(
             "Database error while counting telemetry events",
@@ -546,3 +1000,98 @@ async def get_telemetry_count_for_device(
         device_uuid=device.device_uuid,
         total_events=total_events,
     )
+
+
+# ============================================================
+# GET /telemetry/{device_uuid}/aggregates
+# ============================================================
+@router.get(
+    "/{device_uuid}/aggregates",
+    summary="Get time-bucketed telemetry aggregates for a device",
+    description=(
+        "Return per-bucket aggregates (event count, min/max/avg of X and Y, first and "
+        "last `system_time_utc`) of a device's telemetry at `1m`, `5m` or `1h` "
+        "resolution. The device must authenticate using the `X-API-Key` header. The "
+        "time window is given as for the list endpoint; its start is aligned down to "
+        "the resolution.\n\n"
+        "Buckets are ordered by `bucket_start` in descending order and only buckets "
+        "with events are returned. They are computed from per-minute rollups maintained "
+        "on insert, so a long window reads one row per device-minute instead of every "
+        "raw event."
+    ),
+    response_model=list[TelemetryAggregateItem],
+)
+async def get_telemetry_aggregates_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    resolution: Literal["1m", "5m", "1h"] = Query(
+        default="1m",
+        description="Bucket width.",
+    ),
+    start_time: datetime | None = Query(
+        default=None,
+        description=(
+            "Start of the time range (UTC). If provided, `latest_seconds` is ignored. "
+            "If omitted while `end_time` is provided, the server will bound the lookback "
+            f"window to at most {MAX_LATEST_SECONDS} seconds."
+        ),
+    ),
+    end_time: datetime | None = Query(
+        default=None,
+        description=(
+            "End of the time range (UTC). If omitted but `start_time` is provided, "
+            "defaults to the current server time."
+        ),
+    ),
+    latest_seconds: int = Query(
+        default=DEFAULT_LATEST_SECONDS,
+        ge=1,
+        le=MAX_LATEST_SECONDS,
+        description=(
+            "Lookback window in seconds when `start_time` and `end_time` are not provided."
+        ),
+    ),
+    limit: int = Query(
+        default=1000,
+        ge=1,
+        le=MAX_LIST_LIMIT,
+        description="Maximum number of buckets to return (most recent first).",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> list[TelemetryAggregateItem]:
+    """
+    Return telemetry aggregates for the authenticated device.
+
+    Reads app.telemetry_rollup_minute only; telemetry_event is not scanned.
+    """
+    start_time, end_time = normalize_time_window(
+        start_time=start_time,
+        end_time=end_time,
+        latest_seconds=latest_seconds,
+    )
+
+    logger.debug(
+        "Fetching telemetry aggregates for device",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "resolution": resolution,
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+        },
+    )
+
+    stmt = build_aggregate_query(device.device_uuid, start_time, end_time, resolution, limit)
+
+    try:
+        result = await db.execute(stmt)
+        rows = result.all()
+    except SQLAlchemyError as exc:
+        logger.exception(
+            "Database error while fetching telemetry aggregates",
+            extra={"device_uuid": str(device.device_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve telemetry aggregates.",
+        ) from exc
+
+    return [TelemetryAggregateItem.model_validate(row) for row in rows]
@@ -1,12 +1,28 @@
 # schemas/__init__.py
 from .device_registry import DeviceRegistryItem
-from .telemetry_event import TelemetryItem, TelemetryCreate, TelemetryCountItem
+from .gateway import TelemetryBulkRecord, TelemetryBulkError, TelemetryBulkResult
+from .telemetry_event import (
+    TelemetryItem,
+    TelemetryCreate,
+    TelemetryCountItem,
+    TelemetryTotalCountItem,
+    TelemetryBatchItemResult,
+    TelemetryBatchResult,
+)
 from .telemetry_latest import TelemetryLatestItem
+from .telemetry_rollup import TelemetryAggregateItem
 
 __all__ = [
     "DeviceRegistryItem",
+    "TelemetryBulkRecord",
+    "TelemetryBulkError",
+    "TelemetryBulkResult",
     "TelemetryItem",
     "TelemetryCreate",
     "TelemetryCountItem",
+    "TelemetryTotalCountItem",
+    "TelemetryBatchItemResult",
+    "TelemetryBatchResult",
     "TelemetryLatestItem",
+    "TelemetryAggregateItem",
 ]
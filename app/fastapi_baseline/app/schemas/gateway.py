@@ -0,0 +1,57 @@
+# app/schemas/gateway.py
+from uuid import UUID
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class TelemetryBulkRecord(BaseModel):
+    """
+    One NDJSON line of a gateway bulk ingestion request.
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    device_uuid: UUID = Field(
+        description="UUID of the registered device that produced this point.",
+    )
+    x_coord: float = Field(
+        allow_inf_nan=False,
+        description="X coordinate value.",
+    )
+    y_coord: float = Field(
+        allow_inf_nan=False,
+        description="Y coordinate value.",
+    )
+    device_time: Optional[datetime] = Field(
+        default=None,
+        description=(
+            "Timestamp reported by the device clock (optional). "
+            "Naive timestamps are interpreted as UTC; if omitted, the server-side "
+            "ingestion time is used."
+        ),
+    )
+
+
+class TelemetryBulkError(BaseModel):
+    """
+    A rejected NDJSON line.
+    """
+
+    line: int = Field(description="One-based line number in the request body.")
+    detail: str = Field(description="Reason the line was rejected.")
+
+
+class TelemetryBulkResult(BaseModel):
+    """
+    Response body of a gateway bulk ingestion request.
+    """
+
+    gateway_uuid: UUID
+    accepted: int = Field(description="Number of points written.")
+    rejected: int = Field(description="Number of lines rejected (invalid or unknown device).")
+    chunks: int = Field(description="Number of COPY chunks written.")
+    errors: list[TelemetryBulkError] = Field(
+        description="First rejected lines, capped to keep the response small.",
+    )
@@ -68,3 +68,52 @@ class TelemetryItem(ORMModel):
 class TelemetryCountItem(BaseModel):
     device_uuid: UUID
     total_events: int
+
+
+class TelemetryTotalCountItem(BaseModel):
+    """
+    Total number of stored telemetry events.
+    """
+
+    telemetry_count: int = Field(
+        description="Total telemetry events.",
+    )
+    as_of: Optional[datetime] = Field(
+        default=None,
+        description="Time (UTC) the count was taken; null if not yet known.",
+    )
+    exact: bool = Field(
+        default=False,
+        description="True if produced by a full COUNT(*) rather than the maintained counter.",
+    )
+
+
+class TelemetryBatchItemResult(BaseModel):
+    """
+    Outcome of a single point within a batch ingestion request.
+    """
+
+    index: int = Field(
+        description="Zero-based position of the point in the request array.",
+    )
+    status: str = Field(
+        description="Outcome for this point (`created`).",
+        examples=["created"],
+    )
+    item: TelemetryItem = Field(
+        description="The stored telemetry event.",
+    )
+
+
+class TelemetryBatchResult(BaseModel):
+    """
+    Response body of a batch ingestion request.
+    """
+
+    device_uuid: UUID
+    accepted: int = Field(
+        description="Number of points accepted from the batch.",
+    )
+    results: list[TelemetryBatchItemResult] = Field(
+        description="Per-point results, in request order.",
+    )
@@ -0,0 +1,38 @@
+# app/schemas/telemetry_rollup.py
+from datetime import datetime
+
+from pydantic import Field
+
+from .base import ORMModel
+
+
+class TelemetryAggregateItem(ORMModel):
+    """
+    Telemetry aggregates of one device over one time bucket.
+
+    Typical usage:
+      - Response model for GET /telemetry/{device_uuid}/aggregates
+    """
+
+    bucket_start: datetime = Field(
+        description="Start of the bucket (UTC), aligned to the requested resolution.",
+        examples=["2025-11-17T12:35:00Z"],
+    )
+    count: int = Field(
+        description="Number of telemetry events in the bucket.",
+        examples=[60],
+    )
+    min_x: float = Field(description="Minimum X coordinate.", examples=[1.2])
+    max_x: float = Field(description="Maximum X coordinate.", examples=[1.9])
+    avg_x: float = Field(description="Average X coordinate.", examples=[1.55])
+    min_y: float = Field(description="Minimum Y coordinate.", examples=[3.4])
+    max_y: float = Field(description="Maximum Y coordinate.", examples=[4.1])
+    avg_y: float = Field(description="Average Y coordinate.", examples=[3.71])
+    first_time: datetime = Field(
+        description="`system_time_utc` of the earliest event in the bucket.",
+        examples=["2025-11-17T12:35:00.412Z"],
+    )
+    last_time: datetime = Field(
+        description="`system_time_utc` of the latest event in the bucket.",
+        examples=["2025-11-17T12:35:59.870Z"],
+    )
@@ -0,0 +1,55 @@
+# tests/test_device_count.py
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import UUID
+
+from app.db import DeviceCountReconciler
+
+
+class ScriptedReconciler(DeviceCountReconciler):
+    """Serves batches from a list of (stored, actual) pairs instead of Postgres."""
+
+    def __init__(self, counts, batch_devices=2, locked=True):
+        super().__init__(interval_seconds=60, batch_devices=batch_devices)
+        self.rows = [
+            SimpleNamespace(checked_device_uuid=UUID(int=i + 1), stored_count=s, actual_count=a)
+            for i, (s, a) in enumerate(counts)
+        ]
+        self.locked = locked
+        self.locks = 0
+        self.calls = []
+
+    @asynccontextmanager
+    async def _exclusive(self):
+        self.locks += 1
+        yield "conn" if self.locked else None
+
+    async def _reconcile_batch(self, conn, after):
+        assert conn == "conn"
+        self.calls.append(after)
+        start = 0 if after is None else after.int
+        return self.rows[start:start + self.batch_devices]
+
+
+def test_pass_walks_all_devices_and_counts_repairs():
+    reconciler = ScriptedReconciler([(1, 1), (5, 7), (3, 3), (9, 4), (2, 2)])
+
+    repaired = asyncio.run(reconciler.reconcile())
+
+    assert repaired == 2
+    assert reconciler.calls == [None, UUID(int=2), UUID(int=4)]
+    assert reconciler.locks == 1   # one lock for the whole pass, not per batch
+    stats = reconciler.stats()
+    assert stats["checked"] == 5
+    assert stats["drift"] == 7
+    assert stats["passes"] == 1
+
+
+def test_pass_skipped_when_another_worker_holds_the_lock():
+    reconciler = ScriptedReconciler([(1, 2)], locked=False)
+
+    assert asyncio.run(reconciler.reconcile()) == 0
+    assert reconciler.stats()["skipped_passes"] == 1
+    assert reconciler.stats()["passes"] == 0
+    assert reconciler.calls == []
@@ -0,0 +1,69 @@
+# tests/test_device_filter.py
+import time
+from uuid import UUID, uuid4
+
+from app.cache import BloomFilter, DeviceFilter
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    members = [uuid4() for _ in range(1000)]
+    for device_uuid in members:
+        bloom.add(device_uuid)
+
+    assert all(device_uuid in bloom for device_uuid in members)
+
+
+def test_bloom_filter_false_positive_rate_near_target():
+    bloom = BloomFilter(capacity=1000, false_positive_rate=0.01)
+    for _ in range(1000):
+        bloom.add(uuid4())
+
+    trials = 20_000
+    false_positives = sum(1 for _ in range(trials) if uuid4() in bloom)
+    assert false_positives / trials < 0.03
+
+
+def test_device_filter_fails_open_until_built():
+    device_filter = DeviceFilter(
+        false_positive_rate=0.01,
+        refresh_seconds=5,
+        rebuild_seconds=600,
+        max_staleness_seconds=60,
+    )
+    assert device_filter.might_contain(uuid4()) is True
+    assert device_filter.stats()["rejected"] == 0
+
+
+def test_device_filter_counts_rejections():
+    device_filter = DeviceFilter(
+        false_positive_rate=0.001,
+        refresh_seconds=5,
+        rebuild_seconds=600,
+        max_staleness_seconds=60,
+    )
+    known = UUID(int=1)
+    device_filter._bloom = BloomFilter(capacity=100, false_positive_rate=0.001)
+    device_filter._last_refresh_at = time.monotonic()
+    device_filter.add(known)
+
+    assert device_filter.might_contain(known) is True
+    assert device_filter.might_contain(UUID(int=2)) is False
+    assert device_filter.stats()["rejected"] == 1
+
+
+def test_device_filter_fails_open_when_stale():
+    device_filter = DeviceFilter(
+        false_positive_rate=0.001,
+        refresh_seconds=5,
+        rebuild_seconds=600,
+        max_staleness_seconds=60,
+    )
+    device_filter._bloom = BloomFilter(capacity=100, false_positive_rate=0.001)
+    device_filter._last_refresh_at = time.monotonic() - 61
+
+    assert device_filter.might_contain(UUID(int=2)) is True
+    stats = device_filter.stats()
+    assert stats["stale_bypasses"] == 1
+    assert stats["rejected"] == 0
+    assert stats["staleness_seconds"] > 60
@@ -0,0 +1,161 @@
+# tests/test_gateway_bulk.py
+import asyncio
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import asyncpg
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import DBAPIError
+
+from app import main
+from app.db import bulk, get_db
+from app.routers import gateway
+from app.routers.gateway import get_authenticated_gateway, iter_ndjson_lines
+
+
+class FakeRequest:
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    async def stream(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+async def collect(request, max_line_bytes):
+    return [item async for item in iter_ndjson_lines(request, max_line_bytes)]
+
+
+def test_ndjson_lines_split_across_chunks():
+    request = FakeRequest([b'{"a":1}\n{"b"', b':2}\n\n{"c":3}'])
+
+    lines = asyncio.run(collect(request, max_line_bytes=64))
+
+    assert lines == [(1, b'{"a":1}'), (2, b'{"b":2}'), (3, b""), (4, b'{"c":3}')]
+
+
+def test_ndjson_line_over_limit_is_rejected():
+    request = FakeRequest([b"x" * 100])
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(collect(request, max_line_bytes=64))
+
+    assert exc_info.value.status_code == 413
+
+
+def test_complete_ndjson_line_over_limit_is_rejected():
+    request = FakeRequest([b'{"a":1}\n' + b"x" * 100 + b'\n{"c":3}\n'])
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(collect(request, max_line_bytes=64))
+
+    assert exc_info.value.status_code == 413
+    assert "line 2" in exc_info.value.detail
+
+
+class FakeSession:
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def bulk_client(monkeypatch):
+    session = FakeSession()
+    copied = []
+
+    async def all_registered(db, device_uuids, known):
+        return set(device_uuids)
+
+    async def fake_copy(db, records):
+        if len(copied) == 1:
+            raise DBAPIError("COPY", None, Exception("deadlock detected"))
+        copied.append(len(records))
+        return len(records)
+
+    monkeypatch.setattr(gateway.settings, "bulk_copy_chunk_rows", 2)
+    monkeypatch.setattr(gateway, "filter_registered_devices", all_registered)
+    monkeypatch.setattr(gateway, "copy_telemetry_records", fake_copy)
+    main.app.dependency_overrides[get_db] = lambda: session
+    main.app.dependency_overrides[get_authenticated_gateway] = (
+        lambda: SimpleNamespace(gateway_uuid=uuid4())
+    )
+    yield TestClient(main.app), session, copied
+    main.app.dependency_overrides.clear()
+
+
+def _ndjson(count):
+    return "".join(
+        json.dumps({"device_uuid": str(uuid4()), "x_coord": i, "y_coord": i}) + "\n"
+        for i in range(count)
+    )
+
+
+def test_bulk_ingest_commits_each_chunk_and_reports_progress_on_failure(bulk_client):
+    client, session, copied = bulk_client
+
+    resp = client.post(f"{main.API_PREFIX}/gateways/{uuid4()}/telemetry", content=_ndjson(5))
+
+    assert resp.status_code == 500
+    assert "2 rows through line 2 were committed" in resp.json()["detail"]
+    assert copied == [2]
+    assert session.commits == 1
+    assert session.rollbacks == 1
+
+
+def test_bulk_ingest_with_partial_success_is_created(bulk_client):
+    client, _, copied = bulk_client
+
+    resp = client.post(
+        f"{main.API_PREFIX}/gateways/{uuid4()}/telemetry",
+        content=_ndjson(1) + "not json\n",
+    )
+
+    assert resp.status_code == 201
+    assert resp.json()["accepted"] == 1
+    assert resp.json()["rejected"] == 1
+    assert copied == [1]
+
+
+def test_bulk_ingest_with_nothing_accepted_is_unprocessable(bulk_client):
+    client, _, copied = bulk_client
+
+    resp = client.post(
+        f"{main.API_PREFIX}/gateways/{uuid4()}/telemetry",
+        content="not json\n{}\n",
+    )
+
+    assert resp.status_code == 422
+    body = resp.json()
+    assert body["accepted"] == 0
+    assert body["rejected"] == 2
+    assert [e["line"] for e in body["errors"]] == [1, 2]
+    assert copied == []
+
+
+def test_copy_driver_errors_become_sqlalchemy_errors():
+    class RawConnection:
+        async def copy_records_to_table(self, *args, **kwargs):
+            raise asyncpg.exceptions.DeadlockDetectedError("deadlock detected")
+
+    class Connection:
+        async def get_raw_connection(self):
+            return SimpleNamespace(driver_connection=RawConnection())
+
+    class Session:
+        async def connection(self):
+            return Connection()
+
+    with pytest.raises(DBAPIError) as exc_info:
+        asyncio.run(bulk.copy_telemetry_records(Session(), [("row",)]))
+
+    assert isinstance(exc_info.value.orig, asyncpg.PostgresError)
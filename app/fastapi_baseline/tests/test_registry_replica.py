@@ -0,0 +1,60 @@
+# tests/test_registry_replica.py
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.cache import DeviceRegistryReplica, RegistryEntry
+
+
+def build_replica(max_entries: int = 2) -> DeviceRegistryReplica:
+    """build a replica that looks freshly refreshed."""
+    replica = DeviceRegistryReplica(
+        max_entries=max_entries,
+        refresh_seconds=5,
+        full_reload_seconds=300,
+        max_staleness_seconds=60,
+    )
+    replica._last_refresh_at = time.monotonic()
+    return replica
+
+
+def make_entry() -> RegistryEntry:
+    return RegistryEntry(uuid4(), "hash", datetime.now(timezone.utc))
+
+
+def test_replica_hit_and_miss():
+    replica = build_replica()
+    entry = make_entry()
+    replica.put(entry)
+
+    assert replica.get(entry.device_uuid) == entry
+    assert replica.get(uuid4()) is None
+
+    stats = replica.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_replica_evicts_least_recently_used():
+    replica = build_replica(max_entries=2)
+    first, second, third = make_entry(), make_entry(), make_entry()
+    replica.put(first)
+    replica.put(second)
+
+    # touch first so second becomes the eviction candidate
+    assert replica.get(first.device_uuid) == first
+    replica.put(third)
+
+    assert replica.get(second.device_uuid) is None
+    assert replica.get(first.device_uuid) == first
+    assert replica.stats()["evictions"] == 1
+
+
+def test_replica_bypassed_when_stale():
+    replica = build_replica()
+    entry = make_entry()
+    replica.put(entry)
+    replica._last_refresh_at = time.monotonic() - 120
+
+    assert replica.get(entry.device_uuid) is None
+    assert replica.stats()["stale_bypasses"] == 1
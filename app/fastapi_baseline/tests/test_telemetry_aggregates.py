@@ -0,0 +1,39 @@
+# tests/test_telemetry_aggregates.py
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy.dialects import postgresql
+
+from app.routers.telemetry import build_aggregate_query
+
+START = datetime(2025, 11, 17, 12, 34, 56, tzinfo=timezone.utc)
+END = datetime(2025, 11, 17, 18, 0, tzinfo=timezone.utc)
+
+
+def compile_query(resolution: str):
+    stmt = build_aggregate_query(UUID(int=1), START, END, resolution, limit=100)
+    return stmt.compile(dialect=postgresql.dialect())
+
+
+def test_start_is_aligned_to_resolution():
+    assert compile_query("1m").params["bucket_start_1"] == datetime(
+        2025, 11, 17, 12, 34, tzinfo=timezone.utc
+    )
+    assert compile_query("5m").params["bucket_start_1"] == datetime(
+        2025, 11, 17, 12, 30, tzinfo=timezone.utc
+    )
+    assert compile_query("1h").params["bucket_start_1"] == datetime(
+        2025, 11, 17, 12, 0, tzinfo=timezone.utc
+    )
+
+
+def test_buckets_group_by_the_selected_expression():
+    sql = str(compile_query("5m"))
+
+    bucket = (
+        "date_bin(INTERVAL '300 seconds', app.telemetry_rollup_minute.bucket_start, "
+        "TIMESTAMPTZ '1970-01-01 00:00:00+00')"
+    )
+    assert f"GROUP BY {bucket}" in sql
+    assert "FROM app.telemetry_rollup_minute" in sql
+    assert "telemetry_event" not in sql
@@ -0,0 +1,24 @@
+# tests/test_telemetry_cursor.py
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.telemetry import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip_keeps_microseconds():
+    system_time = datetime(2025, 11, 17, 12, 34, 56, 123456, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(system_time, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (system_time, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "Zm9v"])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,95 @@
+# tests/test_telemetry_export.py
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from app.models import TelemetryEvent
+from app.routers import telemetry
+from app.routers.telemetry import format_export_chunk, negotiate_export_format
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        (None, None),
+        ("application/json", None),
+        ("*/*", None),
+        ("application/x-ndjson", "application/x-ndjson"),
+        ("text/csv; charset=utf-8", "text/csv"),
+        ("application/json;q=0.5, TEXT/CSV", "text/csv"),
+    ],
+)
+def test_negotiate_export_format(accept, expected):
+    assert negotiate_export_format(accept) == expected
+
+
+def _row(x_coord):
+    now = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        device_uuid=uuid4(),
+        x_coord=x_coord,
+        y_coord=-x_coord,
+        device_time=now,
+        system_time_utc=now,
+    )
+
+
+def test_ndjson_chunk_has_one_object_per_line():
+    rows = [_row(1.5), _row(2.5)]
+
+    lines = format_export_chunk(rows, "application/x-ndjson").splitlines()
+
+    assert [json.loads(line)["x_coord"] for line in lines] == [1.5, 2.5]
+    assert json.loads(lines[0])["device_uuid"] == str(rows[0].device_uuid)
+
+
+def test_csv_chunk_matches_columns():
+    row = _row(3.0)
+
+    records = list(csv.reader(io.StringIO(format_export_chunk([row], "text/csv"))))
+
+    assert records == [[
+        str(row.device_uuid), "3.0", "-3.0",
+        row.device_time.isoformat(), row.system_time_utc.isoformat(),
+    ]]
+
+
+def test_export_stream_error_aborts_the_response(monkeypatch):
+    class FailingResult:
+        async def partitions(self):
+            yield [_row(1.0)]
+            raise OperationalError("FETCH", None, Exception("connection lost"))
+
+    class FailingSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def stream(self, stmt):
+            return FailingResult()
+
+    monkeypatch.setattr(telemetry, "async_session_maker", FailingSession)
+
+    async def consume():
+        chunks = []
+        stream = telemetry.stream_telemetry_export(
+            select(TelemetryEvent), "text/csv", chunk_rows=1,
+        )
+        with pytest.raises(OperationalError):
+            async for chunk in stream:
+                chunks.append(chunk)
+        return chunks
+
+    chunks = asyncio.run(consume())
+
+    assert len(chunks) == 2     # header and the rows before the failure
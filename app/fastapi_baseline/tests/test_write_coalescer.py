@@ -0,0 +1,64 @@
+# tests/test_write_coalescer.py
+import asyncio
+
+import pytest
+
+from app.db import TelemetryWriteCoalescer, WriteQueueFull
+
+
+class RecordingCoalescer(TelemetryWriteCoalescer):
+    """Coalescer that records batches instead of writing to the database."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def _write(self, rows):
+        self.batches.append(list(rows))
+        return [dict(row, stored=True) for row in rows]
+
+
+def test_concurrent_submits_share_one_flush():
+    async def scenario():
+        coalescer = RecordingCoalescer(flush_ms=50, max_rows=100, max_pending=100)
+        await coalescer.start()
+        results = await asyncio.gather(*(coalescer.submit({"i": i}) for i in range(10)))
+        await coalescer.stop()
+        return coalescer, results
+
+    coalescer, results = asyncio.run(scenario())
+
+    assert [row["i"] for row in results] == list(range(10))
+    assert all(row["stored"] for row in results)
+    assert len(coalescer.batches) == 1
+    assert coalescer.stats()["flushed_rows"] == 10
+
+
+def test_flush_splits_at_max_rows():
+    async def scenario():
+        coalescer = RecordingCoalescer(flush_ms=50, max_rows=4, max_pending=100)
+        await coalescer.start()
+        await asyncio.gather(*(coalescer.submit({"i": i}) for i in range(10)))
+        await coalescer.stop()
+        return coalescer
+
+    coalescer = asyncio.run(scenario())
+
+    assert [len(batch) for batch in coalescer.batches] == [4, 4, 2]
+
+
+def test_submit_rejected_when_queue_full():
+    async def scenario():
+        coalescer = RecordingCoalescer(flush_ms=50, max_rows=10, max_pending=1)
+        await coalescer.start()
+        first = asyncio.ensure_future(coalescer.submit({"i": 0}))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(coalescer.submit({"i": 1}))
+        third = asyncio.ensure_future(coalescer.submit({"i": 2}))
+        results = await asyncio.gather(first, second, third, return_exceptions=True)
+        await coalescer.stop()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert any(isinstance(r, WriteQueueFull) for r in results)
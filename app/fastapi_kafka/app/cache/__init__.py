@@ -0,0 +1,13 @@
+# cache/__init__.py
+from .device_filter import BloomFilter, DeviceFilter, device_filter
+from .latest import etag_matches, format_etag, latest_keys, latest_version
+
+__all__ = [
+    "BloomFilter",
+    "DeviceFilter",
+    "device_filter",
+    "etag_matches",
+    "format_etag",
+    "latest_keys",
+    "latest_version",
+]
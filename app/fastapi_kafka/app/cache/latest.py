@@ -0,0 +1,39 @@
+# app/cache/latest.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+LATEST_KEY_PREFIX = "telemetry:latest"
+
+
+def latest_keys(device_uuid: UUID | str) -> tuple[str, str]:
+    """Payload key and version key of a device's latest snapshot."""
+    data_key = f"{LATEST_KEY_PREFIX}:{device_uuid}"
+    return data_key, f"{data_key}:ver"
+
+
+def latest_version(system_time_utc: datetime) -> int:
+    """Millisecond snapshot version, computed as the Redis worker does."""
+    return int(system_time_utc.timestamp() * 1000)
+
+
+def format_etag(version: int | str) -> str:
+    """Strong ETag for a snapshot version."""
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag.
+
+    If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
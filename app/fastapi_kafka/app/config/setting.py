@@ -18,6 +18,8 @@ class KafkaSettings(BaseModel):
     bootstrap_servers: str = "broker:9092"
     client_id: str = "telemetry_producer"
     topic: str = "telemetry"
+    # message codec: "json" or "tlm-bin" (switch once consumers decode both)
+    message_codec: Literal["json", "tlm-bin"] = "json"
     # msk auth
     use_msk_auth: bool = False # turn on for aws msk
 
@@ -138,6 +140,124 @@ class Settings(BaseSettings):
         description="The number of uvicorn workers.",
     )
 
+    # ------------------------------
+    # Kafka async acknowledge
+    # ------------------------------
+    kafka_async_ack_enabled: bool = Field(
+        default=False,
+        alias="KAFKA_ASYNC_ACK_ENABLED",
+        description="Return 202 once telemetry is buffered, without waiting for the broker ack.",
+    )
+
+    kafka_async_ack_max_in_flight: int = Field(
+        default=10_000,
+        ge=1,
+        alias="KAFKA_ASYNC_ACK_MAX_IN_FLIGHT",
+        description="Max unacknowledged sends per worker; further POSTs are shed with 503.",
+    )
+
+    # ------------------------------
+    # Kafka producer batching
+    # ------------------------------
+    kafka_compression: Literal["auto", "gzip", "lz4", "zstd", "none"] = Field(
+        default="gzip",
+        alias="KAFKA_COMPRESSION",
+        description="Producer compression; 'auto' picks one by micro-benchmark at startup.",
+    )
+
+    kafka_codec_min_mb_per_s: float = Field(
+        default=50.0,
+        gt=0,
+        alias="KAFKA_CODEC_MIN_MB_PER_S",
+        description="Slowest encode throughput 'auto' compression will accept.",
+    )
+
+    kafka_adaptive_batching_enabled: bool = Field(
+        default=False,
+        alias="KAFKA_ADAPTIVE_BATCHING_ENABLED",
+        description="Tune producer linger and batch size from observed load.",
+    )
+
+    kafka_linger_ms_min: float = Field(
+        default=0.0,
+        ge=0,
+        alias="KAFKA_LINGER_MS_MIN",
+        description="Lower bound of the adaptive producer linger.",
+    )
+
+    kafka_linger_ms_max: float = Field(
+        default=50.0,
+        ge=0,
+        alias="KAFKA_LINGER_MS_MAX",
+        description="Upper bound of the adaptive producer linger.",
+    )
+
+    kafka_batch_size_min: int = Field(
+        default=16_384,
+        ge=1024,
+        alias="KAFKA_BATCH_SIZE_MIN",
+        description="Lower bound of the adaptive per-partition batch size in bytes.",
+    )
+
+    kafka_batch_size_max: int = Field(
+        default=1_048_576,
+        ge=1024,
+        alias="KAFKA_BATCH_SIZE_MAX",
+        description="Upper bound of the adaptive per-partition batch size in bytes.",
+    )
+
+    kafka_send_latency_target_ms: float = Field(
+        default=50.0,
+        gt=0,
+        alias="KAFKA_SEND_LATENCY_TARGET_MS",
+        description="Mean broker ack latency above which linger is cut back.",
+    )
+
+    kafka_batching_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="KAFKA_BATCHING_INTERVAL_SECONDS",
+        description="Interval between adaptive batching decisions.",
+    )
+
+    # ------------------------------
+    # Device filter (negative lookups)
+    # ------------------------------
+    device_filter_enabled: bool = Field(
+        default=True,
+        alias="DEVICE_FILTER_ENABLED",
+        description="Reject unknown device UUIDs with an in-process Bloom filter.",
+    )
+
+    device_filter_false_positive_rate: float = Field(
+        default=0.001,
+        gt=0,
+        lt=1,
+        alias="DEVICE_FILTER_FALSE_POSITIVE_RATE",
+        description="Target false-positive rate of the device filter.",
+    )
+
+    device_filter_refresh_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="DEVICE_FILTER_REFRESH_SECONDS",
+        description="Interval between delta refreshes of newly registered devices.",
+    )
+
+    device_filter_rebuild_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        alias="DEVICE_FILTER_REBUILD_SECONDS",
+        description="Interval between full filter rebuilds from device_registry.",
+    )
+
+    device_filter_max_staleness_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="DEVICE_FILTER_MAX_STALENESS_SECONDS",
+        description="Fail open when the last successful filter refresh is older than this.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
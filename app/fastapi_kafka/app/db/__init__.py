@@ -1,7 +1,8 @@
-from .presgres import get_db
+from .presgres import get_db, async_session_maker
 from .redis import redis_client
 
 __all__ = [
     "get_db",
+    "async_session_maker",
     "redis_client",
 ]
@@ -7,9 +7,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from .cache import device_filter
 from .config import get_settings, setup_logging
-from .mq import init_producer, close_producer
-from .routers import home, health, device, telemetry
+from .mq import batching_controller, close_producer, get_producer, init_producer
+from .routers import home, health, device, telemetry, metrics
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -21,7 +22,13 @@ settings = get_settings()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_producer()
+    if settings.kafka_adaptive_batching_enabled:
+        await batching_controller.start(get_producer())
+    if settings.device_filter_enabled:
+        await device_filter.start()
     yield
+    await device_filter.stop()
+    await batching_controller.stop()
     await close_producer()
 
 
@@ -53,7 +60,8 @@ app.add_middleware(
     allow_origins=settings.cors_list,
     allow_credentials=False,  # no cookies for devices
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "x-api-key"],
+    allow_headers=["Content-Type", "x-api-key", "If-None-Match"],
+    expose_headers=["ETag"],
 )
 
 # ====================
@@ -63,3 +71,4 @@ app.include_router(home.router, prefix=API_PREFIX)
 app.include_router(health.router, prefix=API_PREFIX)
 # app.include_router(device.router, prefix=API_PREFIX)
 app.include_router(telemetry.router, prefix=API_PREFIX)
+app.include_router(metrics.router, prefix=API_PREFIX)
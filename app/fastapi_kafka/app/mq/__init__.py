@@ -1,7 +1,23 @@
-from .kafka_producer import init_producer, close_producer, get_producer
+from .kafka_producer import (
+    MESSAGE_HEADERS,
+    init_producer,
+    close_producer,
+    get_producer,
+    send_batch_and_wait,
+)
+from .batching import BatchingController, batching_controller, benchmark_codecs
+from .async_ack import AsyncAckSender, InFlightLimitReached, async_ack_sender
 
 __all__ = [
+    "MESSAGE_HEADERS",
     "init_producer",
     "close_producer",
-    "get_producer"
+    "get_producer",
+    "send_batch_and_wait",
+    "BatchingController",
+    "batching_controller",
+    "benchmark_codecs",
+    "AsyncAckSender",
+    "InFlightLimitReached",
+    "async_ack_sender",
 ]
@@ -0,0 +1,118 @@
+# mq/async_ack.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import Optional
+
+from aiokafka import AIOKafkaProducer
+
+from ..config import get_settings
+from ..schemas import TelemetryItem
+from .batching import batching_controller
+from .kafka_producer import MESSAGE_HEADERS
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+class InFlightLimitReached(Exception):
+    """Raised when the async-ack sender already has max_in_flight sends pending."""
+
+
+class AsyncAckSender:
+    """
+    Fire-and-track Kafka sender for the 202 Accepted ingest mode.
+
+    - Enqueues with producer.send() and returns once the record is buffered,
+      without waiting for the broker acknowledgement.
+    - A semaphore caps in-flight sends; when it is exhausted new sends are
+      shed immediately instead of queueing behind the broker.
+    - Delivery results are handled in a done-callback: they update counters
+      and are logged, but never reach the request that produced them.
+    """
+
+    def __init__(self, *, max_in_flight: int) -> None:
+        self.max_in_flight = max_in_flight
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self.in_flight = 0
+
+        # metrics
+        self.enqueued = 0
+        self.delivered = 0
+        self.failed = 0
+        self.shed = 0
+        self.last_error: Optional[str] = None
+
+    async def send(
+        self,
+        producer: AIOKafkaProducer,
+        topic: str,
+        value: TelemetryItem,
+        key: bytes,
+    ) -> None:
+        """
+        Buffer one record for delivery.
+
+        Raises InFlightLimitReached when the cap is hit, or the producer's
+        own error if the record cannot be buffered at all.
+        """
+        if self._semaphore.locked():
+            self.shed += 1
+            raise InFlightLimitReached()
+
+        await self._semaphore.acquire()
+        started = time.perf_counter()
+        try:
+            future = await producer.send(
+                topic, value=value, key=key, headers=MESSAGE_HEADERS)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+        self.enqueued += 1
+        self.in_flight += 1
+        future.add_done_callback(partial(self._on_delivery, started))
+
+    def _on_delivery(self, started: float, future: asyncio.Future) -> None:
+        self._semaphore.release()
+        self.in_flight -= 1
+
+        if future.cancelled():
+            self.failed += 1
+            self.last_error = "cancelled"
+            return
+
+        exc = future.exception()
+        if exc is None:
+            self.delivered += 1
+            batching_controller.observe(
+                1,
+                future.result().serialized_value_size,
+                time.perf_counter() - started,
+            )
+            return
+
+        self.failed += 1
+        self.last_error = repr(exc)
+        logger.error("Async-ack Kafka delivery failed: %r", exc)
+
+    def stats(self) -> dict:
+        """Snapshot of sender metrics."""
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "shed": self.shed,
+            "last_error": self.last_error,
+        }
+
+
+async_ack_sender = AsyncAckSender(
+    max_in_flight=settings.kafka_async_ack_max_in_flight,
+)
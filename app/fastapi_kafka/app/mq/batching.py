@@ -0,0 +1,291 @@
+# mq/batching.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional
+from uuid import uuid4
+
+from aiokafka import AIOKafkaProducer
+from aiokafka import codec as kafka_codec
+
+from ..config import get_settings
+from ..schemas import TelemetryItem
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Codecs the producer can use, with an availability check and an encoder.
+# lz4/zstd need the optional `cramjam` package and are skipped without it.
+CODECS: dict[str, tuple[Callable[[], bool], Callable[[bytes], bytes]]] = {
+    "gzip": (kafka_codec.has_gzip, kafka_codec.gzip_encode),
+    "lz4": (kafka_codec.has_lz4, kafka_codec.lz4_encode),
+    "zstd": (kafka_codec.has_zstd, kafka_codec.zstd_encode),
+}
+
+BENCHMARK_MESSAGES = 500        # Messages per synthetic benchmark batch
+BENCHMARK_ROUNDS = 5            # Encode rounds per codec (best time is kept)
+MIN_COMPRESSION_GAIN = 1.2      # Below this ratio compression is not worth it
+
+
+def benchmark_codecs(
+    serialize: Callable[[TelemetryItem], bytes],
+    min_mb_per_s: float,
+) -> tuple[str, dict[str, dict]]:
+    """
+    Micro-benchmark the available compression codecs on a synthetic batch.
+
+    Messages are serialized exactly as the producer would, so the result
+    reflects the configured message codec. The smallest output among codecs
+    encoding at least `min_mb_per_s` wins; "none" wins if no codec shrinks
+    the batch by MIN_COMPRESSION_GAIN.
+
+    Returns:
+        (chosen codec, per-codec results)
+    """
+    now = datetime.now(timezone.utc)
+    device_uuids = [uuid4() for _ in range(50)]
+    payload = b"".join(
+        serialize(TelemetryItem(
+            device_uuid=device_uuids[i % len(device_uuids)],
+            x_coord=i * 0.731,
+            y_coord=i * -1.377,
+            device_time=now,
+            system_time_utc=now,
+        ))
+        for i in range(BENCHMARK_MESSAGES)
+    )
+    size_mb = len(payload) / 1_000_000
+
+    results: dict[str, dict] = {}
+    for name, (available, encode) in CODECS.items():
+        if not available():
+            continue
+        best = float("inf")
+        for _ in range(BENCHMARK_ROUNDS):
+            started = time.perf_counter()
+            encoded = encode(payload)
+            best = min(best, time.perf_counter() - started)
+        results[name] = {
+            "ratio": round(len(payload) / len(encoded), 3),
+            "mb_per_s": round(size_mb / best, 1) if best > 0 else float("inf"),
+        }
+
+    eligible = [
+        name for name, r in results.items()
+        if r["mb_per_s"] >= min_mb_per_s and r["ratio"] >= MIN_COMPRESSION_GAIN
+    ]
+    chosen = max(eligible, key=lambda n: results[n]["ratio"]) if eligible else "none"
+
+    logger.info("Kafka codec benchmark chose %s: %s", chosen, results)
+    return chosen, results
+
+
+class BatchingController:
+    """
+    Tunes producer linger and batch size from observed load.
+
+    Each interval it looks at the send rate, bytes per partition and mean
+    send latency since the last tick:
+    - linger is set to the time a batch takes to fill, or to the minimum
+      when batches cannot fill within the maximum, so light traffic is sent
+      immediately and busy traffic waits just long enough to fill;
+    - batch size doubles while batches fill before linger expires and
+      halves while they stay mostly empty;
+    - linger is halved whenever send latency exceeds the target.
+
+    The fill ratio is an estimate (bytes per partition per ms x linger /
+    batch size); aiokafka does not report the size of the batches it sends.
+
+    Settings are applied through aiokafka private attributes. If a release
+    no longer has them, the controller logs it and disables itself instead
+    of failing.
+
+    All decisions stay within the configured bounds.
+    """
+
+    def __init__(
+        self,
+        *,
+        topic: str,
+        linger_ms_min: float,
+        linger_ms_max: float,
+        batch_size_min: int,
+        batch_size_max: int,
+        latency_target_ms: float,
+        interval_seconds: float,
+    ) -> None:
+        self.topic = topic
+        self.linger_ms_min = linger_ms_min
+        self.linger_ms_max = linger_ms_max
+        self.batch_size_min = batch_size_min
+        self.batch_size_max = batch_size_max
+        self.latency_target_ms = latency_target_ms
+        self.interval_seconds = interval_seconds
+
+        self.linger_ms: float = linger_ms_min
+        self.batch_size: int = batch_size_min
+        self.compression: Optional[str] = None
+        self.codec_benchmark: dict[str, dict] = {}
+
+        self._producer: Optional[AIOKafkaProducer] = None
+        self._task: Optional[asyncio.Task] = None
+        self.disabled_reason: Optional[str] = None
+
+        # window accumulators, reset every tick
+        self._messages = 0
+        self._bytes = 0
+        self._latency_sum = 0.0
+        self._latency_count = 0
+        self._window_started = time.monotonic()
+
+        # last observed load
+        self.messages_per_s = 0.0
+        self.bytes_per_s = 0.0
+        self.mean_latency_ms: Optional[float] = None
+        self.estimated_fill_ratio: Optional[float] = None
+        self.adjustments = 0
+
+    def observe(self, messages: int, nbytes: int, latency_seconds: Optional[float] = None) -> None:
+        """Record sent messages and, when known, how long the broker took to ack them."""
+        self._messages += messages
+        self._bytes += nbytes
+        if latency_seconds is not None:
+            self._latency_sum += latency_seconds
+            self._latency_count += 1
+
+    # ------------------------------
+    # Control loop
+    # ------------------------------
+    def _partitions(self) -> int:
+        if self._producer is None:
+            return 1
+        partitions = self._producer.client.cluster.partitions_for_topic(self.topic)
+        return max(len(partitions or ()), 1)
+
+    def tick(self, partitions: int = 1) -> None:
+        """Close the current window and recompute linger and batch size."""
+        now = time.monotonic()
+        elapsed = max(now - self._window_started, 1e-6)
+
+        self.messages_per_s = self._messages / elapsed
+        self.bytes_per_s = self._bytes / elapsed
+        self.mean_latency_ms = (
+            self._latency_sum / self._latency_count * 1000
+            if self._latency_count else None
+        )
+
+        self._messages = self._bytes = self._latency_count = 0
+        self._latency_sum = 0.0
+        self._window_started = now
+
+        linger_ms, batch_size = self.linger_ms, self.batch_size
+        bytes_per_partition_ms = self.bytes_per_s / partitions / 1000
+
+        if bytes_per_partition_ms <= 0:
+            linger_ms = self.linger_ms_min
+            self.estimated_fill_ratio = None
+        else:
+            # estimated from the byte rate: how full a batch gets before linger expires
+            fill_ratio = round(bytes_per_partition_ms * max(linger_ms, 1) / batch_size, 3)
+            self.estimated_fill_ratio = fill_ratio
+
+            if fill_ratio >= 1 and batch_size < self.batch_size_max:
+                batch_size = min(batch_size * 2, self.batch_size_max)
+            elif fill_ratio < 0.25 and batch_size > self.batch_size_min:
+                batch_size = max(batch_size // 2, self.batch_size_min)
+
+            fill_ms = batch_size / bytes_per_partition_ms
+            # waiting only pays off when a batch can fill within the bound
+            linger_ms = fill_ms if fill_ms <= self.linger_ms_max else self.linger_ms_min
+
+        if self.mean_latency_ms is not None and self.mean_latency_ms > self.latency_target_ms:
+            linger_ms = min(linger_ms, self.linger_ms / 2)
+
+        linger_ms = round(min(max(linger_ms, self.linger_ms_min), self.linger_ms_max), 1)
+
+        if (linger_ms, batch_size) != (self.linger_ms, self.batch_size):
+            self.adjustments += 1
+            logger.info(
+                "Kafka batching adjusted, linger_ms=%s batch_size=%d msg/s=%.0f",
+                linger_ms, batch_size, self.messages_per_s,
+            )
+        self.linger_ms, self.batch_size = linger_ms, batch_size
+        self._apply()
+
+    def _apply(self) -> None:
+        # aiokafka has no public setters; these are read on every send/drain
+        if self._producer is None:
+            return
+        sender = getattr(self._producer, "_sender", None)
+        accumulator = getattr(self._producer, "_message_accumulator", None)
+        if not (hasattr(sender, "_linger_time") and hasattr(accumulator, "_batch_size")):
+            self.disabled_reason = (
+                "aiokafka producer has no _sender._linger_time or "
+                "_message_accumulator._batch_size"
+            )
+            logger.warning("Kafka adaptive batching disabled: %s", self.disabled_reason)
+            self._producer = None
+            return
+        sender._linger_time = self.linger_ms / 1000
+        accumulator._batch_size = self.batch_size
+
+    async def _run(self) -> None:
+        while self._producer is not None:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                self.tick(self._partitions())
+            except Exception:
+                logger.exception("Kafka batching controller tick failed")
+
+    async def start(self, producer: AIOKafkaProducer) -> None:
+        """Attach to a started producer and begin tuning it."""
+        self._producer = producer
+        self._apply()
+        if self._producer is not None and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop tuning; the producer keeps its last settings."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._task = None
+        self._producer = None
+
+    def stats(self) -> dict:
+        """Snapshot of controller decisions and observed load."""
+        return {
+            "running": self._task is not None and self._producer is not None,
+            "disabled_reason": self.disabled_reason,
+            "compression": self.compression,
+            "codec_benchmark": self.codec_benchmark,
+            "linger_ms": self.linger_ms,
+            "linger_ms_bounds": [self.linger_ms_min, self.linger_ms_max],
+            "batch_size": self.batch_size,
+            "batch_size_bounds": [self.batch_size_min, self.batch_size_max],
+            "messages_per_s": round(self.messages_per_s, 1),
+            "bytes_per_s": round(self.bytes_per_s, 1),
+            "estimated_fill_ratio": self.estimated_fill_ratio,
+            "mean_latency_ms": round(self.mean_latency_ms, 3) if self.mean_latency_ms is not None else None,
+            "latency_target_ms": self.latency_target_ms,
+            "adjustments": self.adjustments,
+        }
+
+
+batching_controller = BatchingController(
+    topic=settings.kafka.topic,
+    linger_ms_min=settings.kafka_linger_ms_min,
+    linger_ms_max=settings.kafka_linger_ms_max,
+    batch_size_min=settings.kafka_batch_size_min,
+    batch_size_max=settings.kafka_batch_size_max,
+    latency_target_ms=settings.kafka_send_latency_target_ms,
+    interval_seconds=settings.kafka_batching_interval_seconds,
+)
@@ -2,19 +2,29 @@
 from __future__ import annotations
 
 import ssl
-import json
+import time
 import asyncio
 import logging
 from typing import Optional
 
 from aiokafka import AIOKafkaProducer
 from aiokafka.abc import AbstractTokenProvider
+from aiokafka.partitioner import DefaultPartitioner
+from aiokafka.structs import RecordMetadata
 from aws_msk_iam_sasl_signer import MSKAuthTokenProvider
 
 from ..config import get_settings
+from ..schemas import TelemetryItem
+from .batching import batching_controller, benchmark_codecs
+from .telemetry_codec import CODEC_BINARY, codec_headers, encode_binary, encode_json
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
+# Headers sent with every telemetry message, naming the configured codec
+MESSAGE_HEADERS = codec_headers(settings.kafka.message_codec)
+
 # singleton
 _producer: Optional[AIOKafkaProducer] = None
 _init_lock = asyncio.Lock()
@@ -31,6 +41,24 @@ class MSKTokenProvider(AbstractTokenProvider):
         return token
 
 
+def serialize_value(item: TelemetryItem) -> bytes:
+    """
+    Serialize a telemetry event with the configured codec.
+
+    Used as the producer's value_serializer; pair with MESSAGE_HEADERS so
+    consumers know how to decode the payload.
+    """
+    if settings.kafka.message_codec == CODEC_BINARY:
+        return encode_binary(
+            item.device_uuid,
+            item.x_coord,
+            item.y_coord,
+            item.device_time,
+            item.system_time_utc,
+        )
+    return encode_json(item.model_dump(mode="json"))
+
+
 # def _build_ssl_context() -> ssl.SSLContext:
 #     # Default TLS
 #     return ssl.create_default_context()
@@ -56,20 +84,33 @@ async def init_producer() -> AIOKafkaProducer:
         if _producer is not None:
             return _producer
 
-        settings = get_settings()
+        # Compression: fixed, or chosen by benchmarking the real payload
+        compression = settings.kafka_compression
+        if compression == "auto":
+            compression, batching_controller.codec_benchmark = benchmark_codecs(
+                serialize_value, settings.kafka_codec_min_mb_per_s
+            )
+        batching_controller.compression = compression
 
         # Base configuration
         producer_config = {
             "bootstrap_servers": settings.kafka_bootstrap_servers,
             "client_id": getattr(settings.kafka, "client_id", None) or "producer",
-            "value_serializer": lambda v: json.dumps(v).encode("utf-8"),
+            "value_serializer": serialize_value,
             "request_timeout_ms": 40000,
             "acks": 1,
-            "compression_type": "gzip",
+            "compression_type": None if compression == "none" else compression,
             "max_request_size": 1048576,
             "linger_ms": 10,
         }
 
+        # Adaptive batching starts from its lower bounds and tunes from there
+        if settings.kafka_adaptive_batching_enabled:
+            producer_config.update({
+                "linger_ms": batching_controller.linger_ms,
+                "max_batch_size": batching_controller.batch_size,
+            })
+
         print(f"######## {settings.kafka.use_msk_auth} ########")
         
         # AWS MSK security configuration
@@ -134,6 +175,54 @@ async def close_producer() -> None:
             _producer = None
 
 
+async def send_batch_and_wait(
+    producer: AIOKafkaProducer,
+    topic: str,
+    key: bytes,
+    values: list[TelemetryItem],
+) -> list[tuple[int, int]]:
+    """
+    Publish values sharing one key as explicit record batches.
+
+    All records go to the partition the default partitioner picks for `key`,
+    so ordering matches individual sends. A new batch is started only when
+    the current one is full (bounded by max_request_size).
+
+    Returns:
+        (partition, offset) for each value, in input order.
+    """
+    started = time.perf_counter()
+    nbytes = 0
+    partitions = sorted(await producer.partitions_for(topic))
+    partition = DefaultPartitioner()(key, partitions, partitions)
+
+    pending: list[tuple[asyncio.Future, int]] = []
+    batch = producer.create_batch()
+    count = 0
+
+    for value in values:
+        encoded = serialize_value(value)
+        nbytes += len(encoded)
+        if batch.append(key=key, value=encoded, timestamp=None, headers=MESSAGE_HEADERS) is None:
+            # batch full: ship it and continue in a fresh one
+            pending.append((await producer.send_batch(batch, topic, partition=partition), count))
+            batch = producer.create_batch()
+            count = 0
+            if batch.append(key=key, value=encoded, timestamp=None, headers=MESSAGE_HEADERS) is None:
+                raise ValueError("Telemetry message exceeds max_request_size")
+        count += 1
+
+    pending.append((await producer.send_batch(batch, topic, partition=partition), count))
+
+    positions: list[tuple[int, int]] = []
+    for future, size in pending:
+        md: RecordMetadata = await future
+        positions.extend((md.partition, md.offset + i) for i in range(size))
+
+    batching_controller.observe(len(values), nbytes, time.perf_counter() - started)
+    return positions
+
+
 def get_producer() -> AIOKafkaProducer:
     """
     Get the started producer; raise if not initialized.
@@ -0,0 +1,52 @@
+# app/routers/metrics.py
+import logging
+from fastapi import APIRouter
+
+from ..cache import device_filter
+from ..config import get_settings
+from ..mq import async_ack_sender, batching_controller
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+@router.get("/device-filter", summary="Device filter metrics")
+async def device_filter_metrics() -> dict:
+    """
+    Size and rejection counters of the unknown-device Bloom filter.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.device_filter_enabled,
+        **device_filter.stats(),
+    }
+
+
+@router.get("/kafka-async-ack", summary="Kafka async-ack sender metrics")
+async def kafka_async_ack_metrics() -> dict:
+    """
+    In-flight, delivered and failed counters of the 202 Accepted ingest mode.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.kafka_async_ack_enabled,
+        **async_ack_sender.stats(),
+    }
+
+
+@router.get("/kafka-batching", summary="Kafka producer batching metrics")
+async def kafka_batching_metrics() -> dict:
+    """
+    Compression choice, current linger/batch size and the load behind them.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.kafka_adaptive_batching_enabled,
+        **batching_controller.stats(),
+    }
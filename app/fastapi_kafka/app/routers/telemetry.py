@@ -5,6 +5,7 @@ import hashlib
 import hmac
 import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
@@ -16,6 +17,7 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Response,
     status,
 )
 
@@ -23,16 +25,27 @@ from sqlalchemy import select, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import device_filter, etag_matches, format_etag, latest_keys, latest_version
 from ..db import get_db, redis_client
 from ..models import DeviceRegistry, TelemetryEvent, TelemetryLatest
 from ..schemas import (
     TelemetryCreate,
     TelemetryItem,
     TelemetryCountItem,
+    TelemetryTotalCountItem,
     TelemetryLatestItem,
+    TelemetryBatchItemResult,
+    TelemetryBatchResult,
 )
 
-from ..mq import get_producer
+from ..mq import (
+    MESSAGE_HEADERS,
+    InFlightLimitReached,
+    async_ack_sender,
+    batching_controller,
+    get_producer,
+    send_batch_and_wait,
+)
 from ..config import get_settings
 
 from aiokafka import AIOKafkaProducer
@@ -52,8 +65,16 @@ logger = logging.getLogger(__name__)
 DEFAULT_LATEST_SECONDS = 1800       # 30 minutes
 MAX_LATEST_SECONDS = 24 * 3600      # 24 hours
 
+MAX_BATCH_ITEMS = 1000              # Max points per batch ingestion request
+
 TELEMETRY_CACHE_TTL_SECONDS = 3600    # Short TTL to limit staleness
 
+# Core column list: authentication selects plain rows, not ORM instances
+DEVICE_AUTH_COLUMNS = (
+    DeviceRegistry.device_uuid,
+    DeviceRegistry.api_key_hash,
+)
+
 
 # ============================================================
 # Helper functions
@@ -134,6 +155,7 @@ async def get_authenticated_device(
     Authenticate a device using its UUID and API key.
 
     Steps:
+    0. Reject UUIDs the device filter proves are not registered.
     1. Look up the device by device_uuid in DeviceRegistry.
     2. Verify the provided API key against the stored hash.
     3. Return the DeviceRegistry ORM instance on success.
@@ -147,6 +169,17 @@ async def get_authenticated_device(
         extra={"device_uuid": str(device_uuid)},
     )
 
+    # reject unregistered devices without any backend I/O
+    if settings.device_filter_enabled and not device_filter.might_contain(device_uuid):
+        logger.debug(
+            "Device rejected by device filter",
+            extra={"device_uuid": str(device_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Device not found.",
+        )
+
     device_uuid_str = str(device_uuid)
     cache_key = f"device:registry:{device_uuid_str}"
     device = None
@@ -191,13 +224,13 @@ async def get_authenticated_device(
             extra={"device_uuid": device_uuid_str},
         )
 
-        stmt = select(DeviceRegistry).where(
+        stmt = select(*DEVICE_AUTH_COLUMNS).where(
             DeviceRegistry.device_uuid == device_uuid
         )
 
         try:
             result = await db.execute(stmt)
-            device = result.scalar_one_or_none()
+            row = result.one_or_none()
         except SQLAlchemyError as exc:
             logger.exception(
                 "Database error while authenticating device",
@@ -208,7 +241,7 @@ async def get_authenticated_device(
                 detail="Failed to authenticate device.",
             ) from exc
 
-        if device is None:
+        if row is None:
             logger.warning(
                 "Device not found in registry",
                 extra={"device_uuid": device_uuid_str},
@@ -218,6 +251,12 @@ async def get_authenticated_device(
                 detail="Device not found.",
             )
 
+        # transient instance: not tracked by the session's identity map
+        device = DeviceRegistry(
+            device_uuid=row.device_uuid,
+            api_key_hash=row.api_key_hash,
+        )
+
         # Cache in Redis
         try:
             device_data = {
@@ -269,9 +308,13 @@ async def get_authenticated_device(
 @router.get(
     "/count",
     summary="Get telemetry registry statistics",
-    description="Return high-level statistics about telemetry storage.",
+    description=(
+        "Return the total number of stored telemetry events, as last synced to Redis "
+        "by the worker, and the time it was taken (`as_of`)."
+    ),
+    response_model=TelemetryTotalCountItem,
 )
-async def get_telemetry_count() -> dict[str, int]:
+async def get_telemetry_count() -> TelemetryTotalCountItem:
     """
     Return telemetry count from Redis (read model).
     """
@@ -279,12 +322,12 @@ async def get_telemetry_count() -> dict[str, int]:
     logger.debug("Fetching telemetry count from Redis")
 
     try:
-        value = await redis_client.get("telemetry:count")
+        value, as_of = await redis_client.mget("telemetry:count", "telemetry:count:as_of")
 
         if value is None:
             # If Redis key missing: worker may not have synced yet
             logger.warning("Redis telemetry:count key not found")
-            return {"telemetry_count": 0}
+            return TelemetryTotalCountItem(telemetry_count=0)
 
         telemetry_count = int(value)
 
@@ -300,7 +343,7 @@ async def get_telemetry_count() -> dict[str, int]:
         extra={"telemetry_count": telemetry_count},
     )
 
-    return {"telemetry_count": telemetry_count}
+    return TelemetryTotalCountItem(telemetry_count=telemetry_count, as_of=as_of)
 
 
 # # ============================================================
@@ -475,10 +518,25 @@ async def get_telemetry_count() -> dict[str, int]:
 @router.post(
     "/{device_uuid}",
     summary="Ingest telemetry for a device",
+    description=(
+        "Publish a single telemetry event for a device to Kafka. By default the "
+        "response (201) is sent after the broker acknowledges the write.\n\n"
+        "With `KAFKA_ASYNC_ACK_ENABLED`, the event is only buffered in the producer "
+        "and the response is `202 Accepted`; delivery failures are reported through "
+        "`/metrics/kafka-async-ack` rather than to the client. When too many sends "
+        "are in flight the request is rejected with 503."
+    ),
     response_model=TelemetryItem,
     status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_202_ACCEPTED: {
+            "model": TelemetryItem,
+            "description": "Buffered for delivery (async-ack mode).",
+        },
+    },
 )
 async def create_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     payload: TelemetryCreate = Body(
         description="Telemetry payload containing coordinates and optional device timestamp.",
@@ -498,11 +556,40 @@ async def create_telemetry_for_device(
 
     topic = settings.kafka.topic
     key = str(device.device_uuid).encode("utf-8")
-    value = item.model_dump(mode="json")
+
+    # ---- Kafka publish (async ack) ----
+    if settings.kafka_async_ack_enabled:
+        try:
+            await async_ack_sender.send(producer, topic, value=item, key=key)
+        except InFlightLimitReached as exc:
+            logger.warning(
+                "Kafka in-flight limit reached, shedding request",
+                extra={"device_uuid": str(device.device_uuid), "topic": topic},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Telemetry ingest is overloaded. Retry later.",
+            ) from exc
+        except Exception as exc:
+            logger.exception(
+                "Failed to buffer telemetry for Kafka",
+                extra={"device_uuid": str(device.device_uuid), "topic": topic},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Failed to enqueue telemetry event.",
+            ) from exc
+
+        response.status_code = status.HTTP_202_ACCEPTED
+        return item
 
     # ---- Kafka publish ----
     try:
-        md = await producer.send_and_wait(topic, value=value, key=key)
+        started = time.perf_counter()
+        md = await producer.send_and_wait(
+            topic, value=item, key=key, headers=MESSAGE_HEADERS)
+        batching_controller.observe(
+            1, md.serialized_value_size, time.perf_counter() - started)
         logger.info(
             "Telemetry enqueued",
             extra={
@@ -534,6 +621,94 @@ async def create_telemetry_for_device(
     return item
 
 
+# ============================================================
+# POST /telemetry/{device_uuid}/batch
+# ============================================================
+@router.post(
+    "/{device_uuid}/batch",
+    summary="Ingest a batch of telemetry for a device",
+    description=(
+        "Ingest an array of telemetry events for a specific device identified by its UUID. "
+        "The device authenticates once using the `X-API-Key` header and all points are "
+        "published to Kafka as a single record batch keyed by the device UUID.\n\n"
+        f"At most {MAX_BATCH_ITEMS} points are accepted per request. Every point receives "
+        "the same `system_time_utc`; points without `device_time` default to it."
+    ),
+    response_model=TelemetryBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_telemetry_batch_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    payload: list[TelemetryCreate] = Body(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Array of telemetry payloads, each with coordinates and optional device timestamp.",
+    ),
+    producer: AIOKafkaProducer = Depends(get_producer),
+) -> TelemetryBatchResult:
+    now_utc = datetime.now(timezone.utc)
+
+    items = [
+        TelemetryItem(
+            device_uuid=device.device_uuid,
+            x_coord=point.x_coord,
+            y_coord=point.y_coord,
+            device_time=point.device_time or now_utc,
+            system_time_utc=now_utc,
+        )
+        for point in payload
+    ]
+
+    topic = settings.kafka.topic
+    key = str(device.device_uuid).encode("utf-8")
+
+    # ---- Kafka publish ----
+    try:
+        positions = await send_batch_and_wait(producer, topic, key, items)
+        logger.info(
+            "Telemetry batch enqueued",
+            extra={
+                "device_uuid": str(device.device_uuid),
+                "topic": topic,
+                "batch_size": len(items),
+                "partition": positions[0][0],
+            },
+        )
+    except KafkaError as exc:
+        logger.exception(
+            "Kafka batch publish failed",
+            extra={"device_uuid": str(device.device_uuid), "topic": topic},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to enqueue telemetry batch.",
+        ) from exc
+    except Exception as exc:
+        logger.exception(
+            "Unexpected error while publishing batch to Kafka",
+            extra={"device_uuid": str(device.device_uuid), "topic": topic},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Failed to enqueue telemetry batch.",
+        ) from exc
+
+    return TelemetryBatchResult(
+        device_uuid=device.device_uuid,
+        accepted=len(items),
+        results=[
+            TelemetryBatchItemResult(
+                index=index,
+                status="enqueued",
+                item=item,
+                partition=partition,
+                offset=offset,
+            )
+            for index, (item, (partition, offset)) in enumerate(zip(items, positions))
+        ],
+    )
+
+
 # ============================================================
 # GET /telemetry/latest/{device_uuid}
 # ============================================================
@@ -543,20 +718,31 @@ async def create_telemetry_for_device(
     description=(
         "Return the latest known position for a specific device, identified by its UUID. "
         "The device must authenticate using the `X-API-Key` header.\n\n"
-        "This endpoint reads from Redis only (read model)."
+        "This endpoint reads from Redis only (read model).\n\n"
+        "Responses carry a strong `ETag` derived from the snapshot version. Send it back "
+        "in `If-None-Match` to get `304 Not Modified` while the snapshot is unchanged."
     ),
     response_model=TelemetryLatestItem,
+    responses={304: {"description": "Snapshot unchanged since the given ETag."}},
 )
 async def get_latest_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
+    if_none_match: str | None = Header(
+        default=None,
+        description="ETag from a previous response.",
+    ),
 ) -> TelemetryLatestItem:
     """
     Return the latest telemetry snapshot for the authenticated device from Redis only.
 
+    With If-None-Match, the worker's :ver key is checked first and a 304 is
+    returned from it alone, without reading or serializing the payload.
+
     If the Redis key is missing (worker not synced yet), returns 404.
     """
     device_uuid_str = str(device.device_uuid)
-    cache_key = f"telemetry:latest:{device_uuid_str}"
+    cache_key, ver_key = latest_keys(device_uuid_str)
 
     logger.debug(
         "Fetching latest telemetry snapshot from Redis",
@@ -564,7 +750,16 @@ async def get_latest_telemetry_for_device(
     )
 
     try:
-        cached = await redis_client.get(cache_key)
+        # Conditional GET: answer from the version key alone
+        if if_none_match:
+            version = await redis_client.get(ver_key)
+            if version and etag_matches(if_none_match, format_etag(version)):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": format_etag(version)},
+                )
+
+        cached, version = await redis_client.mget(cache_key, ver_key)
     except Exception as exc:
         logger.exception(
             "Redis error while fetching latest telemetry",
@@ -607,6 +802,7 @@ async def get_latest_telemetry_for_device(
         },
     )
 
+    response.headers["ETag"] = format_etag(version or latest_version(item.system_time_utc))
     return item
 
 
@@ -1,6 +1,13 @@
 # schemas/__init__.py
 from .device_registry import DeviceRegistryItem
-from .telemetry_event import TelemetryItem, TelemetryCreate, TelemetryCountItem
+from .telemetry_event import (
+    TelemetryItem,
+    TelemetryCreate,
+    TelemetryCountItem,
+    TelemetryTotalCountItem,
+    TelemetryBatchItemResult,
+    TelemetryBatchResult,
+)
 from .telemetry_latest import TelemetryLatestItem
 
 __all__ = [
@@ -8,5 +15,8 @@ __all__ = [
     "TelemetryItem",
     "TelemetryCreate",
     "TelemetryCountItem",
+    "TelemetryTotalCountItem",
+    "TelemetryBatchItemResult",
+    "TelemetryBatchResult",
     "TelemetryLatestItem",
 ]
@@ -0,0 +1,44 @@
+# tests/test_async_ack.py
+import asyncio
+
+import pytest
+
+from app.mq import AsyncAckSender, InFlightLimitReached
+
+
+class FakeProducer:
+    """Producer whose sends stay pending until the test resolves them."""
+
+    def __init__(self):
+        self.futures = []
+
+    async def send(self, topic, value=None, key=None, headers=None):
+        future = asyncio.get_running_loop().create_future()
+        self.futures.append(future)
+        return future
+
+
+def test_async_ack_sheds_at_cap_and_counts_deliveries():
+    async def scenario():
+        sender = AsyncAckSender(max_in_flight=2)
+        producer = FakeProducer()
+
+        await sender.send(producer, "telemetry", value={}, key=b"a")
+        await sender.send(producer, "telemetry", value={}, key=b"b")
+        with pytest.raises(InFlightLimitReached):
+            await sender.send(producer, "telemetry", value={}, key=b"c")
+
+        producer.futures[0].set_result(None)
+        producer.futures[1].set_exception(RuntimeError("broker down"))
+        await asyncio.sleep(0)
+
+        await sender.send(producer, "telemetry", value={}, key=b"d")
+        return sender.stats()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["shed"] == 1
+    assert stats["delivered"] == 1
+    assert stats["failed"] == 1
+    assert stats["in_flight"] == 1
+    assert "broker down" in stats["last_error"]
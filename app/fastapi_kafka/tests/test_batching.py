@@ -0,0 +1,62 @@
+# tests/test_batching.py
+import asyncio
+import time
+
+from app.mq import BatchingController, benchmark_codecs
+from app.mq.kafka_producer import serialize_value
+
+
+def build_controller() -> BatchingController:
+    return BatchingController(
+        topic="telemetry",
+        linger_ms_min=0,
+        linger_ms_max=50,
+        batch_size_min=16_384,
+        batch_size_max=1_048_576,
+        latency_target_ms=50,
+        interval_seconds=5,
+    )
+
+
+def test_idle_traffic_uses_minimum_linger():
+    controller = build_controller()
+    controller._window_started = time.monotonic() - 1
+    controller.observe(10, 1_500)
+
+    controller.tick(partitions=1)
+
+    assert controller.linger_ms == 0
+    assert controller.batch_size == 16_384
+
+
+def test_busy_traffic_lingers_and_grows_batches():
+    controller = build_controller()
+    controller.linger_ms = 10
+    controller._window_started = time.monotonic() - 1
+    controller.observe(20_000, 4_000_000, latency_seconds=0.005)
+
+    controller.tick(partitions=1)
+
+    assert controller.batch_size == 32_768
+    assert 0 < controller.linger_ms <= 50
+
+
+def test_codec_benchmark_reports_available_codecs():
+    chosen, results = benchmark_codecs(serialize_value, min_mb_per_s=0.001)
+
+    assert "gzip" in results
+    assert chosen in {"none", *results}
+
+
+class LegacyProducer:
+    """Producer without the aiokafka internals the controller tunes."""
+
+
+def test_missing_aiokafka_internals_disable_the_controller():
+    controller = build_controller()
+
+    asyncio.run(controller.start(LegacyProducer()))
+
+    stats = controller.stats()
+    assert stats["running"] is False
+    assert "_linger_time" in stats["disabled_reason"]
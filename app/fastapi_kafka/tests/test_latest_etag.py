@@ -0,0 +1,78 @@
+# tests/test_latest_etag.py
+import json
+from types import SimpleNamespace
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.routers import telemetry
+
+DEVICE_UUID = UUID(int=7)
+DATA_KEY = f"telemetry:latest:{DEVICE_UUID}"
+PAYLOAD = json.dumps({
+    "device_uuid": str(DEVICE_UUID),
+    "alias": None,
+    "x_coord": 1.0,
+    "y_coord": 2.0,
+    "device_time": "2025-11-17T12:00:00+00:00",
+    "system_time_utc": "2025-11-17T12:00:00.123000+00:00",
+})
+
+
+class FakeRedis:
+    def __init__(self, store):
+        self.store = store
+        self.reads = []
+
+    async def get(self, key):
+        self.reads.append(key)
+        return self.store.get(key)
+
+    async def mget(self, *keys):
+        self.reads.extend(keys)
+        return [self.store.get(k) for k in keys]
+
+
+def get_client(monkeypatch, store):
+    redis = FakeRedis(store)
+    monkeypatch.setattr(telemetry, "redis_client", redis)
+    main.app.dependency_overrides[telemetry.get_authenticated_device] = (
+        lambda: SimpleNamespace(device_uuid=DEVICE_UUID)
+    )
+    return TestClient(main.app), redis
+
+
+def test_unchanged_snapshot_returns_304_from_version_key(monkeypatch):
+    client, redis = get_client(monkeypatch, {DATA_KEY: PAYLOAD, f"{DATA_KEY}:ver": "1763380800123"})
+    try:
+        first = client.get(f"/api/telemetry/latest/{DEVICE_UUID}")
+        assert first.status_code == 200
+        assert first.headers["ETag"] == '"1763380800123"'
+
+        redis.reads.clear()
+        second = client.get(
+            f"/api/telemetry/latest/{DEVICE_UUID}",
+            headers={"If-None-Match": first.headers["ETag"]},
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert second.status_code == 304
+    assert second.content == b""
+    assert redis.reads == [f"{DATA_KEY}:ver"]
+
+
+def test_stale_etag_gets_full_snapshot(monkeypatch):
+    client, _ = get_client(monkeypatch, {DATA_KEY: PAYLOAD, f"{DATA_KEY}:ver": "1763380800123"})
+    try:
+        resp = client.get(
+            f"/api/telemetry/latest/{DEVICE_UUID}",
+            headers={"If-None-Match": '"1"'},
+        )
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert resp.status_code == 200
+    assert resp.json()["x_coord"] == 1.0
+    assert resp.headers["ETag"] == '"1763380800123"'
@@ -0,0 +1,44 @@
+# tests/test_telemetry_codec.py
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.mq.telemetry_codec import (
+    CODEC_BINARY,
+    CODEC_JSON,
+    codec_headers,
+    decode_binary,
+    encode_binary,
+    header_codec,
+)
+
+
+def test_binary_round_trip_preserves_values():
+    device_uuid = uuid4()
+    device_time = datetime(2025, 11, 17, 12, 34, 56, 123456, tzinfo=timezone.utc)
+    system_time = datetime.now(timezone.utc)
+
+    data = encode_binary(device_uuid, 1.2345, -6.789, device_time, system_time)
+
+    assert len(data) == 49
+    assert decode_binary(data) == {
+        "device_uuid": device_uuid,
+        "x_coord": 1.2345,
+        "y_coord": -6.789,
+        "device_time": device_time,
+        "system_time_utc": system_time,
+    }
+
+
+def test_binary_rejects_unknown_version():
+    data = bytearray(encode_binary(uuid4(), 0.0, 0.0, datetime.now(timezone.utc), datetime.now(timezone.utc)))
+    data[0] = 99
+
+    with pytest.raises(ValueError):
+        decode_binary(bytes(data))
+
+
+def test_missing_codec_header_means_json():
+    assert header_codec(None) == CODEC_JSON
+    assert header_codec(codec_headers(CODEC_BINARY)) == CODEC_BINARY
@@ -0,0 +1,49 @@
+# cache/__init__.py
+from .buckets import TelemetryBucketCache, telemetry_bucket_cache
+from .device_filter import BloomFilter, DeviceFilter, device_filter
+from .latest import (
+    etag_matches,
+    format_etag,
+    latest_keys,
+    latest_payload,
+    latest_version,
+    set_latest_if_newer,
+)
+from .recent import (
+    RecentEntry,
+    discard_recent_entries,
+    push_recent_entries,
+    read_recent_entries,
+    recent_entry_payload,
+    recent_key,
+    select_recent_window,
+)
+from .spatial import SpatialEntry, SpatialIndex, UniformGrid, spatial_index
+from .write_behind import TelemetryCacheWriter, telemetry_cache_writer
+
+__all__ = [
+    "TelemetryBucketCache",
+    "telemetry_bucket_cache",
+    "BloomFilter",
+    "DeviceFilter",
+    "device_filter",
+    "etag_matches",
+    "format_etag",
+    "latest_keys",
+    "latest_payload",
+    "latest_version",
+    "set_latest_if_newer",
+    "RecentEntry",
+    "discard_recent_entries",
+    "push_recent_entries",
+    "read_recent_entries",
+    "recent_entry_payload",
+    "recent_key",
+    "select_recent_window",
+    "SpatialEntry",
+    "SpatialIndex",
+    "UniformGrid",
+    "spatial_index",
+    "TelemetryCacheWriter",
+    "telemetry_cache_writer",
+]
@@ -0,0 +1,241 @@
+# app/cache/buckets.py
+from __future__ import annotations
+
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..db import redis_client
+from ..models import TelemetryEvent
+from ..schemas import TelemetryItem
+from .recent import RecentEntry, recent_entry_payload
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+FIRST_CHUNK_BUCKETS = 4     # Buckets read in the first round trip of a request
+MAX_CHUNK_BUCKETS = 64      # Chunks double up to this many buckets
+
+BUCKET_COLUMNS = (
+    TelemetryEvent.device_uuid,
+    TelemetryEvent.x_coord,
+    TelemetryEvent.y_coord,
+    TelemetryEvent.device_time,
+    TelemetryEvent.system_time_utc,
+    TelemetryEvent.id,
+)
+
+
+class TelemetryBucketCache:
+    """
+    Per-device telemetry cache split into fixed time buckets.
+
+    - A bucket holds every event of one device whose system_time_utc falls
+      in [start, start + bucket_seconds), stored under
+      telemetry:bucket:{device_uuid}:{bucket_seconds}:{start}.
+    - Buckets that ended more than grace_seconds ago are closed: immutable,
+      cached for ttl_seconds and shared by every window that touches them.
+    - The open bucket (and any inside the grace period) is always read live.
+    - Reads walk buckets newest first in growing chunks, one MGET per chunk,
+      and stop as soon as the limit is reached.
+
+    Events committed later than grace_seconds after their system_time_utc
+    are missing from an already cached bucket until it expires.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_seconds: int,
+        grace_seconds: float,
+        ttl_seconds: int,
+        max_buckets: int,
+    ) -> None:
+        self.bucket_seconds = bucket_seconds
+        self.grace_seconds = grace_seconds
+        self.ttl_seconds = ttl_seconds
+        self.max_buckets = max_buckets
+
+        # metrics
+        self.reads = 0
+        self.fallbacks = 0
+        self.bucket_hits = 0
+        self.bucket_misses = 0
+        self.live_buckets = 0
+        self.keys_written = 0
+        self.write_errors = 0
+
+    def bucket_of(self, ts: datetime) -> int:
+        """Start (Unix seconds) of the bucket containing ts."""
+        return int(ts.timestamp()) // self.bucket_seconds * self.bucket_seconds
+
+    def key(self, device_uuid: UUID, bucket: int) -> str:
+        return f"telemetry:bucket:{device_uuid}:{self.bucket_seconds}:{bucket}"
+
+    # ------------------------------
+    # Read path
+    # ------------------------------
+    async def read(
+        self,
+        db: AsyncSession,
+        device_uuid: UUID,
+        *,
+        start_time: datetime,
+        end_time: datetime,
+        limit: int,
+        after: Optional[tuple[datetime, int]] = None,
+    ) -> Optional[list[RecentEntry]]:
+        """
+        Return up to `limit` events of the window newest first, strictly
+        before `after` when given.
+
+        Returns None when the window spans more than max_buckets or Redis
+        is unavailable; the caller then queries Postgres directly.
+        """
+        upper = min(end_time, after[0]) if after is not None else end_time
+        if upper < start_time:
+            return []
+
+        first, last = self.bucket_of(upper), self.bucket_of(start_time)
+        if (first - last) // self.bucket_seconds + 1 > self.max_buckets:
+            self.fallbacks += 1
+            return None
+
+        self.reads += 1
+        closed_until = datetime.now(timezone.utc).timestamp() - self.grace_seconds
+        buckets = list(range(first, last - 1, -self.bucket_seconds))
+
+        collected: list[RecentEntry] = []
+        chunk_size = FIRST_CHUNK_BUCKETS
+        while buckets and len(collected) < limit:
+            chunk, buckets = buckets[:chunk_size], buckets[chunk_size:]
+            chunk_size = min(chunk_size * 2, MAX_CHUNK_BUCKETS)
+
+            entries = await self._read_chunk(db, device_uuid, chunk, closed_until)
+            if entries is None:
+                self.fallbacks += 1
+                return None
+
+            collected.extend(
+                e for e in entries
+                if start_time <= e.system_time_utc <= end_time
+                and (after is None or (e.system_time_utc, e.id) < after)
+            )
+
+        return collected[:limit]
+
+    async def _read_chunk(
+        self,
+        db: AsyncSession,
+        device_uuid: UUID,
+        chunk: list[int],
+        closed_until: float,
+    ) -> Optional[list[RecentEntry]]:
+        """All events of the given buckets, newest first; None on Redis errors."""
+        closed = [b for b in chunk if b + self.bucket_seconds <= closed_until]
+        live = [b for b in chunk if b + self.bucket_seconds > closed_until]
+        try:
+            cached = await redis_client.mget([self.key(device_uuid, b) for b in closed]) if closed else []
+        except Exception:
+            logger.warning(
+                "Failed to read telemetry buckets, falling back to DB",
+                extra={"device_uuid": str(device_uuid)},
+            )
+            return None
+
+        entries: list[RecentEntry] = []
+        missing: list[int] = []
+        for bucket, payload in zip(closed, cached):
+            if payload is None:
+                missing.append(bucket)
+                continue
+            entries.extend(
+                RecentEntry(TelemetryItem.model_validate(data), int(data["id"]))
+                for data in json.loads(payload)
+            )
+
+        self.bucket_hits += len(closed) - len(missing)
+        self.bucket_misses += len(missing)
+        self.live_buckets += len(live)
+
+        if live or missing:
+            fetched = await self._fetch(db, device_uuid, live + missing)
+            for bucket_entries in fetched.values():
+                entries.extend(bucket_entries)
+            await self._store(device_uuid, {b: fetched.get(b, []) for b in missing})
+
+        entries.sort(key=lambda e: (e.system_time_utc, e.id), reverse=True)
+        return entries
+
+    async def _fetch(
+        self,
+        db: AsyncSession,
+        device_uuid: UUID,
+        buckets: list[int],
+    ) -> dict[int, list[RecentEntry]]:
+        """Load the given buckets from Postgres in one range query."""
+        stmt = select(*BUCKET_COLUMNS).where(
+            TelemetryEvent.device_uuid == device_uuid,
+            TelemetryEvent.system_time_utc >= datetime.fromtimestamp(min(buckets), timezone.utc),
+            TelemetryEvent.system_time_utc < datetime.fromtimestamp(
+                max(buckets) + self.bucket_seconds, timezone.utc,
+            ),
+        )
+        wanted = set(buckets)
+        grouped: dict[int, list[RecentEntry]] = defaultdict(list)
+        for row in (await db.execute(stmt)).all():
+            bucket = self.bucket_of(row.system_time_utc)
+            if bucket in wanted:
+                grouped[bucket].append(RecentEntry(TelemetryItem.model_validate(row), row.id))
+        return grouped
+
+    async def _store(self, device_uuid: UUID, buckets: dict[int, list[RecentEntry]]) -> None:
+        """Cache closed buckets, including empty ones, in one pipeline."""
+        if not buckets:
+            return
+        pipe = redis_client.pipeline(transaction=False)
+        for bucket, entries in buckets.items():
+            payload = "[" + ",".join(recent_entry_payload(e.item, e.id) for e in entries) + "]"
+            pipe.set(self.key(device_uuid, bucket), payload, ex=self.ttl_seconds)
+        try:
+            await pipe.execute()
+            self.keys_written += len(buckets)
+        except Exception:
+            self.write_errors += 1
+            logger.warning(
+                "Failed to write telemetry buckets to Redis cache",
+                extra={"device_uuid": str(device_uuid)},
+            )
+
+    def stats(self) -> dict:
+        """Snapshot of bucket cache metrics."""
+        looked_up = self.bucket_hits + self.bucket_misses
+        return {
+            "bucket_seconds": self.bucket_seconds,
+            "grace_seconds": self.grace_seconds,
+            "ttl_seconds": self.ttl_seconds,
+            "reads": self.reads,
+            "fallbacks": self.fallbacks,
+            "bucket_hits": self.bucket_hits,
+            "bucket_misses": self.bucket_misses,
+            "hit_rate": round(self.bucket_hits / looked_up, 4) if looked_up else None,
+            "live_buckets": self.live_buckets,
+            "keys_written": self.keys_written,
+            "write_errors": self.write_errors,
+        }
+
+
+telemetry_bucket_cache = TelemetryBucketCache(
+    bucket_seconds=settings.list_bucket_seconds,
+    grace_seconds=settings.list_bucket_grace_seconds,
+    ttl_seconds=settings.list_bucket_ttl_seconds,
+    max_buckets=settings.list_bucket_max_buckets,
+)
@@ -0,0 +1,267 @@
+# app/cache/device_filter.py
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from ..config import get_settings
+from ..db import async_session_maker
+from ..models import DeviceRegistry
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Re-read a small window behind the watermark so rows committed late with an
+# earlier created_at (now() is transaction start time) are not missed.
+DELTA_OVERLAP_SECONDS = 5.0
+
+# Size new filters for growth so registrations between rebuilds keep the
+# false-positive rate near its target.
+CAPACITY_HEADROOM = 1.5
+MIN_CAPACITY = 1024
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over device UUIDs.
+
+    Uses double hashing over a single blake2b digest: h_i = h1 + i * h2 (mod m).
+    No false negatives; false-positive rate is bounded by the sizing target
+    while the number of items stays under capacity.
+    """
+
+    __slots__ = ("capacity", "false_positive_rate", "num_bits", "num_hashes", "count", "_bits")
+
+    def __init__(self, capacity: int, false_positive_rate: float) -> None:
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(num_bits, 8)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, device_uuid: UUID) -> Iterable[int]:
+        digest = hashlib.blake2b(device_uuid.bytes, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self.num_bits
+        return ((h1 + i * h2) % m for i in range(self.num_hashes))
+
+    def add(self, device_uuid: UUID) -> None:
+        bits = self._bits
+        for pos in self._positions(device_uuid):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, device_uuid: UUID) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(device_uuid))
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+
+class DeviceFilter:
+    """
+    Negative-lookup filter over registered device UUIDs.
+
+    - Rebuilt from app.device_registry at startup and periodically.
+    - New registrations are added by delta queries on created_at.
+    - Fails open: until the first successful build, and whenever the last
+      successful refresh is older than max_staleness, every UUID is allowed.
+    """
+
+    def __init__(
+        self,
+        *,
+        false_positive_rate: float,
+        refresh_seconds: float,
+        rebuild_seconds: float,
+        max_staleness_seconds: float,
+    ) -> None:
+        self.false_positive_rate = false_positive_rate
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self.max_staleness_seconds = max_staleness_seconds
+
+        self._bloom: Optional[BloomFilter] = None
+        self._watermark: Optional[datetime] = None
+        self._last_rebuild_at: Optional[float] = None  # monotonic
+        self._last_refresh_at: Optional[float] = None  # monotonic, rebuild or delta
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.checks = 0
+        self.rejected = 0
+        self.stale_bypasses = 0
+        self.rebuilds = 0
+        self.refresh_errors = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._bloom is not None
+
+    @property
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the last successful rebuild or delta refresh; None if never built."""
+        if self._last_refresh_at is None:
+            return None
+        return time.monotonic() - self._last_refresh_at
+
+    def might_contain(self, device_uuid: UUID) -> bool:
+        """
+        Return False only when the device is definitely not registered.
+
+        A stale filter may be missing recent registrations, so it answers True
+        and leaves the decision to the database.
+        """
+        bloom = self._bloom
+        if bloom is None:
+            return True
+
+        staleness = self.staleness_seconds
+        if staleness is None or staleness > self.max_staleness_seconds:
+            self.stale_bypasses += 1
+            return True
+
+        self.checks += 1
+        if device_uuid in bloom:
+            return True
+
+        self.rejected += 1
+        return False
+
+    def add(self, device_uuid: UUID) -> None:
+        """Register a device UUID (e.g., right after a registration)."""
+        if self._bloom is not None:
+            self._bloom.add(device_uuid)
+
+    # ------------------------------
+    # Refresh path
+    # ------------------------------
+    async def rebuild(self) -> int:
+        """Build a new filter from every registered device UUID and swap it in."""
+        async with async_session_maker() as session:
+            result = await session.execute(
+                select(func.count(), func.max(DeviceRegistry.created_at))
+                .select_from(DeviceRegistry)
+            )
+            total, watermark = result.one()
+
+            bloom = BloomFilter(
+                capacity=max(MIN_CAPACITY, int(total * CAPACITY_HEADROOM)),
+                false_positive_rate=self.false_positive_rate,
+            )
+
+            stream = await session.stream_scalars(
+                select(DeviceRegistry.device_uuid).execution_options(yield_per=10_000)
+            )
+            async for device_uuid in stream:
+                bloom.add(device_uuid)
+
+        self._bloom = bloom
+        self._watermark = watermark or self._watermark
+        self._last_rebuild_at = self._last_refresh_at = time.monotonic()
+        self.rebuilds += 1
+
+        logger.info(
+            "Device filter rebuilt, devices=%d bits=%d hashes=%d",
+            bloom.count, bloom.num_bits, bloom.num_hashes,
+        )
+        return bloom.count
+
+    async def refresh_delta(self) -> int:
+        """Add devices registered since the last watermark."""
+        if self._bloom is None or self._watermark is None:
+            return await self.rebuild()
+
+        since = self._watermark - timedelta(seconds=DELTA_OVERLAP_SECONDS)
+        stmt = (
+            select(DeviceRegistry.device_uuid, DeviceRegistry.created_at)
+            .where(DeviceRegistry.created_at >= since)
+        )
+
+        async with async_session_maker() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        for row in rows:
+            self._bloom.add(row.device_uuid)
+            if row.created_at > self._watermark:
+                self._watermark = row.created_at
+
+        self._last_refresh_at = time.monotonic()
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                last = self._last_rebuild_at
+                if last is None or time.monotonic() - last >= self.rebuild_seconds:
+                    await self.rebuild()
+                else:
+                    await self.refresh_delta()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.refresh_errors += 1
+                logger.exception("Device filter refresh failed")
+
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def start(self) -> None:
+        """Start the background refresh loop (initial build happens on first tick)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    def stats(self) -> dict:
+        """Snapshot of filter metrics."""
+        bloom = self._bloom
+        staleness = self.staleness_seconds
+        return {
+            "ready": bloom is not None,
+            "devices": bloom.count if bloom else 0,
+            "capacity": bloom.capacity if bloom else 0,
+            "size_bytes": bloom.size_bytes if bloom else 0,
+            "hashes": bloom.num_hashes if bloom else 0,
+            "false_positive_rate": self.false_positive_rate,
+            "checks": self.checks,
+            "rejected": self.rejected,
+            "stale_bypasses": self.stale_bypasses,
+            "rebuilds": self.rebuilds,
+            "refresh_errors": self.refresh_errors,
+            "staleness_seconds": round(staleness, 3) if staleness is not None else None,
+        }
+
+
+device_filter = DeviceFilter(
+    false_positive_rate=settings.device_filter_false_positive_rate,
+    refresh_seconds=settings.device_filter_refresh_seconds,
+    rebuild_seconds=settings.device_filter_rebuild_seconds,
+    max_staleness_seconds=settings.device_filter_max_staleness_seconds,
+)
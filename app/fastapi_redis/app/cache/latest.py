@@ -0,0 +1,89 @@
+# app/cache/latest.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from ..db import redis_client
+from ..schemas import TelemetryItem, TelemetryLatestItem
+
+LATEST_KEY_PREFIX = "telemetry:latest"
+
+# Same version guard as the Redis worker, plus a TTL, and a rewrite at an
+# equal version when the payload key has expired but its :ver key has not.
+LUA_SET_LATEST_IF_NEWER = """
+local data_key = KEYS[1]
+local ver_key  = KEYS[2]
+local incoming = tonumber(ARGV[1])
+local current  = tonumber(redis.call('GET', ver_key) or '0')
+
+if incoming > current or (incoming == current and redis.call('EXISTS', data_key) == 0) then
+  redis.call('SET', data_key, ARGV[2], 'EX', ARGV[3])
+  redis.call('SET', ver_key, ARGV[1], 'EX', ARGV[3])
+  return 1
+end
+return 0
+"""
+
+_set_latest_script = redis_client.register_script(LUA_SET_LATEST_IF_NEWER)
+
+
+def latest_keys(device_uuid: UUID | str) -> tuple[str, str]:
+    """Payload key and version key of a device's latest snapshot."""
+    data_key = f"{LATEST_KEY_PREFIX}:{device_uuid}"
+    return data_key, f"{data_key}:ver"
+
+
+def latest_version(system_time_utc: datetime) -> int:
+    """Millisecond snapshot version, computed as the Redis worker does."""
+    return int(system_time_utc.timestamp() * 1000)
+
+
+def latest_payload(item: TelemetryItem, alias: Optional[str]) -> str:
+    """
+    Serialize a snapshot for the latest key as TelemetryLatestItem JSON.
+
+    Every writer (API, write-behind writer, Redis worker) stores this shape,
+    so cached payloads can be returned as they are.
+    """
+    return TelemetryLatestItem(alias=alias, **item.model_dump()).model_dump_json()
+
+
+def format_etag(version: int | str) -> str:
+    """Strong ETag for a snapshot version."""
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag.
+
+    If-None-Match uses weak comparison, so W/ prefixes are ignored.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+async def set_latest_if_newer(
+    device_uuid: UUID | str,
+    version: int,
+    payload: str,
+    ttl_seconds: int,
+    client: Any = None,
+) -> Any:
+    """
+    Write a latest snapshot and its version unless Redis holds a newer one.
+
+    Pass a pipeline as `client` to queue the write instead of sending it.
+    """
+    return await _set_latest_script(
+        keys=latest_keys(device_uuid),
+        args=[version, payload, ttl_seconds],
+        client=client,
+    )
@@ -0,0 +1,161 @@
+# app/cache/recent.py
+from __future__ import annotations
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from ..db import redis_client
+from ..schemas import TelemetryItem
+
+logger = logging.getLogger(__name__)
+
+RECENT_KEY_PREFIX = "telemetry:recent"
+RECENT_LIST_MAX = 100       # Entries kept in telemetry:recent:{device_uuid}
+
+# LPUSH + LTRIM that keeps the list gap-free: payloads must not be older (by
+# row id) than the current head. A late write, e.g. a slow flush from another
+# uvicorn worker, deletes the list instead, because trimming after it could
+# evict a newer entry. ARGV: min incoming id, max length, payloads oldest first.
+LUA_PUSH_RECENT = """
+local key  = KEYS[1]
+local head = redis.call('LINDEX', key, 0)
+
+if head then
+  local ok, entry = pcall(cjson.decode, head)
+  local head_id = ok and type(entry) == 'table' and tonumber(entry['id']) or nil
+  if head_id == nil or head_id > tonumber(ARGV[1]) then
+    redis.call('DEL', key)
+    return 0
+  end
+end
+
+for i = 3, #ARGV do
+  redis.call('LPUSH', key, ARGV[i])
+end
+redis.call('LTRIM', key, 0, tonumber(ARGV[2]) - 1)
+return 1
+"""
+
+_push_recent_script = redis_client.register_script(LUA_PUSH_RECENT)
+
+
+class RecentEntry(NamedTuple):
+    """A cached telemetry event with its row id, for keyset cursors."""
+
+    item: TelemetryItem
+    id: int
+
+    @property
+    def system_time_utc(self) -> datetime:
+        return self.item.system_time_utc
+
+
+def recent_entry_payload(item: TelemetryItem, event_id: int) -> str:
+    """Serialize an event for the recent list."""
+    return json.dumps({**item.model_dump(mode="json"), "id": event_id})
+
+
+def recent_key(device_uuid: UUID | str) -> str:
+    """Redis key of a device's recent-events list."""
+    return f"{RECENT_KEY_PREFIX}:{device_uuid}"
+
+
+async def push_recent_entries(
+    device_uuid: UUID | str,
+    payloads: list[str],
+    client: Any = None,
+) -> Any:
+    """
+    Append payloads (oldest first) to a device's recent list.
+
+    Returns 1 when pushed, 0 when the list was deleted instead because the
+    payloads are older than its head. Pass a pipeline as `client` to queue
+    the write instead of sending it.
+    """
+    min_id = min(json.loads(payload)["id"] for payload in payloads)
+    return await _push_recent_script(
+        keys=[recent_key(device_uuid)],
+        args=[min_id, RECENT_LIST_MAX, *payloads],
+        client=client,
+    )
+
+
+async def discard_recent_entries(device_uuid: UUID | str) -> None:
+    """
+    Delete a device's recent list after a failed write (best effort).
+
+    A missed LPUSH would leave a hole readers cannot detect; without the
+    list they fall back to Postgres until new writes rebuild it.
+    """
+    try:
+        await redis_client.delete(recent_key(device_uuid))
+    except Exception:
+        logger.warning(
+            "Failed to discard recent telemetry list",
+            extra={"device_uuid": str(device_uuid)},
+        )
+
+
+def parse_recent_entries(raw: list[bytes | str]) -> list[RecentEntry]:
+    """
+    Parse recent-list payloads, newest first by (system_time_utc, id).
+
+    Returns an empty list if any entry predates the id field or is malformed,
+    so callers fall back to Postgres instead of serving a partial view.
+    """
+    entries: list[RecentEntry] = []
+    for payload in raw:
+        data = json.loads(payload)
+        if "id" not in data:
+            return []
+        entries.append(RecentEntry(TelemetryItem.model_validate(data), int(data["id"])))
+
+    entries.sort(key=lambda e: (e.system_time_utc, e.id), reverse=True)
+    return entries
+
+
+def select_recent_window(
+    entries: list[RecentEntry],
+    start_time: datetime,
+    end_time: datetime,
+    limit: int,
+) -> tuple[list[RecentEntry], bool]:
+    """
+    Pick the entries of a time window from a parsed recent list.
+
+    The list holds every event newer than its oldest entry, so it fully
+    answers the query when it fills `limit` or reaches back past
+    `start_time`. Otherwise only the part of the window older than the
+    last returned entry is missing.
+
+    Writers keep that invariant by deleting the list whenever a write is
+    dropped, fails, or arrives out of order (push_recent_entries).
+
+    Returns:
+        (entries in the window newest first, whether they are the full answer)
+    """
+    if not entries:
+        return [], False
+
+    window = [
+        e for e in entries
+        if start_time <= e.system_time_utc <= end_time
+    ][:limit]
+    complete = len(window) == limit or entries[-1].system_time_utc < start_time
+    return window, complete
+
+
+async def read_recent_entries(device_uuid: UUID) -> list[RecentEntry]:
+    """Read and parse telemetry:recent:{device_uuid}; empty on any Redis error."""
+    try:
+        raw = await redis_client.lrange(recent_key(device_uuid), 0, -1)
+        return parse_recent_entries(raw)
+    except Exception:
+        logger.warning(
+            "Failed to read recent telemetry list, falling back to DB",
+            extra={"device_uuid": str(device_uuid)},
+        )
+        return []
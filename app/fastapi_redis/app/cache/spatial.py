@@ -0,0 +1,322 @@
+# app/cache/spatial.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from datetime import datetime, timedelta
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+
+from ..config import get_settings
+from ..db import async_session_maker
+from ..models import TelemetryLatest
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Re-read a small window behind the watermark so snapshots committed late
+# with an earlier system_time_utc are not missed.
+DELTA_OVERLAP_SECONDS = 5.0
+
+SPATIAL_COLUMNS = (
+    TelemetryLatest.device_uuid,
+    TelemetryLatest.alias,
+    TelemetryLatest.x_coord,
+    TelemetryLatest.y_coord,
+    TelemetryLatest.device_time,
+    TelemetryLatest.system_time_utc,
+)
+
+
+class SpatialEntry(NamedTuple):
+    """A device's latest position, shaped like a telemetry_latest row."""
+
+    device_uuid: UUID
+    alias: Optional[str]
+    x_coord: float
+    y_coord: float
+    device_time: datetime
+    system_time_utc: datetime
+
+
+class UniformGrid:
+    """
+    Uniform grid over device positions.
+
+    Each device lives in the square cell of side cell_size containing it, so
+    a query only visits the cells its box overlaps. When a box spans more
+    cells than are occupied, the occupied cells are scanned instead.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        self.cell_size = cell_size
+        self._entries: dict[UUID, SpatialEntry] = {}
+        self._cells: dict[tuple[int, int], dict[UUID, SpatialEntry]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def cell_count(self) -> int:
+        return len(self._cells)
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def get(self, device_uuid: UUID) -> Optional[SpatialEntry]:
+        return self._entries.get(device_uuid)
+
+    def upsert(self, entry: SpatialEntry) -> bool:
+        """Insert or move a device; older snapshots are ignored."""
+        old = self._entries.get(entry.device_uuid)
+        if old is not None:
+            if old.system_time_utc > entry.system_time_utc:
+                return False
+            old_cell = self._cell(old.x_coord, old.y_coord)
+            cell = self._cells[old_cell]
+            del cell[entry.device_uuid]
+            if not cell:
+                del self._cells[old_cell]
+
+        self._entries[entry.device_uuid] = entry
+        self._cells.setdefault(self._cell(entry.x_coord, entry.y_coord), {})[entry.device_uuid] = entry
+        return True
+
+    def within(
+        self,
+        min_x: float,
+        min_y: float,
+        max_x: float,
+        max_y: float,
+        limit: Optional[int] = None,
+    ) -> list[SpatialEntry]:
+        """Devices inside the box (edges included), at most limit of them."""
+        if not all(map(math.isfinite, (min_x, min_y, max_x, max_y))):
+            # Unbounded box: every occupied cell, filtered by position below
+            cells = self._cells.values()
+        else:
+            lo_cx, lo_cy = self._cell(min_x, min_y)
+            hi_cx, hi_cy = self._cell(max_x, max_y)
+
+            if (hi_cx - lo_cx + 1) * (hi_cy - lo_cy + 1) <= len(self._cells):
+                cells = (
+                    self._cells.get((cx, cy))
+                    for cx in range(lo_cx, hi_cx + 1)
+                    for cy in range(lo_cy, hi_cy + 1)
+                )
+            else:
+                cells = (
+                    cell for (cx, cy), cell in self._cells.items()
+                    if lo_cx <= cx <= hi_cx and lo_cy <= cy <= hi_cy
+                )
+
+        found: list[SpatialEntry] = []
+        for cell in cells:
+            if not cell:
+                continue
+            for entry in cell.values():
+                if min_x <= entry.x_coord <= max_x and min_y <= entry.y_coord <= max_y:
+                    found.append(entry)
+                    if limit is not None and len(found) >= limit:
+                        return found
+        return found
+
+    def nearby(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        limit: Optional[int] = None,
+    ) -> list[tuple[SpatialEntry, float]]:
+        """Devices within radius of (x, y), nearest first, with their distance."""
+        found = []
+        for entry in self.within(x - radius, y - radius, x + radius, y + radius):
+            distance = math.hypot(entry.x_coord - x, entry.y_coord - y)
+            if distance <= radius:
+                found.append((entry, distance))
+
+        found.sort(key=lambda pair: pair[1])
+        return found[:limit] if limit is not None else found
+
+
+class SpatialIndex:
+    """
+    In-process spatial index over app.telemetry_latest positions.
+
+    - Rebuilt from telemetry_latest at startup and periodically, which also
+      drops deleted devices.
+    - Snapshots ingested by this worker are applied immediately; those from
+      other workers arrive by delta queries on system_time_utc.
+    - Not ready (queries are refused) until the first successful build.
+    """
+
+    def __init__(
+        self,
+        *,
+        cell_size: float,
+        refresh_seconds: float,
+        rebuild_seconds: float,
+    ) -> None:
+        self.cell_size = cell_size
+        self.refresh_seconds = refresh_seconds
+        self.rebuild_seconds = rebuild_seconds
+
+        self._grid: Optional[UniformGrid] = None
+        self._watermark: Optional[datetime] = None
+        self._last_rebuild_at: Optional[float] = None  # monotonic
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.queries = 0
+        self.updates = 0
+        self.rebuilds = 0
+        self.refresh_errors = 0
+        self.last_rebuild_ms: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._grid is not None
+
+    def update(
+        self,
+        device_uuid: UUID,
+        x_coord: float,
+        y_coord: float,
+        device_time: datetime,
+        system_time_utc: datetime,
+    ) -> None:
+        """Apply a newly ingested position (keeps the device's alias)."""
+        grid = self._grid
+        if grid is None:
+            return
+
+        old = grid.get(device_uuid)
+        entry = SpatialEntry(
+            device_uuid, old.alias if old else None,
+            x_coord, y_coord, device_time, system_time_utc,
+        )
+        if grid.upsert(entry):
+            self.updates += 1
+
+    def within(
+        self, min_x: float, min_y: float, max_x: float, max_y: float, limit: int,
+    ) -> list[SpatialEntry]:
+        """Bounding-box query; the index must be ready."""
+        self.queries += 1
+        return self._grid.within(min_x, min_y, max_x, max_y, limit)
+
+    def nearby(
+        self, x: float, y: float, radius: float, limit: int,
+    ) -> list[tuple[SpatialEntry, float]]:
+        """Radius query; the index must be ready."""
+        self.queries += 1
+        return self._grid.nearby(x, y, radius, limit)
+
+    # ------------------------------
+    # Refresh path
+    # ------------------------------
+    async def rebuild(self) -> int:
+        """Build a new grid from every telemetry_latest row and swap it in."""
+        started = time.perf_counter()
+        grid = UniformGrid(self.cell_size)
+
+        async with async_session_maker() as session:
+            result = await session.execute(select(func.max(TelemetryLatest.system_time_utc)))
+            watermark = result.scalar_one()
+
+            stream = await session.stream(
+                select(*SPATIAL_COLUMNS).execution_options(yield_per=10_000)
+            )
+            async for row in stream:
+                grid.upsert(SpatialEntry(*row))
+
+        self._grid = grid
+        self._watermark = watermark or self._watermark
+        self._last_rebuild_at = time.monotonic()
+        self.rebuilds += 1
+        self.last_rebuild_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        logger.info(
+            "Spatial index rebuilt, devices=%d cells=%d",
+            len(grid), grid.cell_count,
+        )
+        return len(grid)
+
+    async def refresh_delta(self) -> int:
+        """Apply snapshots updated since the last watermark."""
+        if self._grid is None or self._watermark is None:
+            return await self.rebuild()
+
+        since = self._watermark - timedelta(seconds=DELTA_OVERLAP_SECONDS)
+        stmt = select(*SPATIAL_COLUMNS).where(TelemetryLatest.system_time_utc >= since)
+
+        async with async_session_maker() as session:
+            result = await session.execute(stmt)
+            rows = result.all()
+
+        for row in rows:
+            self._grid.upsert(SpatialEntry(*row))
+            if row.system_time_utc > self._watermark:
+                self._watermark = row.system_time_utc
+
+        return len(rows)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                last = self._last_rebuild_at
+                if last is None or time.monotonic() - last >= self.rebuild_seconds:
+                    await self.rebuild()
+                else:
+                    await self.refresh_delta()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.refresh_errors += 1
+                logger.exception("Spatial index refresh failed")
+
+            await asyncio.sleep(self.refresh_seconds)
+
+    async def start(self) -> None:
+        """Start the background refresh loop (initial build happens on first tick)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    def stats(self) -> dict:
+        """Snapshot of index metrics."""
+        grid = self._grid
+        return {
+            "ready": grid is not None,
+            "devices": len(grid) if grid else 0,
+            "cells": grid.cell_count if grid else 0,
+            "cell_size": self.cell_size,
+            "queries": self.queries,
+            "updates": self.updates,
+            "rebuilds": self.rebuilds,
+            "refresh_errors": self.refresh_errors,
+            "last_rebuild_ms": self.last_rebuild_ms,
+        }
+
+
+spatial_index = SpatialIndex(
+    cell_size=settings.spatial_index_cell_size,
+    refresh_seconds=settings.spatial_index_refresh_seconds,
+    rebuild_seconds=settings.spatial_index_rebuild_seconds,
+)
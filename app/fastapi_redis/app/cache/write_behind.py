@@ -0,0 +1,199 @@
+# app/cache/write_behind.py
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from ..config import get_settings
+from ..db import redis_client
+from .latest import latest_version, set_latest_if_newer
+from .recent import RECENT_LIST_MAX, push_recent_entries, recent_key
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+LATEST_TTL_SECONDS = 3600   # TTL of telemetry:latest:{device_uuid}
+
+
+class TelemetryCacheWriter:
+    """
+    Write-behind maintenance of the per-device telemetry cache keys.
+
+    - Requests hand over serialized items and return without touching Redis.
+    - Updates for the same device within one tick are merged: one versioned
+      write of the last latest payload (plus :ver key) and one LPUSH of
+      everything new, trimmed to RECENT_LIST_MAX.
+    - Each tick sends all pending devices in one pipeline with a timeout.
+    - Bounded by max_devices: updates for new devices are dropped while the
+      buffer is full, and a failed tick is dropped rather than retried. The
+      cache may then lag, but writes never wait.
+    - A dropped update would leave a hole in the device's recent list, so the
+      list is deleted on the next tick (retried until it succeeds) and
+      readers fall back to Postgres until it rebuilds.
+    """
+
+    def __init__(
+        self,
+        *,
+        flush_ms: float,
+        max_devices: int,
+        timeout_seconds: float,
+        ttl_seconds: int,
+    ) -> None:
+        self.flush_seconds = flush_ms / 1000
+        self.max_devices = max_devices
+        self.timeout_seconds = timeout_seconds
+        self.ttl_seconds = ttl_seconds
+
+        self._pending: dict[UUID, list[str]] = {}
+        self._latest: dict[UUID, str] = {}
+        self._invalidate: set[UUID] = set()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.enqueued = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.flushed_devices = 0
+        self.flush_errors = 0
+        self.invalidated = 0
+        self.last_flush_ms: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def enqueue(self, device_uuid: UUID, payloads: list[str], latest_payload: str) -> bool:
+        """
+        Queue cache updates for a device: recent-list payloads oldest first,
+        and the latest-key payload (TelemetryLatestItem JSON) of the newest.
+
+        Returns False when the update was dropped because the buffer is full.
+        """
+        pending = self._pending.get(device_uuid)
+        if pending is not None:
+            pending.extend(payloads)
+            if len(pending) > RECENT_LIST_MAX:
+                del pending[:-RECENT_LIST_MAX]
+            self.coalesced += 1
+        elif len(self._pending) >= self.max_devices:
+            self.dropped += 1
+            self._invalidate.add(device_uuid)
+            self._wakeup.set()
+            return False
+        else:
+            self._pending[device_uuid] = payloads[-RECENT_LIST_MAX:]
+
+        self._latest[device_uuid] = latest_payload
+        self.enqueued += 1
+        self._wakeup.set()
+        return True
+
+    # ------------------------------
+    # Flush path
+    # ------------------------------
+    async def flush(self) -> int:
+        """Write every pending device in one pipeline; returns devices written."""
+        if not self._pending and not self._invalidate:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        latest, self._latest = self._latest, {}
+        invalidate, self._invalidate = self._invalidate, set()
+        started = time.perf_counter()
+
+        pipe = redis_client.pipeline(transaction=False)
+        try:
+            # recent lists with dropped updates go first, then new writes rebuild them
+            if invalidate:
+                pipe.delete(*(recent_key(device_uuid) for device_uuid in invalidate))
+
+            for device_uuid, payloads in batch.items():
+                snapshot = latest[device_uuid]
+                version = latest_version(
+                    datetime.fromisoformat(json.loads(snapshot)["system_time_utc"])
+                )
+                await set_latest_if_newer(
+                    device_uuid, version, snapshot, self.ttl_seconds, client=pipe,
+                )
+                await push_recent_entries(device_uuid, payloads, client=pipe)
+
+            await asyncio.wait_for(pipe.execute(), self.timeout_seconds)
+        except asyncio.CancelledError:
+            self._invalidate |= invalidate | batch.keys()
+            raise
+        except Exception:
+            self._invalidate |= invalidate | batch.keys()
+            self.flush_errors += 1
+            self.dropped += len(batch)
+            logger.warning(
+                "Write-behind cache flush failed, devices dropped=%d", len(batch),
+                exc_info=True,
+            )
+            return 0
+
+        self.flushes += 1
+        self.flushed_devices += len(batch)
+        self.invalidated += len(invalidate)
+        self.last_flush_ms = round((time.perf_counter() - started) * 1000, 3)
+        return len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # let updates for the same devices accumulate for one tick
+            await asyncio.sleep(self.flush_seconds)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def start(self) -> None:
+        """Start the background flush loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush loop after a final flush."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        """Snapshot of writer metrics."""
+        return {
+            "running": self.running,
+            "pending_devices": len(self._pending),
+            "pending_invalidations": len(self._invalidate),
+            "max_devices": self.max_devices,
+            "flush_ms": self.flush_seconds * 1000,
+            "enqueued": self.enqueued,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "flushes": self.flushes,
+            "flushed_devices": self.flushed_devices,
+            "flush_errors": self.flush_errors,
+            "invalidated": self.invalidated,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+telemetry_cache_writer = TelemetryCacheWriter(
+    flush_ms=settings.cache_write_behind_flush_ms,
+    max_devices=settings.cache_write_behind_max_devices,
+    timeout_seconds=settings.cache_write_behind_timeout_seconds,
+    ttl_seconds=LATEST_TTL_SECONDS,
+)
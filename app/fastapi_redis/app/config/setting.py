@@ -124,6 +124,220 @@ class Settings(BaseSettings):
         description="The number of uvicorn workers.",
     )
 
+    # ------------------------------
+    # Operator access
+    # ------------------------------
+    operator_api_key_hash: str | None = Field(
+        default=None,
+        alias="OPERATOR_API_KEY_HASH",
+        description="SHA-256 hex digest of the operator API key; operator endpoints are disabled when unset.",
+    )
+
+    # ------------------------------
+    # Write-behind cache updates
+    # ------------------------------
+    cache_write_behind_enabled: bool = Field(
+        default=True,
+        alias="CACHE_WRITE_BEHIND_ENABLED",
+        description="Update telemetry cache keys in the background instead of inline.",
+    )
+
+    cache_write_behind_flush_ms: float = Field(
+        default=10.0,
+        gt=0,
+        alias="CACHE_WRITE_BEHIND_FLUSH_MS",
+        description="Tick length; updates for a device within one tick are merged.",
+    )
+
+    cache_write_behind_max_devices: int = Field(
+        default=50_000,
+        ge=1,
+        alias="CACHE_WRITE_BEHIND_MAX_DEVICES",
+        description="Max devices buffered per tick; further updates are dropped.",
+    )
+
+    cache_write_behind_timeout_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        alias="CACHE_WRITE_BEHIND_TIMEOUT_SECONDS",
+        description="Redis pipeline timeout per flush; a timed-out tick is dropped.",
+    )
+
+    # ------------------------------
+    # Windowed list cache (time buckets)
+    # ------------------------------
+    list_bucket_cache_enabled: bool = Field(
+        default=True,
+        alias="LIST_BUCKET_CACHE_ENABLED",
+        description="Assemble telemetry list pages from cached per-device time buckets.",
+    )
+
+    list_bucket_seconds: int = Field(
+        default=60,
+        ge=1,
+        alias="LIST_BUCKET_SECONDS",
+        description="Width of one cached telemetry bucket.",
+    )
+
+    list_bucket_grace_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        alias="LIST_BUCKET_GRACE_SECONDS",
+        description="Time after a bucket ends before it is considered closed and cached.",
+    )
+
+    list_bucket_ttl_seconds: int = Field(
+        default=24 * 3600,
+        ge=1,
+        alias="LIST_BUCKET_TTL_SECONDS",
+        description="TTL of closed bucket keys.",
+    )
+
+    list_bucket_max_buckets: int = Field(
+        default=1440,
+        ge=1,
+        alias="LIST_BUCKET_MAX_BUCKETS",
+        description="Windows spanning more buckets than this query Postgres directly.",
+    )
+
+    # ------------------------------
+    # Device filter (negative lookups)
+    # ------------------------------
+    device_filter_enabled: bool = Field(
+        default=True,
+        alias="DEVICE_FILTER_ENABLED",
+        description="Reject unknown device UUIDs with an in-process Bloom filter.",
+    )
+
+    device_filter_false_positive_rate: float = Field(
+        default=0.001,
+        gt=0,
+        lt=1,
+        alias="DEVICE_FILTER_FALSE_POSITIVE_RATE",
+        description="Target false-positive rate of the device filter.",
+    )
+
+    device_filter_refresh_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        alias="DEVICE_FILTER_REFRESH_SECONDS",
+        description="Interval between delta refreshes of newly registered devices.",
+    )
+
+    device_filter_rebuild_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        alias="DEVICE_FILTER_REBUILD_SECONDS",
+        description="Interval between full filter rebuilds from device_registry.",
+    )
+
+    device_filter_max_staleness_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        alias="DEVICE_FILTER_MAX_STALENESS_SECONDS",
+        description="Fail open when the last successful filter refresh is older than this.",
+    )
+
+    # ------------------------------
+    # Spatial index (nearby-device queries)
+    # ------------------------------
+    spatial_index_enabled: bool = Field(
+        default=True,
+        alias="SPATIAL_INDEX_ENABLED",
+        description="Serve bounding-box and radius queries from an in-process grid over telemetry_latest.",
+    )
+
+    spatial_index_cell_size: float = Field(
+        default=1.0,
+        gt=0,
+        alias="SPATIAL_INDEX_CELL_SIZE",
+        description="Side of a grid cell, in coordinate units; about the typical query radius.",
+    )
+
+    spatial_index_refresh_seconds: float = Field(
+        default=2.0,
+        gt=0,
+        alias="SPATIAL_INDEX_REFRESH_SECONDS",
+        description="Interval between delta refreshes of positions ingested by other workers.",
+    )
+
+    spatial_index_rebuild_seconds: float = Field(
+        default=600.0,
+        gt=0,
+        alias="SPATIAL_INDEX_REBUILD_SECONDS",
+        description="Interval between full index rebuilds from telemetry_latest.",
+    )
+
+    # ------------------------------
+    # Telemetry export (streaming reads)
+    # ------------------------------
+    export_chunk_rows: int = Field(
+        default=1000,
+        ge=1,
+        alias="EXPORT_CHUNK_ROWS",
+        description="Rows fetched per server-side cursor round trip when streaming.",
+    )
+
+    export_max_rows: int = Field(
+        default=1_000_000,
+        ge=5000,
+        alias="EXPORT_MAX_ROWS",
+        description="Max `limit` accepted for NDJSON/CSV streaming exports.",
+    )
+
+    # ------------------------------
+    # Per-device count reconciliation
+    # ------------------------------
+    device_count_reconcile_enabled: bool = Field(
+        default=True,
+        alias="DEVICE_COUNT_RECONCILE_ENABLED",
+        description="Periodically verify and repair telemetry_device_count.",
+    )
+
+    device_count_reconcile_interval_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        alias="DEVICE_COUNT_RECONCILE_INTERVAL_SECONDS",
+        description="Interval between reconciliation passes.",
+    )
+
+    device_count_reconcile_batch_devices: int = Field(
+        default=100,
+        ge=1,
+        alias="DEVICE_COUNT_RECONCILE_BATCH_DEVICES",
+        description="Devices verified per reconciliation transaction.",
+    )
+
+    # ------------------------------
+    # Outbox retention (partition maintenance)
+    # ------------------------------
+    outbox_maintenance_enabled: bool = Field(
+        default=True,
+        alias="OUTBOX_MAINTENANCE_ENABLED",
+        description="Create and drop daily telemetry_latest_outbox partitions.",
+    )
+
+    outbox_maintenance_interval_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        alias="OUTBOX_MAINTENANCE_INTERVAL_SECONDS",
+        description="Interval between partition maintenance runs.",
+    )
+
+    outbox_partition_days_ahead: int = Field(
+        default=3,
+        ge=1,
+        alias="OUTBOX_PARTITION_DAYS_AHEAD",
+        description="Daily outbox partitions kept created ahead of today (UTC).",
+    )
+
+    outbox_retention_days: int = Field(
+        default=2,
+        ge=1,
+        alias="OUTBOX_RETENTION_DAYS",
+        description="Days a fully processed outbox partition is kept before it is dropped.",
+    )
+
     # ------------------------------
     # Logging controls
     # ------------------------------
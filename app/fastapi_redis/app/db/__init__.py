@@ -1,7 +1,14 @@
-from .presgres import get_db
+from .presgres import get_db, async_session_maker
 from .redis import redis_client
+from .device_count import DeviceCountReconciler, device_count_reconciler
+from .outbox_maintenance import OutboxMaintenance, outbox_maintenance
 
 __all__ = [
     "get_db",
+    "async_session_maker",
     "redis_client",
+    "DeviceCountReconciler",
+    "device_count_reconciler",
+    "OutboxMaintenance",
+    "outbox_maintenance",
 ]
@@ -0,0 +1,216 @@
+# app/db/outbox_maintenance.py
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import text
+
+from ..config import get_settings
+from .presgres import async_session_maker, engine
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Shared by every API worker so only one of them maintains partitions at a time.
+OUTBOX_MAINTENANCE_LOCK_KEY = 0x6F757462  # "outb"
+
+TRY_LOCK_SQL = text("SELECT pg_try_advisory_lock(:key)")
+UNLOCK_SQL = text("SELECT pg_advisory_unlock(:key)")
+
+CREATE_PARTITIONS_SQL = text(
+    "SELECT app.fn_create_telemetry_latest_outbox_partitions(:days_ahead)"
+)
+
+EXPIRED_PARTITIONS_SQL = text(
+    "SELECT partition_name "
+    "FROM app.fn_expired_telemetry_latest_outbox_partitions(:retention)"
+)
+
+DROP_PARTITION_SQL = text(
+    "SELECT app.fn_drop_telemetry_latest_outbox_partition(:partition)"
+)
+
+PURGE_DEFAULT_SQL = text(
+    "SELECT app.fn_purge_telemetry_latest_outbox_default(:retention)"
+)
+
+BACKLOG_SQL = text(
+    "SELECT COUNT(*) AS backlog, "
+    "EXTRACT(EPOCH FROM NOW() - MIN(created_at)) AS oldest_age_seconds "
+    "FROM app.telemetry_latest_outbox "
+    "WHERE status = 'NEW'"
+)
+
+
+class OutboxMaintenance:
+    """
+    Partition upkeep for app.telemetry_latest_outbox.
+
+    - Each run creates the daily partitions for the next days_ahead days and
+      drops partitions older than retention_days whose rows are all
+      PROCESSED or FAILED, so removal is DROP TABLE, not DELETE + VACUUM.
+    - Creating partitions, dropping each expired partition and purging the
+      default partition are separate short transactions: CREATE ... PARTITION
+      OF and DETACH PARTITION lock the parent table, blocking telemetry
+      inserts (whose trigger writes the outbox) until commit.
+    - Runs at startup and then every interval_seconds, under a session-level
+      advisory lock held across those transactions; a worker that misses it
+      skips the run.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval_seconds: float,
+        days_ahead: int,
+        retention_days: int,
+    ) -> None:
+        self.interval_seconds = interval_seconds
+        self.days_ahead = days_ahead
+        self.retention_days = retention_days
+
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.runs = 0
+        self.skipped_runs = 0
+        self.partitions_created = 0
+        self.partitions_dropped = 0
+        self.errors = 0
+        self.last_run_ms: Optional[float] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def _maintain_once(self) -> Optional[tuple[int, list[str]]]:
+        """Create and drop partitions; None when another worker holds the lock."""
+        retention = timedelta(days=self.retention_days)
+        lock = {"key": OUTBOX_MAINTENANCE_LOCK_KEY}
+
+        # one connection for the whole run: the session-level lock lives on it
+        async with engine.connect() as conn:
+            locked = (await conn.execute(TRY_LOCK_SQL, lock)).scalar_one()
+            await conn.commit()
+            if not locked:
+                return None
+
+            try:
+                created = (await conn.execute(
+                    CREATE_PARTITIONS_SQL, {"days_ahead": self.days_ahead},
+                )).scalar_one()
+                await conn.commit()
+
+                expired = (await conn.execute(
+                    EXPIRED_PARTITIONS_SQL, {"retention": retention},
+                )).scalars().all()
+                await conn.commit()
+
+                dropped: list[str] = []
+                for partition in expired:
+                    if (await conn.execute(
+                        DROP_PARTITION_SQL, {"partition": partition},
+                    )).scalar_one():
+                        dropped.append(partition)
+                    await conn.commit()
+
+                await conn.execute(PURGE_DEFAULT_SQL, {"retention": retention})
+                await conn.commit()
+            finally:
+                try:
+                    await conn.rollback()
+                    await conn.execute(UNLOCK_SQL, lock)
+                    await conn.commit()
+                except Exception:
+                    # never return a connection to the pool still holding the lock
+                    logger.warning("Failed to release outbox maintenance lock", exc_info=True)
+                    await conn.invalidate()
+
+            return created, dropped
+
+    async def maintain(self) -> int:
+        """Run once; returns the number of dropped partitions."""
+        started = time.perf_counter()
+
+        outcome = await self._maintain_once()
+        if outcome is None:
+            self.skipped_runs += 1
+            return 0
+
+        created, dropped = outcome
+        if created or dropped:
+            logger.info(
+                "Outbox partitions maintained, created=%d dropped=%s",
+                created, ",".join(dropped) or "-",
+            )
+
+        self.runs += 1
+        self.partitions_created += created
+        self.partitions_dropped += len(dropped)
+        self.last_run_ms = round((time.perf_counter() - started) * 1000, 3)
+        return len(dropped)
+
+    async def backlog(self) -> dict:
+        """Undelivered outbox rows and the age of the oldest one."""
+        async with async_session_maker() as session:
+            row = (await session.execute(BACKLOG_SQL)).one()
+        return {
+            "backlog": row.backlog,
+            "oldest_unprocessed_age_seconds": (
+                round(float(row.oldest_age_seconds), 3)
+                if row.oldest_age_seconds is not None else None
+            ),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.maintain()
+            except Exception:
+                self.errors += 1
+                logger.exception("Outbox partition maintenance failed")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def start(self) -> None:
+        """Start periodic maintenance."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic maintenance."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
+
+    def stats(self) -> dict:
+        """Snapshot of maintenance metrics."""
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "days_ahead": self.days_ahead,
+            "retention_days": self.retention_days,
+            "runs": self.runs,
+            "skipped_runs": self.skipped_runs,
+            "partitions_created": self.partitions_created,
+            "partitions_dropped": self.partitions_dropped,
+            "errors": self.errors,
+            "last_run_ms": self.last_run_ms,
+        }
+
+
+outbox_maintenance = OutboxMaintenance(
+    interval_seconds=settings.outbox_maintenance_interval_seconds,
+    days_ahead=settings.outbox_partition_days_ahead,
+    retention_days=settings.outbox_retention_days,
+)
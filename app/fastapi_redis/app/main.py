@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+from .cache import device_filter, spatial_index, telemetry_cache_writer
 from .config import get_settings, setup_logging
-from .routers import home, health, device, telemetry
+from .db import device_count_reconciler, outbox_maintenance
+from .routers import home, health, device, telemetry, metrics
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -16,6 +19,26 @@ API_PREFIX = "/api"
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.device_filter_enabled:
+        await device_filter.start()
+    if settings.cache_write_behind_enabled:
+        await telemetry_cache_writer.start()
+    if settings.device_count_reconcile_enabled:
+        await device_count_reconciler.start()
+    if settings.spatial_index_enabled:
+        await spatial_index.start()
+    if settings.outbox_maintenance_enabled:
+        await outbox_maintenance.start()
+    yield
+    await outbox_maintenance.stop()
+    await spatial_index.stop()
+    await device_count_reconciler.stop()
+    await telemetry_cache_writer.stop()
+    await device_filter.stop()
+
+
 app = FastAPI(
     title="IoT Device Management API",
     version="0.1.0",
@@ -25,6 +48,7 @@ app = FastAPI(
         "and API keys, while administrative endpoints are intended for internal "
         "operations and tooling."
     ),
+    lifespan=lifespan,
 )
 
 
@@ -44,7 +68,8 @@ app.add_middleware(
     allow_origins=settings.cors_list,
     allow_credentials=False,  # no cookies for devices
     allow_methods=["GET", "POST", "OPTIONS"],
-    allow_headers=["Content-Type", "x-api-key"],
+    allow_headers=["Content-Type", "x-api-key", "If-None-Match"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 # ====================
@@ -54,3 +79,4 @@ app.include_router(home.router, prefix=API_PREFIX)
 app.include_router(health.router, prefix=API_PREFIX)
 app.include_router(device.router, prefix=API_PREFIX)
 app.include_router(telemetry.router, prefix=API_PREFIX)
+app.include_router(metrics.router, prefix=API_PREFIX)
@@ -0,0 +1,106 @@
+# app/routers/metrics.py
+import logging
+from fastapi import APIRouter
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..cache import (
+    device_filter,
+    spatial_index,
+    telemetry_bucket_cache,
+    telemetry_cache_writer,
+)
+from ..config import get_settings
+from ..db import device_count_reconciler, outbox_maintenance
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+@router.get("/device-filter", summary="Device filter metrics")
+async def device_filter_metrics() -> dict:
+    """
+    Size and rejection counters of the unknown-device Bloom filter.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.device_filter_enabled,
+        **device_filter.stats(),
+    }
+
+
+@router.get("/cache-writer", summary="Write-behind cache writer metrics")
+async def cache_writer_metrics() -> dict:
+    """
+    Coalescing, drop and flush counters of the write-behind cache writer.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.cache_write_behind_enabled,
+        **telemetry_cache_writer.stats(),
+    }
+
+
+@router.get("/list-cache", summary="Windowed list cache metrics")
+async def list_cache_metrics() -> dict:
+    """
+    Bucket hit/miss and key-write counters of the time-bucketed list cache.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.list_bucket_cache_enabled,
+        **telemetry_bucket_cache.stats(),
+    }
+
+
+@router.get("/device-count", summary="Per-device count reconciliation metrics")
+async def device_count_metrics() -> dict:
+    """
+    Pass, repair and drift counters of the telemetry_device_count reconciler.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.device_count_reconcile_enabled,
+        **device_count_reconciler.stats(),
+    }
+
+
+@router.get("/spatial-index", summary="Spatial index metrics")
+async def spatial_index_metrics() -> dict:
+    """
+    Size, query and refresh counters of the nearby-device grid index.
+
+    Counters are per uvicorn worker process.
+    """
+    return {
+        "enabled": settings.spatial_index_enabled,
+        **spatial_index.stats(),
+    }
+
+
+@router.get("/outbox", summary="Outbox backlog and retention metrics")
+async def outbox_metrics() -> dict:
+    """
+    Undelivered telemetry_latest_outbox rows, the age of the oldest one, and
+    partition maintenance counters.
+
+    The backlog is read from Postgres on each call. Counters are per uvicorn
+    worker process.
+    """
+    try:
+        backlog = await outbox_maintenance.backlog()
+    except SQLAlchemyError:
+        logger.warning("Failed to read outbox backlog")
+        backlog = {"backlog": None, "oldest_unprocessed_age_seconds": None}
+
+    return {
+        "enabled": settings.outbox_maintenance_enabled,
+        **backlog,
+        **outbox_maintenance.stats(),
+    }
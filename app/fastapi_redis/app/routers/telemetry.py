@@ -1,11 +1,16 @@
 # routers/telemetry.py
 from __future__ import annotations
 
+import base64
+import csv
 import hashlib
 import hmac
+import io
 import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
+from typing import Literal
 from uuid import UUID
 
 from fastapi import (
@@ -16,20 +21,54 @@ from fastapi import (
     HTTPException,
     Path,
     Query,
+    Response,
     status,
 )
 
-from sqlalchemy import select, func
+from fastapi.responses import StreamingResponse
+from sqlalchemy import BigInteger, Select, any_, bindparam, cast, insert, literal_column, or_, select, func
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_db, redis_client
-from ..models import DeviceRegistry, TelemetryEvent, TelemetryLatest
+from ..cache import (
+    RecentEntry,
+    device_filter,
+    discard_recent_entries,
+    etag_matches,
+    format_etag,
+    latest_keys,
+    latest_payload,
+    latest_version,
+    push_recent_entries,
+    read_recent_entries,
+    recent_entry_payload,
+    select_recent_window,
+    set_latest_if_newer,
+    spatial_index,
+    telemetry_bucket_cache,
+    telemetry_cache_writer,
+)
+from ..db import async_session_maker, get_db, redis_client
+from ..models import (
+    DeviceRegistry,
+    TelemetryCountStripe,
+    TelemetryDeviceCount,
+    TelemetryEvent,
+    TelemetryLatest,
+    TelemetryRollupMinute,
+)
 from ..schemas import (
     TelemetryCreate,
     TelemetryItem,
     TelemetryCountItem,
+    TelemetryTotalCountItem,
     TelemetryLatestItem,
+    TelemetryLatestBatch,
+    TelemetryNearbyItem,
+    TelemetryBatchItemResult,
+    TelemetryBatchResult,
+    TelemetryAggregateItem,
 )
 
 from ..config import get_settings
@@ -46,8 +85,50 @@ logger = logging.getLogger(__name__)
 DEFAULT_LATEST_SECONDS = 1800       # 30 minutes
 MAX_LATEST_SECONDS = 24 * 3600      # 24 hours
 
+MAX_BATCH_ITEMS = 1000              # Max points per batch ingestion request
+
+MAX_LATEST_QUERY_DEVICES = 100      # Max device_uuid query params per GET /telemetry/latest
+MAX_LATEST_BODY_DEVICES = 10000     # Max device UUIDs per POST /telemetry/latest
+MAX_SPATIAL_RESULTS = 10000         # Max devices per bounding-box / radius query
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"  # Response header carrying the next page cursor
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+MAX_LIST_LIMIT = 5000               # Max rows per JSON page
+EXPORT_MEDIA_TYPES = ("application/x-ndjson", "text/csv")
+AGGREGATE_RESOLUTIONS = {
+    "1m": timedelta(minutes=1),
+    "5m": timedelta(minutes=5),
+    "1h": timedelta(hours=1),
+}
+
+EXPORT_CSV_FIELDS = ("device_uuid", "x_coord", "y_coord", "device_time", "system_time_utc")
+
 TELEMETRY_CACHE_TTL_SECONDS = 3600    # Short TTL to limit staleness
 
+# Core column lists: hot paths select/return plain rows, not ORM instances
+DEVICE_AUTH_COLUMNS = (
+    DeviceRegistry.device_uuid,
+    DeviceRegistry.api_key_hash,
+)
+
+TELEMETRY_ITEM_COLUMNS = (
+    TelemetryEvent.device_uuid,
+    TelemetryEvent.x_coord,
+    TelemetryEvent.y_coord,
+    TelemetryEvent.device_time,
+    TelemetryEvent.system_time_utc,
+)
+
+TELEMETRY_LATEST_COLUMNS = (
+    TelemetryLatest.device_uuid,
+    TelemetryLatest.alias,
+    TelemetryLatest.x_coord,
+    TelemetryLatest.y_coord,
+    TelemetryLatest.device_time,
+    TelemetryLatest.system_time_utc,
+)
+
 
 # ============================================================
 # Helper functions
@@ -113,6 +194,157 @@ def normalize_time_window(
     return start_time, end_time
 
 
+def encode_cursor(system_time_utc: datetime, event_id: int) -> str:
+    """
+    Encode the position of a telemetry row as an opaque page cursor.
+
+    The cursor is the row's (system_time_utc, id) keyset, so the next page
+    seeks directly into the (device_uuid, system_time_utc) index.
+    """
+    micros = (system_time_utc - EPOCH_UTC) // timedelta(microseconds=1)
+    raw = f"{micros}:{event_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Decode a page cursor produced by encode_cursor.
+
+    Raises HTTP 400 if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        micros, event_id = base64.urlsafe_b64decode(padded).decode("ascii").split(":")
+        return EPOCH_UTC + timedelta(microseconds=int(micros)), int(event_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        ) from exc
+
+
+def negotiate_export_format(accept: str | None) -> str | None:
+    """
+    Return the streaming media type requested by the Accept header, if any.
+
+    Only explicit `application/x-ndjson` or `text/csv` select streaming;
+    anything else (including `*/*`) keeps the JSON response.
+    """
+    if not accept:
+        return None
+    for part in accept.split(","):
+        media_type = part.split(";", 1)[0].strip().lower()
+        if media_type in EXPORT_MEDIA_TYPES:
+            return media_type
+    return None
+
+
+def format_export_chunk(rows, media_type: str) -> str:
+    """Render a chunk of telemetry rows as NDJSON lines or CSV records."""
+    if media_type == "text/csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows(
+            (
+                row.device_uuid,
+                row.x_coord,
+                row.y_coord,
+                row.device_time.isoformat(),
+                row.system_time_utc.isoformat(),
+            )
+            for row in rows
+        )
+        return buffer.getvalue()
+
+    return "".join(
+        json.dumps({
+            "device_uuid": str(row.device_uuid),
+            "x_coord": row.x_coord,
+            "y_coord": row.y_coord,
+            "device_time": row.device_time.isoformat(),
+            "system_time_utc": row.system_time_utc.isoformat(),
+        }) + "\n"
+        for row in rows
+    )
+
+
+async def stream_telemetry_export(
+    stmt: Select,
+    media_type: str,
+    chunk_rows: int,
+) -> AsyncIterator[str]:
+    """
+    Stream query results through a server-side cursor, one chunk at a time.
+
+    Uses its own session so the connection is held only while streaming,
+    and at most chunk_rows rows are in memory at once.
+    """
+    if media_type == "text/csv":
+        yield ",".join(EXPORT_CSV_FIELDS) + "\n"
+
+    async with async_session_maker() as session:
+        try:
+            result = await session.stream(stmt.execution_options(yield_per=chunk_rows))
+            async for rows in result.partitions():
+                yield format_export_chunk(rows, media_type)
+        except SQLAlchemyError:
+            # headers are already sent; re-raise so the server aborts the
+            # transfer and the client sees an incomplete response, not a
+            # truncated export that looks complete
+            logger.exception("Database error while streaming telemetry export")
+            raise
+
+
+def build_aggregate_query(
+    device_uuid: UUID,
+    start_time: datetime,
+    end_time: datetime,
+    resolution: str,
+    limit: int,
+) -> Select:
+    """
+    Aggregate telemetry_rollup_minute rows into buckets of the given resolution.
+
+    The window start is aligned down to its bucket so the first bucket is
+    complete. Buckets are epoch-aligned with date_bin; the interval is
+    inlined (from AGGREGATE_RESOLUTIONS only) so the GROUP BY expression
+    matches the select list.
+    """
+    width = AGGREGATE_RESOLUTIONS[resolution]
+    aligned_start = EPOCH_UTC + (start_time - EPOCH_UTC) // width * width
+
+    rollup = TelemetryRollupMinute
+    bucket = func.date_bin(
+        literal_column(f"INTERVAL '{int(width.total_seconds())} seconds'"),
+        rollup.bucket_start,
+        literal_column("TIMESTAMPTZ '1970-01-01 00:00:00+00'"),
+    )
+    event_count = func.sum(rollup.event_count)
+
+    return (
+        select(
+            bucket.label("bucket_start"),
+            cast(event_count, BigInteger).label("count"),
+            func.min(rollup.min_x).label("min_x"),
+            func.max(rollup.max_x).label("max_x"),
+            (func.sum(rollup.sum_x) / event_count).label("avg_x"),
+            func.min(rollup.min_y).label("min_y"),
+            func.max(rollup.max_y).label("max_y"),
+            (func.sum(rollup.sum_y) / event_count).label("avg_y"),
+            func.min(rollup.first_time).label("first_time"),
+            func.max(rollup.last_time).label("last_time"),
+        )
+        .where(
+            rollup.device_uuid == device_uuid,
+            rollup.bucket_start >= aligned_start,
+            rollup.bucket_start <= end_time,
+        )
+        .group_by(bucket)
+        .order_by(bucket.desc())
+        .limit(limit)
+    )
+
+
 async def get_authenticated_device(
     device_uuid: UUID = Path(
         ...,
@@ -128,6 +360,7 @@ async def get_authenticated_device(
     Authenticate a device using its UUID and API key.
 
     Steps:
+    0. Reject UUIDs the device filter proves are not registered.
     1. Look up the device by device_uuid in DeviceRegistry.
     2. Verify the provided API key against the stored hash.
     3. Return the DeviceRegistry ORM instance on success.
@@ -141,6 +374,17 @@ async def get_authenticated_device(
         extra={"device_uuid": str(device_uuid)},
     )
 
+    # reject unregistered devices without any backend I/O
+    if settings.device_filter_enabled and not device_filter.might_contain(device_uuid):
+        logger.debug(
+            "Device rejected by device filter",
+            extra={"device_uuid": str(device_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Device not found.",
+        )
+
     device_uuid_str = str(device_uuid)
     cache_key = f"device:registry:{device_uuid_str}"
     device = None
@@ -185,13 +429,13 @@ async def get_authenticated_device(
             extra={"device_uuid": device_uuid_str},
         )
 
-        stmt = select(DeviceRegistry).where(
+        stmt = select(*DEVICE_AUTH_COLUMNS).where(
             DeviceRegistry.device_uuid == device_uuid
         )
 
         try:
             result = await db.execute(stmt)
-            device = result.scalar_one_or_none()
+            row = result.one_or_none()
         except SQLAlchemyError as exc:
             logger.exception(
                 "Database error while authenticating device",
@@ -202,7 +446,7 @@ async def get_authenticated_device(
                 detail="Failed to authenticate device.",
             ) from exc
 
-        if device is None:
+        if row is None:
             logger.warning(
                 "Device not found in registry",
                 extra={"device_uuid": device_uuid_str},
@@ -212,6 +456,12 @@ async def get_authenticated_device(
                 detail="Device not found.",
             )
 
+        # transient instance: not tracked by the session's identity map
+        device = DeviceRegistry(
+            device_uuid=row.device_uuid,
+            api_key_hash=row.api_key_hash,
+        )
+
         # Cache in Redis
         try:
             device_data = {
@@ -257,6 +507,124 @@ async def get_authenticated_device(
     return device
 
 
+async def require_operator(
+    api_key: str = Header(
+        alias="X-Operator-Key",
+        description="Plain-text operator API key.",
+    ),
+) -> None:
+    """
+    Authenticate an operator against OPERATOR_API_KEY_HASH.
+
+    Errors:
+    - 403 if operator access is not configured.
+    - 401 if the API key is invalid.
+    """
+    if not settings.operator_api_key_hash:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Operator access is not configured.",
+        )
+
+    if not verify_api_key(api_key, settings.operator_api_key_hash):
+        logger.warning("Invalid operator API key")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid API key.",
+        )
+
+
+async def fetch_latest_snapshots(db: AsyncSession, device_uuids: list[UUID]) -> Response:
+    """
+    Build one JSON body with the latest snapshots of device_uuids.
+
+    1. One MGET over the telemetry:latest:* keys; cached payloads are
+       spliced into the body as stored, without re-serializing them (every
+       writer stores TelemetryLatestItem JSON, see latest_payload).
+    2. One `device_uuid = ANY(:uuids)` query on telemetry_latest for the
+       misses; those rows are written back to Redis in one pipeline.
+
+    Items keep the request order (duplicates collapsed); devices with no
+    snapshot are listed under "missing".
+    """
+    device_uuids = list(dict.fromkeys(device_uuids))
+
+    # 1) Redis: all payloads in one round trip
+    try:
+        cached = await redis_client.mget(*(latest_keys(u)[0] for u in device_uuids))
+    except Exception:
+        logger.warning(
+            "Failed to read latest telemetry snapshots from Redis, falling back to DB",
+            extra={"devices": len(device_uuids)},
+        )
+        cached = [None] * len(device_uuids)
+
+    payloads: dict[UUID, str] = {u: p for u, p in zip(device_uuids, cached) if p}
+    misses = [u for u in device_uuids if u not in payloads]
+
+    # 2) PostgreSQL: every miss in one query
+    if misses:
+        stmt = select(*TELEMETRY_LATEST_COLUMNS).where(
+            TelemetryLatest.device_uuid == any_(
+                bindparam("uuids", value=misses, type_=ARRAY(PG_UUID(as_uuid=True)))
+            )
+        )
+
+        try:
+            result = await db.execute(stmt)
+            rows = result.all()
+        except SQLAlchemyError as exc:
+            logger.exception(
+                "Database error while fetching latest telemetry snapshots",
+                extra={"devices": len(misses)},
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to retrieve latest telemetry.",
+            ) from exc
+
+        items = [TelemetryLatestItem.model_validate(row) for row in rows]
+        for item in items:
+            payloads[item.device_uuid] = item.model_dump_json()
+
+        # Write-back to Redis (never regresses a newer snapshot)
+        if items:
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for item in items:
+                    await set_latest_if_newer(
+                        item.device_uuid,
+                        latest_version(item.system_time_utc),
+                        payloads[item.device_uuid],
+                        TELEMETRY_CACHE_TTL_SECONDS,
+                        client=pipe,
+                    )
+                await pipe.execute()
+            except Exception:
+                logger.warning(
+                    "Failed to write latest telemetry snapshots to Redis cache",
+                    extra={"devices": len(items)},
+                )
+
+    logger.debug(
+        "Latest telemetry snapshots fetched",
+        extra={
+            "devices": len(device_uuids),
+            "cache_hits": len(device_uuids) - len(misses),
+            "found": len(payloads),
+        },
+    )
+
+    body = "".join((
+        '{"items":[',
+        ",".join(payloads[u] for u in device_uuids if u in payloads),
+        '],"missing":',
+        json.dumps([str(u) for u in device_uuids if u not in payloads]),
+        "}",
+    ))
+    return Response(content=body, media_type="application/json")
+
+
 # ============================================================
 # GET /telemetry/count
 # ============================================================
@@ -264,22 +632,42 @@ async def get_authenticated_device(
     "/count",
     summary="Get telemetry registry statistics",
     description=(
-        "Return high-level statistics about telemetry storage. "
+        "Return the total number of stored telemetry events and the time it was taken.\n\n"
+        "By default the total is read from trigger-maintained counters in constant time. "
+        "`exact=true` runs a full COUNT(*) instead; it is slow on large tables and meant "
+        "for audits."
     ),
+    response_model=TelemetryTotalCountItem,
 )
 async def get_telemetry_count(
+    exact: bool = Query(
+        default=False,
+        description="Run a full COUNT(*) scan instead of reading the maintained counter.",
+    ),
     db: AsyncSession = Depends(get_db),
-) -> dict[str, int]:
+) -> TelemetryTotalCountItem:
     """
-    Return summary statistics for telemetry storage.
+    Return the total telemetry event count.
+
+    The maintained total is the sum of the 16 telemetry_count_stripe rows,
+    so its cost does not grow with telemetry_event.
     """
-    logger.debug("Fetching telemetry count (total telemetry event count)")
+    logger.debug(
+        "Fetching telemetry count (total telemetry event count)",
+        extra={"exact": exact},
+    )
 
-    stmt = select(func.count()).select_from(TelemetryEvent)
+    if exact:
+        stmt = select(func.count(), func.now()).select_from(TelemetryEvent)
+    else:
+        stmt = select(
+            func.coalesce(func.sum(TelemetryCountStripe.event_count), 0),
+            func.now(),
+        )
 
     try:
         result = await db.execute(stmt)
-        telemetry_count = result.scalar_one()
+        telemetry_count, as_of = result.one()
     except SQLAlchemyError as exc:
         logger.exception("Database error while fetching telemetry count")
         raise HTTPException(
@@ -289,10 +677,165 @@ async def get_telemetry_count(
 
     logger.debug(
         "Telemetry count fetched successfully",
-        extra={"telemetry_count": telemetry_count},
+        extra={"telemetry_count": telemetry_count, "exact": exact},
     )
 
-    return {"telemetry_count": telemetry_count}
+    return TelemetryTotalCountItem(
+        telemetry_count=telemetry_count,
+        as_of=as_of,
+        exact=exact,
+    )
+
+
+# ============================================================
+# GET /telemetry/latest
+# ============================================================
+@router.get(
+    "/latest",
+    summary="Get latest telemetry snapshots for several devices",
+    description=(
+        "Return the latest known positions of the given devices in one response. "
+        "Requires the operator key in the `X-Operator-Key` header.\n\n"
+        "Snapshots are read from Redis with a single MGET; devices missing there are "
+        "loaded with one PostgreSQL query. Devices without telemetry are listed under "
+        f"`missing`. Up to {MAX_LATEST_QUERY_DEVICES} `device_uuid` parameters; use "
+        "POST for larger sets."
+    ),
+    response_model=TelemetryLatestBatch,
+    dependencies=[Depends(require_operator)],
+)
+async def get_latest_telemetry_for_devices(
+    device_uuid: list[UUID] = Query(
+        ...,
+        min_length=1,
+        max_length=MAX_LATEST_QUERY_DEVICES,
+        description="Device UUID; repeat the parameter for each device.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return the latest snapshots of the devices in the query string."""
+    return await fetch_latest_snapshots(db, device_uuid)
+
+
+# ============================================================
+# POST /telemetry/latest
+# ============================================================
+@router.post(
+    "/latest",
+    summary="Get latest telemetry snapshots for a large set of devices",
+    description=(
+        "Same as `GET /telemetry/latest`, with the device UUIDs sent as a JSON array "
+        f"body (up to {MAX_LATEST_BODY_DEVICES})."
+    ),
+    response_model=TelemetryLatestBatch,
+    dependencies=[Depends(require_operator)],
+)
+async def post_latest_telemetry_for_devices(
+    device_uuids: list[UUID] = Body(
+        ...,
+        min_length=1,
+        max_length=MAX_LATEST_BODY_DEVICES,
+        description="Device UUIDs to fetch snapshots for.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Return the latest snapshots of the devices in the request body."""
+    return await fetch_latest_snapshots(db, device_uuids)
+
+
+# ============================================================
+# GET /telemetry/latest/within
+# ============================================================
+def require_spatial_index() -> None:
+    """503 until the spatial index has been built (or when it is disabled)."""
+    if not spatial_index.ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Spatial index is not available.",
+        )
+
+
+@router.get(
+    "/latest/within",
+    summary="Find devices inside a bounding box",
+    description=(
+        "Return the latest snapshots of devices whose latest position lies inside the "
+        "box `[min_x, max_x] x [min_y, max_y]`, in no particular order. Requires the "
+        "operator key in the `X-Operator-Key` header.\n\n"
+        "Served from an in-process grid index over telemetry_latest, so only the grid "
+        "cells overlapping the box are visited. Positions ingested through other API "
+        "workers appear after the next index refresh (`SPATIAL_INDEX_REFRESH_SECONDS`)."
+    ),
+    response_model=list[TelemetryLatestItem],
+    dependencies=[Depends(require_operator), Depends(require_spatial_index)],
+)
+async def get_latest_telemetry_within(
+    min_x: float = Query(..., description="Lower X bound (inclusive)."),
+    min_y: float = Query(..., description="Lower Y bound (inclusive)."),
+    max_x: float = Query(..., description="Upper X bound (inclusive)."),
+    max_y: float = Query(..., description="Upper Y bound (inclusive)."),
+    limit: int = Query(
+        default=1000,
+        ge=1,
+        le=MAX_SPATIAL_RESULTS,
+        description="Maximum number of devices to return.",
+    ),
+) -> list[TelemetryLatestItem]:
+    """Return the devices inside the bounding box."""
+    if min_x > max_x or min_y > max_y:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_x/min_y must not exceed max_x/max_y.",
+        )
+
+    entries = spatial_index.within(min_x, min_y, max_x, max_y, limit)
+
+    logger.debug(
+        "Bounding-box query served from spatial index",
+        extra={"returned_count": len(entries)},
+    )
+
+    return [TelemetryLatestItem.model_validate(entry) for entry in entries]
+
+
+# ============================================================
+# GET /telemetry/latest/nearby
+# ============================================================
+@router.get(
+    "/latest/nearby",
+    summary="Find devices within a radius",
+    description=(
+        "Return the latest snapshots of devices within `radius` of `(x, y)`, nearest "
+        "first, each with its `distance`. Requires the operator key in the "
+        "`X-Operator-Key` header.\n\n"
+        "Served from the same in-process grid index as `/telemetry/latest/within`."
+    ),
+    response_model=list[TelemetryNearbyItem],
+    dependencies=[Depends(require_operator), Depends(require_spatial_index)],
+)
+async def get_latest_telemetry_nearby(
+    x: float = Query(..., description="X coordinate of the query point."),
+    y: float = Query(..., description="Y coordinate of the query point."),
+    radius: float = Query(..., ge=0, description="Search radius, in coordinate units."),
+    limit: int = Query(
+        default=1000,
+        ge=1,
+        le=MAX_SPATIAL_RESULTS,
+        description="Maximum number of devices to return (the nearest ones).",
+    ),
+) -> list[TelemetryNearbyItem]:
+    """Return the devices within radius of the query point, nearest first."""
+    found = spatial_index.nearby(x, y, radius, limit)
+
+    logger.debug(
+        "Radius query served from spatial index",
+        extra={"returned_count": len(found)},
+    )
+
+    return [
+        TelemetryNearbyItem(**entry._asdict(), distance=distance)
+        for entry, distance in found
+    ]
 
 
 # ============================================================
@@ -306,11 +849,19 @@ async def get_telemetry_count(
         "The device must authenticate using the `X-API-Key` header. The time window can "
         "be specified using `start_time` and `end_time`, or by using `latest_seconds` "
         "to request data from a recent lookback period.\n\n"
-        "Results are ordered by `system_time_utc` in descending order (most recent first)."
+        "Results are ordered by `system_time_utc` in descending order (most recent first).\n\n"
+        "Recent windows are answered from the device's Redis recent-events list when it "
+        "covers them. Other pages are assembled from per-minute bucket keys: closed "
+        "buckets are cached, only the current one is read live from PostgreSQL.\n\n"
+        "When a page is full, the response carries an opaque `X-Next-Cursor` header. "
+        "Pass it back as `cursor` with the same window to fetch the next (older) page.\n\n"
+        "With `Accept: application/x-ndjson` or `Accept: text/csv` the rows are streamed "
+        "from a server-side cursor instead, and `limit` may go up to `EXPORT_MAX_ROWS`."
     ),
     response_model=list[TelemetryItem],
 )
 async def list_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
     start_time: datetime | None = Query(
         default=None,
@@ -339,8 +890,19 @@ async def list_telemetry_for_device(
     limit: int = Query(
         default=100,
         ge=1,
-        le=5000,
-        description="Maximum number of telemetry records to return.",
+        le=settings.export_max_rows,
+        description=(
+            f"Maximum number of telemetry records to return (at most {MAX_LIST_LIMIT} "
+            "for JSON; higher values require a streaming `Accept` type)."
+        ),
+    ),
+    cursor: str | None = Query(
+        default=None,
+        description="Opaque cursor from a previous response's `X-Next-Cursor` header.",
+    ),
+    accept: str | None = Header(
+        default=None,
+        description="`application/x-ndjson` or `text/csv` to stream the results.",
     ),
     db: AsyncSession = Depends(get_db),
 ) -> list[TelemetryItem]:
@@ -356,6 +918,17 @@ async def list_telemetry_for_device(
         end_time=end_time,
         latest_seconds=latest_seconds,
     )
+    after = decode_cursor(cursor) if cursor else None
+    export_format = negotiate_export_format(accept)
+
+    if export_format is None and limit > MAX_LIST_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"limit above {MAX_LIST_LIMIT} requires "
+                "Accept: application/x-ndjson or text/csv."
+            ),
+        )
 
     logger.debug(
         "Listing telemetry for device",
@@ -367,52 +940,86 @@ async def list_telemetry_for_device(
         },
     )
 
-    cache_key = (
-        f"telemetry:{device.device_uuid}:"
-        f"{int(start_time.timestamp())}:"
-        f"{int(end_time.timestamp())}:"
-        f"{limit}"
-    )
-
-    # Try Redis cache
-    try:
-        cached = await redis_client.get(cache_key)
-    except Exception:
-        cached = None
-
-    if cached:
-        logger.debug(
-            "Telemetry cache hit",
-            extra={"device_uuid": str(
-                device.device_uuid), "cache_key": cache_key},
+    # Recent-list fast path (first JSON page): telemetry:recent holds every
+    # event newer than its oldest entry, so a covered window needs no DB read
+    recent_rows: list[RecentEntry] = []
+    db_limit = limit
+    if after is None and export_format is None:
+        recent_rows, complete = select_recent_window(
+            await read_recent_entries(device.device_uuid),
+            start_time=start_time,
+            end_time=end_time,
+            limit=limit,
         )
-        try:
-            payload = json.loads(cached)
-            items = [TelemetryItem.model_validate(obj) for obj in payload]
-            return items
-        except Exception:
-            # If cache is corrupted or incompatible, ignore and fall back to DB
-            logger.warning(
-                "Failed to deserialize telemetry cache payload, falling back to DB",
-                extra={"device_uuid": str(
-                    device.device_uuid), "cache_key": cache_key},
+        if complete:
+            if len(recent_rows) == limit:
+                response.headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                    recent_rows[-1].system_time_utc, recent_rows[-1].id,
+                )
+            logger.debug(
+                "Telemetry served from recent list",
+                extra={
+                    "device_uuid": str(device.device_uuid),
+                    "returned_count": len(recent_rows),
+                },
             )
+            return [entry.item for entry in recent_rows]
 
-    # Cache miss: query PostgreSQL
+        if recent_rows:
+            # only the part of the window older than the list is missing
+            after = (recent_rows[-1].system_time_utc, recent_rows[-1].id)
+            db_limit = limit - len(recent_rows)
+
+    # Query PostgreSQL (exports, and JSON pages the bucket cache cannot serve)
     stmt = (
-        select(TelemetryEvent)
+        select(*TELEMETRY_ITEM_COLUMNS, TelemetryEvent.id)
         .where(
             TelemetryEvent.device_uuid == device.device_uuid,
             TelemetryEvent.system_time_utc >= start_time,
             TelemetryEvent.system_time_utc <= end_time,
         )
-        .order_by(TelemetryEvent.system_time_utc.desc())
-        .limit(limit)
+        .order_by(TelemetryEvent.system_time_utc.desc(), TelemetryEvent.id.desc())
+        .limit(db_limit)
     )
 
+    # keyset seek: continue strictly after the previous page's (or list's) last row
+    if after is not None:
+        after_time, after_id = after
+        stmt = stmt.where(
+            TelemetryEvent.system_time_utc <= after_time,
+            or_(
+                TelemetryEvent.system_time_utc < after_time,
+                TelemetryEvent.id < after_id,
+            ),
+        )
+
+    # streaming export: hand the query to a server-side cursor
+    if export_format is not None:
+        # release any connection held by authentication before streaming
+        await db.close()
+        return StreamingResponse(
+            stream_telemetry_export(stmt, export_format, settings.export_chunk_rows),
+            media_type=export_format,
+        )
+
+    # JSON pages: assemble from per-device time buckets (closed ones cached)
     try:
-        result = await db.execute(stmt)
-        rows = result.scalars().all()
+        rows: list[RecentEntry] | None = None
+        if settings.list_bucket_cache_enabled:
+            rows = await telemetry_bucket_cache.read(
+                db,
+                device.device_uuid,
+                start_time=start_time,
+                end_time=end_time,
+                limit=db_limit,
+                after=after,
+            )
+        if rows is None:
+            result = await db.execute(stmt)
+            rows = [
+                RecentEntry(TelemetryItem.model_validate(row), row.id)
+                for row in result.all()
+            ]
     except SQLAlchemyError as exc:
         logger.exception(
             "Database error while listing telemetry",
@@ -423,10 +1030,17 @@ async def list_telemetry_for_device(
             detail="Failed to retrieve telemetry.",
         ) from exc
 
-    # Convert ORM rows -> DTOs
-    items: list[TelemetryItem] = [
-        TelemetryItem.model_validate(row) for row in rows
-    ]
+    # Convert rows -> DTOs, after any entries served from the recent list
+    rows = recent_rows + rows
+    items: list[TelemetryItem] = [entry.item for entry in rows]
+
+    # a full page may have more rows behind it
+    next_cursor = (
+        encode_cursor(rows[-1].system_time_utc, rows[-1].id)
+        if len(items) == limit else None
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
     logger.debug(
         "Telemetry listing succeeded",
@@ -436,28 +1050,6 @@ async def list_telemetry_for_device(
         },
     )
 
-    # Store in Redis cache
-    try:
-        await redis_client.set(
-            cache_key,
-            json.dumps([item.model_dump(mode="json") for item in items]),
-            ex=TELEMETRY_CACHE_TTL_SECONDS,
-        )
-        logger.debug(
-            "Telemetry cached",
-            extra={
-                "device_uuid": str(device.device_uuid),
-                "cache_key": cache_key,
-                "ttl": TELEMETRY_CACHE_TTL_SECONDS,
-            },
-        )
-    except Exception:
-        logger.warning(
-            "Failed to write telemetry to Redis cache",
-            extra={"device_uuid": str(
-                device.device_uuid), "cache_key": cache_key},
-        )
-
     return items
 
 
@@ -494,20 +1086,23 @@ async def create_telemetry_for_device(
     now_utc = datetime.now(timezone.utc)
     device_time = payload.device_time or now_utc
 
-    telemetry = TelemetryEvent(
-        device_uuid=device.device_uuid,
-        x_coord=payload.x_coord,
-        y_coord=payload.y_coord,
-        device_time=device_time,
-        system_time_utc=now_utc,
+    stmt = (
+        insert(TelemetryEvent)
+        .values(
+            device_uuid=device.device_uuid,
+            x_coord=payload.x_coord,
+            y_coord=payload.y_coord,
+            device_time=device_time,
+            system_time_utc=now_utc,
+        )
+        .returning(*TELEMETRY_ITEM_COLUMNS, TelemetryEvent.id)
     )
 
-    db.add(telemetry)
-
     # commit db
     try:
+        result = await db.execute(stmt)
+        stored = result.one()
         await db.commit()
-        await db.refresh(telemetry)
     except SQLAlchemyError as exc:
         await db.rollback()
         logger.exception(
@@ -523,38 +1118,163 @@ async def create_telemetry_for_device(
         "Telemetry stored successfully",
         extra={
             "device_uuid": str(device.device_uuid),
-            "system_time_utc": telemetry.system_time_utc.isoformat(),
+            "system_time_utc": stored.system_time_utc.isoformat(),
         },
     )
 
-    # Convert ORM
-    item = TelemetryItem.model_validate(telemetry)
+    # Row -> DTO
+    item = TelemetryItem.model_validate(stored)
+    payload_json = recent_entry_payload(item, stored.id)
+    snapshot_json = latest_payload(item, device.alias)
 
-    # Cache in Redis
-    latest_key = f"telemetry:latest:{device.device_uuid}"
-    recent_list_key = f"telemetry:recent:{device.device_uuid}"
+    spatial_index.update(
+        device.device_uuid, item.x_coord, item.y_coord, item.device_time, item.system_time_utc,
+    )
+
+    # Cache in Redis: hand off to the write-behind writer when it is running
+    if telemetry_cache_writer.running:
+        telemetry_cache_writer.enqueue(device.device_uuid, [payload_json], snapshot_json)
+        return item
 
     try:
-        # Store latest telemetry
-        await redis_client.set(
-            latest_key,
-            item.model_dump_json(),
-            ex=TELEMETRY_CACHE_TTL_SECONDS,  # TTL
+        # Store latest telemetry and its version (never regresses)
+        await set_latest_if_newer(
+            device.device_uuid,
+            latest_version(item.system_time_utc),
+            snapshot_json,
+            TELEMETRY_CACHE_TTL_SECONDS,  # TTL
         )
 
-        # rolling list of recent events
-        await redis_client.lpush(recent_list_key, item.model_dump_json())
-        # keep most recent 100
-        await redis_client.ltrim(recent_list_key, 0, 99)
+        # rolling list of the most recent events (with row ids, for list cursors)
+        await push_recent_entries(device.device_uuid, [payload_json])
     except Exception:
         logger.warning(
             "Failed to write telemetry to Redis cache",
             extra={"device_uuid": str(device.device_uuid)},
         )
+        await discard_recent_entries(device.device_uuid)
 
     return item
 
 
+# ============================================================
+# POST /telemetry/{device_uuid}/batch
+# ============================================================
+@router.post(
+    "/{device_uuid}/batch",
+    summary="Ingest a batch of telemetry for a device",
+    description=(
+        "Ingest an array of telemetry events for a specific device identified by its UUID. "
+        "The device authenticates once using the `X-API-Key` header and all points are "
+        "written in a single multi-row INSERT within one transaction. Intended for devices "
+        "replaying points buffered while offline.\n\n"
+        f"At most {MAX_BATCH_ITEMS} points are accepted per request. Every point receives "
+        "the same `system_time_utc`; points without `device_time` default to it."
+    ),
+    response_model=TelemetryBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_telemetry_batch_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    payload: list[TelemetryCreate] = Body(
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Array of telemetry payloads, each with coordinates and optional device timestamp.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> TelemetryBatchResult:
+    """
+    Ingest a batch of telemetry events for the authenticated device.
+
+    All points are stored atomically: either every point is created or the
+    request fails with no rows written.
+    """
+    now_utc = datetime.now(timezone.utc)
+
+    rows = [
+        {
+            "device_uuid": device.device_uuid,
+            "x_coord": point.x_coord,
+            "y_coord": point.y_coord,
+            "device_time": point.device_time or now_utc,
+            "system_time_utc": now_utc,
+        }
+        for point in payload
+    ]
+
+    stmt = insert(TelemetryEvent).returning(
+        *TELEMETRY_ITEM_COLUMNS,
+        TelemetryEvent.id,
+        sort_by_parameter_order=True,
+    )
+
+    # commit db
+    try:
+        result = await db.execute(stmt, rows)
+        stored = result.all()
+        await db.commit()
+    except SQLAlchemyError as exc:
+        await db.rollback()
+        logger.exception(
+            "Database error while storing telemetry batch",
+            extra={"device_uuid": str(device.device_uuid), "batch_size": len(rows)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to store telemetry batch.",
+        ) from exc
+
+    items = [TelemetryItem.model_validate(row) for row in stored]
+
+    logger.debug(
+        "Telemetry batch stored successfully",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "batch_size": len(items),
+        },
+    )
+
+    last = items[-1]
+    spatial_index.update(
+        device.device_uuid, last.x_coord, last.y_coord, last.device_time, last.system_time_utc,
+    )
+
+    # Cache in Redis: write-behind when running, else one pipelined round trip
+    payloads = [
+        recent_entry_payload(item, row.id) for item, row in zip(items, stored)
+    ]
+    snapshot_json = latest_payload(items[-1], device.alias)
+    if telemetry_cache_writer.running:
+        telemetry_cache_writer.enqueue(device.device_uuid, payloads, snapshot_json)
+    else:
+        try:
+            pipe = redis_client.pipeline(transaction=False)
+            await set_latest_if_newer(
+                device.device_uuid,
+                latest_version(items[-1].system_time_utc),
+                snapshot_json,
+                TELEMETRY_CACHE_TTL_SECONDS,
+                client=pipe,
+            )
+            await push_recent_entries(device.device_uuid, payloads, client=pipe)
+            await pipe.execute()
+        except Exception:
+            logger.warning(
+                "Failed to write telemetry batch to Redis cache",
+                extra={"device_uuid": str(device.device_uuid)},
+            )
+            await discard_recent_entries(device.device_uuid)
+
+    return TelemetryBatchResult(
+        device_uuid=device.device_uuid,
+        accepted=len(items),
+        results=[
+            TelemetryBatchItemResult(index=index, status="created", item=item)
+            for index, item in enumerate(items)
+        ],
+    )
+
+
 # ============================================================
 # GET /telemetry/latest/{device_uuid}
 # ============================================================
@@ -565,22 +1285,33 @@ async def create_telemetry_for_device(
         "Return the latest known position for a specific device, identified by its UUID. "
         "The device must authenticate using the `X-API-Key` header.\n\n"
         "This endpoint reads from the telemetry_latest snapshot table, which is maintained "
-        "by the backend whenever new telemetry events are ingested."
+        "by the backend whenever new telemetry events are ingested.\n\n"
+        "Responses carry a strong `ETag` derived from the snapshot version. Send it back "
+        "in `If-None-Match` to get `304 Not Modified` while the snapshot is unchanged."
     ),
     response_model=TelemetryLatestItem,
+    responses={304: {"description": "Snapshot unchanged since the given ETag."}},
 )
 async def get_latest_telemetry_for_device(
+    response: Response,
     device: DeviceRegistry = Depends(get_authenticated_device),
+    if_none_match: str | None = Header(
+        default=None,
+        description="ETag from a previous response.",
+    ),
     db: AsyncSession = Depends(get_db),
 ) -> TelemetryLatestItem:
     """
     Return the latest telemetry snapshot for the authenticated device.
 
+    With If-None-Match, the snapshot's :ver key is checked first and a 304 is
+    returned from it alone, without reading or serializing the payload.
+
     If no telemetry has ever been ingested for this device, a 404 is returned.
     """
 
     device_uuid_str = str(device.device_uuid)
-    cache_key = f"telemetry:latest:{device_uuid_str}"
+    cache_key, ver_key = latest_keys(device_uuid_str)
 
     logger.debug(
         "Fetching latest telemetry snapshot for device",
@@ -590,11 +1321,23 @@ async def get_latest_telemetry_for_device(
         },
     )
 
-    # Try Redis cache
+    # Conditional GET: answer from the version key alone
+    if if_none_match:
+        try:
+            version = await redis_client.get(ver_key)
+        except Exception:
+            version = None
+        if version and etag_matches(if_none_match, format_etag(version)):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": format_etag(version)},
+            )
+
+    # Try Redis cache (payload and version in one round trip)
     try:
-        cached = await redis_client.get(cache_key)
+        cached, version = await redis_client.mget(cache_key, ver_key)
     except Exception:
-        cached = None
+        cached = version = None
 
     if cached:
         try:
@@ -608,6 +1351,9 @@ async def get_latest_telemetry_for_device(
                 },
             )
 
+            response.headers["ETag"] = format_etag(
+                version or latest_version(item.system_time_utc)
+            )
             return item
         except Exception:
             logger.warning(
@@ -616,13 +1362,13 @@ async def get_latest_telemetry_for_device(
             )
 
     # Cache miss: query PostgreSQL
-    stmt = select(TelemetryLatest).where(
+    stmt = select(*TELEMETRY_LATEST_COLUMNS).where(
         TelemetryLatest.device_uuid == device.device_uuid
     )
 
     try:
         result = await db.execute(stmt)
-        latest = result.scalar_one_or_none()
+        latest = result.one_or_none()
     except SQLAlchemyError as exc:
         logger.exception(
             "Database error while fetching latest telemetry",
@@ -643,7 +1389,7 @@ async def get_latest_telemetry_for_device(
             detail="No telemetry available for this device.",
         )
 
-    # ORM -> DTO
+    # Row -> DTO
     item = TelemetryLatestItem.model_validate(latest)
 
     logger.debug(
@@ -654,12 +1400,16 @@ async def get_latest_telemetry_for_device(
         },
     )
 
-    # Write-back to Redis
+    version = latest_version(item.system_time_utc)
+    etag = format_etag(version)
+
+    # Write-back to Redis (payload and version; never regresses a newer one)
     try:
-        await redis_client.set(
-            cache_key,
+        await set_latest_if_newer(
+            device.device_uuid,
+            version,
             item.model_dump_json(),
-            ex=TELEMETRY_CACHE_TTL_SECONDS,  # TTL in seconds; tune as needed
+            TELEMETRY_CACHE_TTL_SECONDS,  # TTL in seconds; tune as needed
         )
         logger.debug(
             "Latest telemetry snapshot cached",
@@ -675,6 +1425,10 @@ async def get_latest_telemetry_for_device(
             extra={"device_uuid": device_uuid_str, "cache_key": cache_key},
         )
 
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
     return item
 
 
@@ -699,23 +1453,22 @@ async def get_telemetry_count_for_device(
     Return the total telemetry event count for the authenticated device.
 
     This is a debug/operational endpoint and is not meant for production-facing
-    client use (e.g. mobile apps). It simply performs a COUNT(*) on telemetry_event
-    filtered by device_uuid.
+    client use (e.g. mobile apps). It reads the trigger-maintained counter in
+    telemetry_device_count (one primary-key lookup) instead of a COUNT(*).
     """
     logger.debug(
         "Fetching telemetry event count for device",
         extra={"device_uuid": str(device.device_uuid)},
     )
 
-    stmt = (
-        select(func.count())
-        .select_from(TelemetryEvent)
-        .where(TelemetryEvent.device_uuid == device.device_uuid)
+    stmt = select(TelemetryDeviceCount.event_count).where(
+        TelemetryDeviceCount.device_uuid == device.device_uuid
     )
 
     try:
         result = await db.execute(stmt)
-        total_events = result.scalar_one()
+        # no counter row yet: the device has never sent telemetry
+        total_events = result.scalar_one_or_none() or 0
     except SQLAlchemyError as exc:
         logger.exception(
             "Database error while counting telemetry events",
@@ -738,3 +1491,98 @@ async def get_telemetry_count_for_device(
         device_uuid=device.device_uuid,
         total_events=total_events,
     )
+
+
+# ============================================================
+# GET /telemetry/{device_uuid}/aggregates
+# ============================================================
+@router.get(
+    "/{device_uuid}/aggregates",
+    summary="Get time-bucketed telemetry aggregates for a device",
+    description=(
+        "Return per-bucket aggregates (event count, min/max/avg of X and Y, first and "
+        "last `system_time_utc`) of a device's telemetry at `1m`, `5m` or `1h` "
+        "resolution. The device must authenticate using the `X-API-Key` header. The "
+        "time window is given as for the list endpoint; its start is aligned down to "
+        "the resolution.\n\n"
+        "Buckets are ordered by `bucket_start` in descending order and only buckets "
+        "with events are returned. They are computed from per-minute rollups maintained "
+        "on insert, so a long window reads one row per device-minute instead of every "
+        "raw event."
+    ),
+    response_model=list[TelemetryAggregateItem],
+)
+async def get_telemetry_aggregates_for_device(
+    device: DeviceRegistry = Depends(get_authenticated_device),
+    resolution: Literal["1m", "5m", "1h"] = Query(
+        default="1m",
+        description="Bucket width.",
+    ),
+    start_time: datetime | None = Query(
+        default=None,
+        description=(
+            "Start of the time range (UTC). If provided, `latest_seconds` is ignored. "
+            "If omitted while `end_time` is provided, the server will bound the lookback "
+            f"window to at most {MAX_LATEST_SECONDS} seconds."
+        ),
+    ),
+    end_time: datetime | None = Query(
+        default=None,
+        description=(
+            "End of the time range (UTC). If omitted but `start_time` is provided, "
+            "defaults to the current server time."
+        ),
+    ),
+    latest_seconds: int = Query(
+        default=DEFAULT_LATEST_SECONDS,
+        ge=1,
+        le=MAX_LATEST_SECONDS,
+        description=(
+            "Lookback window in seconds when `start_time` and `end_time` are not provided."
+        ),
+    ),
+    limit: int = Query(
+        default=1000,
+        ge=1,
+        le=MAX_LIST_LIMIT,
+        description="Maximum number of buckets to return (most recent first).",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> list[TelemetryAggregateItem]:
+    """
+    Return telemetry aggregates for the authenticated device.
+
+    Reads app.telemetry_rollup_minute only; telemetry_event is not scanned.
+    """
+    start_time, end_time = normalize_time_window(
+        start_time=start_time,
+        end_time=end_time,
+        latest_seconds=latest_seconds,
+    )
+
+    logger.debug(
+        "Fetching telemetry aggregates for device",
+        extra={
+            "device_uuid": str(device.device_uuid),
+            "resolution": resolution,
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+        },
+    )
+
+    stmt = build_aggregate_query(device.device_uuid, start_time, end_time, resolution, limit)
+
+    try:
+        result = await db.execute(stmt)
+        rows = result.all()
+    except SQLAlchemyError as exc:
+        logger.exception(
+            "Database error while fetching telemetry aggregates",
+            extra={"device_uuid": str(device.device_uuid)},
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve telemetry aggregates.",
+        ) from exc
+
+    return [TelemetryAggregateItem.model_validate(row) for row in rows]
@@ -1,12 +1,26 @@
 # schemas/__init__.py
 from .device_registry import DeviceRegistryItem
-from .telemetry_event import TelemetryItem, TelemetryCreate, TelemetryCountItem
-from .telemetry_latest import TelemetryLatestItem
+from .telemetry_event import (
+    TelemetryItem,
+    TelemetryCreate,
+    TelemetryCountItem,
+    TelemetryTotalCountItem,
+    TelemetryBatchItemResult,
+    TelemetryBatchResult,
+)
+from .telemetry_latest import TelemetryLatestBatch, TelemetryLatestItem, TelemetryNearbyItem
+from .telemetry_rollup import TelemetryAggregateItem
 
 __all__ = [
     "DeviceRegistryItem",
     "TelemetryItem",
     "TelemetryCreate",
     "TelemetryCountItem",
+    "TelemetryTotalCountItem",
+    "TelemetryBatchItemResult",
+    "TelemetryBatchResult",
+    "TelemetryLatestBatch",
     "TelemetryLatestItem",
+    "TelemetryNearbyItem",
+    "TelemetryAggregateItem",
 ]
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from .base import ORMModel
 
@@ -53,3 +53,34 @@ class TelemetryLatestItem(ORMModel):
         ),
         examples=["2025-11-17T12:34:56Z"],
     )
+
+
+class TelemetryLatestBatch(BaseModel):
+    """
+    Latest snapshots for a set of devices.
+
+    Typical usage:
+      - Response model for GET/POST /telemetry/latest (operator fleet views)
+    """
+
+    items: list[TelemetryLatestItem] = Field(
+        description="Snapshots of the requested devices that have telemetry, in request order.",
+    )
+
+    missing: list[UUID] = Field(
+        description="Requested devices with no telemetry snapshot.",
+    )
+
+
+class TelemetryNearbyItem(TelemetryLatestItem):
+    """
+    Latest snapshot of a device found by a radius query.
+
+    Typical usage:
+      - Response model for GET /telemetry/latest/nearby
+    """
+
+    distance: float = Field(
+        description="Euclidean distance from the query point, in coordinate units.",
+        examples=[0.42],
+    )
@@ -0,0 +1,126 @@
+# tests/test_bucket_cache.py
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.cache import TelemetryBucketCache
+from app.cache import buckets as buckets_module
+
+DEVICE = UUID(int=1)
+
+
+class FakePipeline:
+    def __init__(self, store: dict) -> None:
+        self.store = store
+        self.pending: list[tuple[str, str]] = []
+
+    def set(self, key, value, ex=None):
+        self.pending.append((key, value))
+
+    async def execute(self):
+        self.store.update(self.pending)
+
+
+class FakeRedis:
+    def __init__(self, fail: bool = False) -> None:
+        self.store: dict[str, str] = {}
+        self.fail = fail
+
+    async def mget(self, keys):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self.store)
+
+
+class FakeResult:
+    def __init__(self, rows) -> None:
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Filters events by the [lower, upper) range in the bucket query."""
+
+    def __init__(self, events) -> None:
+        self.events = events
+        self.queries = 0
+
+    async def execute(self, stmt):
+        self.queries += 1
+        lower, upper = (c.right.value for c in stmt.whereclause.clauses[1:])
+        return FakeResult([e for e in self.events if lower <= e.system_time_utc < upper])
+
+
+def build_events(now: datetime, count: int) -> list[SimpleNamespace]:
+    """One event every 10 seconds going back from now, ids increasing with time."""
+    events = []
+    for i in range(count):
+        ts = now - timedelta(seconds=10 * (count - 1 - i))
+        events.append(SimpleNamespace(
+            device_uuid=DEVICE, x_coord=float(i), y_coord=0.0,
+            device_time=ts, system_time_utc=ts, id=i + 1,
+        ))
+    return events
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(buckets_module, "redis_client", redis)
+    return redis
+
+
+def build_cache() -> TelemetryBucketCache:
+    return TelemetryBucketCache(
+        bucket_seconds=60, grace_seconds=0, ttl_seconds=3600, max_buckets=1440,
+    )
+
+
+def test_closed_buckets_are_cached_and_reused(fake_redis):
+    cache = build_cache()
+    now = datetime.now(timezone.utc)
+    db = FakeSession(build_events(now, 180))
+    window = dict(start_time=now - timedelta(minutes=30), end_time=now, limit=1000)
+
+    first = asyncio.run(cache.read(db, DEVICE, **window))
+    second = asyncio.run(cache.read(db, DEVICE, **window))
+
+    assert [e.id for e in first] == [e.id for e in second]
+    assert [e.id for e in first] == sorted((e.id for e in first), reverse=True)
+    assert first[0].id == 180
+    stats = cache.stats()
+    assert stats["bucket_misses"] == stats["keys_written"] == stats["bucket_hits"]
+    assert stats["live_buckets"] == 2
+
+
+def test_after_cursor_skips_already_returned_rows(fake_redis):
+    cache = build_cache()
+    now = datetime.now(timezone.utc)
+    db = FakeSession(build_events(now, 60))
+    window = dict(start_time=now - timedelta(minutes=30), end_time=now, limit=5)
+
+    page = asyncio.run(cache.read(db, DEVICE, **window))
+    next_page = asyncio.run(cache.read(
+        db, DEVICE, **window, after=(page[-1].system_time_utc, page[-1].id),
+    ))
+
+    assert [e.id for e in page] == [60, 59, 58, 57, 56]
+    assert [e.id for e in next_page] == [55, 54, 53, 52, 51]
+
+
+def test_redis_errors_fall_back_to_postgres(monkeypatch):
+    monkeypatch.setattr(buckets_module, "redis_client", FakeRedis(fail=True))
+    cache = build_cache()
+    now = datetime.now(timezone.utc)
+    window = dict(start_time=now - timedelta(minutes=30), end_time=now, limit=100)
+
+    assert asyncio.run(cache.read(FakeSession([]), DEVICE, **window)) is None
+    assert cache.stats()["fallbacks"] == 1
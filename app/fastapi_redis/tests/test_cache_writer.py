@@ -0,0 +1,130 @@
+# tests/test_cache_writer.py
+import asyncio
+import json
+from uuid import UUID
+
+import pytest
+
+from app.cache import TelemetryCacheWriter, recent_key
+from app.cache import write_behind
+from app.cache.write_behind import RECENT_LIST_MAX
+
+
+def build_writer(max_devices: int = 10) -> TelemetryCacheWriter:
+    return TelemetryCacheWriter(
+        flush_ms=10,
+        max_devices=max_devices,
+        timeout_seconds=1,
+        ttl_seconds=60,
+    )
+
+
+def test_updates_for_same_device_are_coalesced():
+    writer = build_writer()
+    device_uuid = UUID(int=1)
+
+    writer.enqueue(device_uuid, ["a"], "latest-a")
+    writer.enqueue(device_uuid, ["b", "c"], "latest-c")
+
+    assert writer._pending == {device_uuid: ["a", "b", "c"]}
+    assert writer._latest == {device_uuid: "latest-c"}
+    assert writer.stats()["coalesced"] == 1
+
+
+def test_pending_recent_list_is_bounded():
+    writer = build_writer()
+    device_uuid = UUID(int=1)
+
+    for i in range(RECENT_LIST_MAX + 5):
+        writer.enqueue(device_uuid, [str(i)], str(i))
+
+    assert len(writer._pending[device_uuid]) == RECENT_LIST_MAX
+    assert writer._pending[device_uuid][-1] == str(RECENT_LIST_MAX + 4)
+
+
+def test_new_devices_dropped_when_full():
+    writer = build_writer(max_devices=1)
+
+    assert writer.enqueue(UUID(int=1), ["a"], "a")
+    assert not writer.enqueue(UUID(int=2), ["b"], "b")
+    assert writer.enqueue(UUID(int=1), ["c"], "c")
+    assert writer.stats()["dropped"] == 1
+
+
+class FakePipeline:
+    def __init__(self, calls, fail):
+        self.calls = calls
+        self.fail = fail
+
+    def delete(self, *keys):
+        self.calls.append(("delete", sorted(keys)))
+
+    async def execute(self):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return []
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    state = {"fail": False, "calls": []}
+
+    class FakeClient:
+        def pipeline(self, transaction=False):
+            return FakePipeline(state["calls"], state["fail"])
+
+    async def fake_set_latest(device_uuid, version, payload, ttl_seconds, client=None):
+        state["latest"] = payload
+
+    async def fake_push_recent(device_uuid, payloads, client=None):
+        client.calls.append(("push", device_uuid, list(payloads)))
+
+    monkeypatch.setattr(write_behind, "redis_client", FakeClient())
+    monkeypatch.setattr(write_behind, "set_latest_if_newer", fake_set_latest)
+    monkeypatch.setattr(write_behind, "push_recent_entries", fake_push_recent)
+    return state
+
+
+def _payload(event_id):
+    return json.dumps({"id": event_id, "system_time_utc": "2025-11-17T12:00:00+00:00"})
+
+
+def test_dropped_update_deletes_recent_list_before_next_push(fake_redis):
+    writer = build_writer(max_devices=1)
+
+    writer.enqueue(UUID(int=1), [_payload(1)], _payload(1))
+    writer.enqueue(UUID(int=2), [_payload(2)], _payload(2))   # dropped: leaves a hole
+    asyncio.run(writer.flush())
+
+    assert fake_redis["calls"][0] == ("delete", [recent_key(UUID(int=2))])
+    assert writer.stats()["invalidated"] == 1
+
+
+def test_failed_flush_deletes_recent_lists_on_retry(fake_redis):
+    writer = build_writer()
+
+    writer.enqueue(UUID(int=1), [_payload(1)], _payload(1))
+    fake_redis["fail"] = True
+    asyncio.run(writer.flush())
+    assert writer.stats()["pending_invalidations"] == 1
+
+    fake_redis["fail"] = False
+    fake_redis["calls"].clear()
+    writer.enqueue(UUID(int=1), [_payload(3)], _payload(3))
+    asyncio.run(writer.flush())
+
+    assert fake_redis["calls"] == [
+        ("delete", [recent_key(UUID(int=1))]),
+        ("push", UUID(int=1), [_payload(3)]),
+    ]
+    assert writer.stats()["pending_invalidations"] == 0
+
+
+def test_flush_writes_the_latest_snapshot_not_the_recent_payload(fake_redis):
+    writer = build_writer()
+    snapshot = json.dumps({"alias": "device-001", "system_time_utc": "2025-11-17T12:00:00+00:00"})
+
+    writer.enqueue(UUID(int=1), [_payload(1)], snapshot)
+    asyncio.run(writer.flush())
+
+    assert fake_redis["latest"] == snapshot
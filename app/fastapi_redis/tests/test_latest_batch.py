@@ -0,0 +1,163 @@
+# tests/test_latest_batch.py
+import hashlib
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.cache import latest_keys, latest_payload, recent_entry_payload
+from app.db import get_db
+from app.routers import telemetry as telemetry_module
+from app.schemas import TelemetryItem, TelemetryLatestItem
+
+OPERATOR_KEY = "operator-secret"
+HEADERS = {"X-Operator-Key": OPERATOR_KEY}
+
+TS = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def snapshot(n: int) -> TelemetryLatestItem:
+    return TelemetryLatestItem(
+        device_uuid=UUID(int=n), x_coord=float(n), y_coord=2.0,
+        device_time=TS, system_time_utc=TS,
+    )
+
+
+class FakePipeline:
+    def __init__(self) -> None:
+        self.executed = False
+
+    async def execute(self):
+        self.executed = True
+
+
+class FakeRedis:
+    def __init__(self, store: dict) -> None:
+        self.store = store
+        self.mget_calls = 0
+        self.pipe = FakePipeline()
+
+    async def mget(self, *keys):
+        self.mget_calls += 1
+        return [self.store.get(k) for k in keys]
+
+    def pipeline(self, transaction=False):
+        return self.pipe
+
+
+class FakeResult:
+    def __init__(self, rows) -> None:
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Returns the snapshots whose device is in the ANY() parameter."""
+
+    def __init__(self, snapshots) -> None:
+        self.snapshots = {s.device_uuid: s for s in snapshots}
+        self.queried: list[list[UUID]] = []
+
+    async def execute(self, stmt):
+        uuids = stmt.compile().params["uuids"]
+        self.queried.append(uuids)
+        return FakeResult([
+            SimpleNamespace(**self.snapshots[u].model_dump())
+            for u in uuids if u in self.snapshots
+        ])
+
+
+@pytest.fixture
+def operator(monkeypatch):
+    monkeypatch.setattr(
+        telemetry_module.settings, "operator_api_key_hash",
+        hashlib.sha256(OPERATOR_KEY.encode()).hexdigest(),
+    )
+
+
+@pytest.fixture
+def backends(monkeypatch):
+    """Device 1 cached in Redis, device 2 only in Postgres, device 3 unknown."""
+    redis = FakeRedis({latest_keys(UUID(int=1))[0]: snapshot(1).model_dump_json()})
+    session = FakeSession([snapshot(2)])
+    written = []
+
+    async def fake_set_latest_if_newer(device_uuid, version, payload, ttl, client=None):
+        written.append(device_uuid)
+
+    monkeypatch.setattr(telemetry_module, "redis_client", redis)
+    monkeypatch.setattr(telemetry_module, "set_latest_if_newer", fake_set_latest_if_newer)
+    main.app.dependency_overrides[get_db] = lambda: session
+    yield SimpleNamespace(redis=redis, session=session, written=written)
+    main.app.dependency_overrides.clear()
+
+
+def test_get_combines_cache_and_db(operator, backends):
+    resp = TestClient(main.app).get(
+        "/api/telemetry/latest",
+        params={"device_uuid": [str(UUID(int=n)) for n in (1, 2, 3, 1)]},
+        headers=HEADERS,
+    )
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert [i["device_uuid"] for i in data["items"]] == [str(UUID(int=1)), str(UUID(int=2))]
+    assert data["missing"] == [str(UUID(int=3))]
+
+    # One MGET, one query for the misses only, DB hits written back
+    assert backends.redis.mget_calls == 1
+    assert backends.session.queried == [[UUID(int=2), UUID(int=3)]]
+    assert backends.written == [UUID(int=2)]
+    assert backends.redis.pipe.executed
+
+
+def test_post_body_form(operator, backends):
+    resp = TestClient(main.app).post(
+        "/api/telemetry/latest",
+        json=[str(UUID(int=1))],
+        headers=HEADERS,
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["missing"] == []
+    assert backends.session.queried == []
+
+
+def test_rejects_invalid_operator_key(operator, backends):
+    resp = TestClient(main.app).get(
+        "/api/telemetry/latest",
+        params={"device_uuid": str(UUID(int=1))},
+        headers={"X-Operator-Key": "wrong"},
+    )
+
+    assert resp.status_code == 401
+
+
+def test_disabled_without_operator_key_hash(backends):
+    resp = TestClient(main.app).get(
+        "/api/telemetry/latest",
+        params={"device_uuid": str(UUID(int=1))},
+        headers=HEADERS,
+    )
+
+    assert resp.status_code == 403
+
+
+def test_latest_payload_matches_the_latest_item_shape():
+    item = TelemetryItem(
+        device_uuid=UUID(int=1), x_coord=1.0, y_coord=2.0,
+        device_time=TS, system_time_utc=TS,
+    )
+
+    latest = json.loads(latest_payload(item, "device-001"))
+    recent = json.loads(recent_entry_payload(item, 42))
+
+    assert set(latest) == set(TelemetryLatestItem.model_fields)
+    assert latest["alias"] == "device-001"
+    assert "id" in recent and "id" not in latest
@@ -0,0 +1,38 @@
+# tests/test_outbox_maintenance.py
+import asyncio
+
+from app.db import OutboxMaintenance
+
+
+class ScriptedMaintenance(OutboxMaintenance):
+    """Returns scripted (created, dropped) outcomes instead of calling Postgres."""
+
+    def __init__(self, outcomes):
+        super().__init__(interval_seconds=60, days_ahead=3, retention_days=2)
+        self.outcomes = list(outcomes)
+
+    async def _maintain_once(self):
+        return self.outcomes.pop(0)
+
+
+def test_runs_accumulate_created_and_dropped_partitions():
+    maintenance = ScriptedMaintenance([
+        (3, []),
+        (1, ["telemetry_latest_outbox_p20251115", "telemetry_latest_outbox_p20251116"]),
+    ])
+
+    assert asyncio.run(maintenance.maintain()) == 0
+    assert asyncio.run(maintenance.maintain()) == 2
+
+    stats = maintenance.stats()
+    assert stats["runs"] == 2
+    assert stats["partitions_created"] == 4
+    assert stats["partitions_dropped"] == 2
+
+
+def test_run_skipped_when_another_worker_holds_the_lock():
+    maintenance = ScriptedMaintenance([None])
+
+    assert asyncio.run(maintenance.maintain()) == 0
+    assert maintenance.stats()["skipped_runs"] == 1
+    assert maintenance.stats()["runs"] == 0
@@ -0,0 +1,64 @@
+# tests/test_recent_history.py
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.cache import recent_entry_payload, select_recent_window
+from app.cache.recent import parse_recent_entries
+from app.schemas import TelemetryItem
+
+NOW = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def build_list(ages_seconds: list[int]) -> list[str]:
+    """Recent-list payloads as LPUSHed: newest first, ids increasing with time."""
+    payloads = []
+    for event_id, age in enumerate(sorted(ages_seconds, reverse=True), start=1):
+        ts = NOW - timedelta(seconds=age)
+        item = TelemetryItem(
+            device_uuid=UUID(int=1), x_coord=1.0, y_coord=2.0,
+            device_time=ts, system_time_utc=ts,
+        )
+        payloads.insert(0, recent_entry_payload(item, event_id))
+    return payloads
+
+
+def test_window_inside_list_is_complete():
+    entries = parse_recent_entries(build_list([10, 60, 120, 600]))
+
+    rows, complete = select_recent_window(
+        entries, NOW - timedelta(seconds=300), NOW, limit=100,
+    )
+
+    assert complete
+    assert [r.id for r in rows] == [4, 3, 2]
+
+
+def test_full_limit_is_complete_even_if_list_is_short_of_start():
+    entries = parse_recent_entries(build_list([10, 60, 120]))
+
+    rows, complete = select_recent_window(
+        entries, NOW - timedelta(hours=1), NOW, limit=2,
+    )
+
+    assert complete
+    assert [r.id for r in rows] == [3, 2]
+
+
+def test_window_older_than_list_needs_remainder():
+    entries = parse_recent_entries(build_list([10, 60]))
+
+    rows, complete = select_recent_window(
+        entries, NOW - timedelta(hours=1), NOW, limit=100,
+    )
+
+    assert not complete
+    assert [r.id for r in rows] == [2, 1]
+
+
+def test_entries_without_id_are_not_used():
+    legacy = TelemetryItem(
+        device_uuid=UUID(int=1), x_coord=1.0, y_coord=2.0,
+        device_time=NOW, system_time_utc=NOW,
+    ).model_dump_json()
+
+    assert parse_recent_entries(build_list([10]) + [legacy]) == []
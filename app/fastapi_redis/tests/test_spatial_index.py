@@ -0,0 +1,113 @@
+# tests/test_spatial_index.py
+import hashlib
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.cache import SpatialEntry, SpatialIndex, UniformGrid
+from app.routers import telemetry as telemetry_module
+
+TS = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def entry(n: int, x: float, y: float, ts: datetime = TS) -> SpatialEntry:
+    return SpatialEntry(UUID(int=n), f"device-{n:03d}", x, y, ts, ts)
+
+
+def random_grid(count: int, cell_size: float = 1.0) -> UniformGrid:
+    rng = random.Random(7)
+    grid = UniformGrid(cell_size)
+    for n in range(count):
+        grid.upsert(entry(n, rng.uniform(-50, 50), rng.uniform(-50, 50)))
+    return grid
+
+
+def test_within_matches_brute_force():
+    grid = random_grid(2000)
+    everything = grid.within(-math.inf, -math.inf, math.inf, math.inf)
+    assert len(everything) == 2000
+
+    for box in [(-3.5, -2.0, 4.25, 1.0), (10, 10, 10.5, 49.9), (-60, -60, 60, 60)]:
+        expected = {
+            e.device_uuid for e in everything
+            if box[0] <= e.x_coord <= box[2] and box[1] <= e.y_coord <= box[3]
+        }
+        assert {e.device_uuid for e in grid.within(*box)} == expected
+
+
+def test_nearby_is_sorted_and_bounded():
+    grid = random_grid(2000)
+
+    found = grid.nearby(0.0, 0.0, 5.0, limit=10)
+
+    distances = [d for _, d in found]
+    assert len(found) == 10
+    assert distances == sorted(distances)
+    assert all(d <= 5.0 for d in distances)
+    assert all(math.hypot(e.x_coord, e.y_coord) == d for e, d in found)
+
+
+def test_upsert_moves_device_and_ignores_older_snapshots():
+    grid = UniformGrid(1.0)
+    grid.upsert(entry(1, 0.5, 0.5))
+
+    assert grid.upsert(entry(1, 10.5, 10.5, TS + timedelta(seconds=1)))
+    assert not grid.upsert(entry(1, 0.5, 0.5, TS))
+
+    assert grid.within(0, 0, 1, 1) == []
+    assert [e.device_uuid for e in grid.within(10, 10, 11, 11)] == [UUID(int=1)]
+    assert len(grid) == 1 and grid.cell_count == 1
+
+
+def test_update_keeps_alias_and_is_noop_until_built():
+    index = SpatialIndex(cell_size=1.0, refresh_seconds=1.0, rebuild_seconds=60.0)
+    index.update(UUID(int=1), 1.0, 1.0, TS, TS)
+    assert not index.ready
+
+    index._grid = UniformGrid(1.0)
+    index._grid.upsert(entry(1, 0.5, 0.5))
+    index.update(UUID(int=1), 3.0, 4.0, TS, TS + timedelta(seconds=1))
+
+    (found, distance), = index.nearby(0.0, 0.0, 5.0, limit=10)
+    assert found.alias == "device-001"
+    assert distance == 5.0
+
+
+def test_nearby_endpoint(monkeypatch):
+    index = SpatialIndex(cell_size=1.0, refresh_seconds=1.0, rebuild_seconds=60.0)
+    index._grid = UniformGrid(1.0)
+    index._grid.upsert(entry(1, 1.0, 0.0))
+    index._grid.upsert(entry(2, 0.0, 0.5))
+    index._grid.upsert(entry(3, 9.0, 9.0))
+
+    monkeypatch.setattr(telemetry_module, "spatial_index", index)
+    monkeypatch.setattr(
+        telemetry_module.settings, "operator_api_key_hash",
+        hashlib.sha256(b"operator-secret").hexdigest(),
+    )
+
+    client = TestClient(main.app)
+    headers = {"X-Operator-Key": "operator-secret"}
+
+    resp = client.get(
+        "/api/telemetry/latest/nearby",
+        params={"x": 0, "y": 0, "radius": 2},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert [(i["device_uuid"], i["distance"]) for i in resp.json()] == [
+        (str(UUID(int=2)), 0.5),
+        (str(UUID(int=1)), 1.0),
+    ]
+
+    resp = client.get(
+        "/api/telemetry/latest/within",
+        params={"min_x": 5, "min_y": 5, "max_x": 10, "max_y": 10},
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert [i["alias"] for i in resp.json()] == ["device-003"]
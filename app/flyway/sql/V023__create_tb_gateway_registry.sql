@@ -0,0 +1,27 @@
+-- V023__create_tb_gateway_registry.sql
+------------------------------------------------------------
+-- Create table app.gateway_registry – field gateways allowed to bulk ingest
+--   telemetry on behalf of registered devices.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+CREATE TABLE IF NOT EXISTS app.gateway_registry (
+    id              BIGINT          GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    alias           VARCHAR(64),
+    gateway_uuid    UUID            NOT NULL UNIQUE,
+    api_key_hash    TEXT            NOT NULL,
+    created_at      TIMESTAMPTZ     NOT NULL DEFAULT NOW(),
+    updated_at      TIMESTAMPTZ     NOT NULL DEFAULT NOW()
+);
+
+------------------------------------------------------------
+-- Trigger: update updated_at timestamp
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_gateway_registry_set_updated_at ON app.gateway_registry;
+CREATE TRIGGER trg_gateway_registry_set_updated_at
+BEFORE UPDATE ON app.gateway_registry
+FOR EACH ROW
+EXECUTE FUNCTION app.fn_set_updated_at();
+
+RESET ROLE;
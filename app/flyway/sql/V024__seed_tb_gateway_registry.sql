@@ -0,0 +1,19 @@
+-- V024__seed_tb_gateway_registry.sql
+------------------------------------------------------------
+-- Seed sample data into app.gateway_registry for development and testing.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+INSERT INTO app.gateway_registry (alias, gateway_uuid, api_key_hash)
+VALUES
+    ('gateway-001', '5f0c6a52-2f4e-4d7b-9a0e-3c1f9b8e2d71', '32da72fcbc87ace104e54574b40975df3f0cf81ac2a5df81201271b4e7220f68')
+ON CONFLICT (gateway_uuid) DO NOTHING;
+
+RESET ROLE;
+
+------------------------------------------------------------
+-- Confirm
+------------------------------------------------------------
+-- SELECT *
+-- FROM app.gateway_registry;
@@ -0,0 +1,155 @@
+-- V025__create_tb_telemetry_device_count.sql
+------------------------------------------------------------
+-- Create table app.telemetry_device_count
+--  per-device telemetry_event counters, maintained per statement.
+--
+--  Lock ordering: each statement locks its counter rows in
+--  device_uuid order, which prevents deadlocks only between
+--  single statements. A transaction that runs several
+--  telemetry_event INSERT/COPY statements locks counters in
+--  statement order and can deadlock with another one. Writers
+--  therefore commit after every such statement (one INSERT or
+--  one COPY chunk per transaction) and send their rows sorted
+--  by device_uuid, so row triggers lock in the same order too.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Table: app.telemetry_device_count
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app.telemetry_device_count (
+    device_uuid       UUID             PRIMARY KEY,
+    event_count       BIGINT           NOT NULL DEFAULT 0,
+    updated_at        TIMESTAMPTZ      NOT NULL DEFAULT NOW()
+);
+
+-- ==========================================
+-- Function: fn_count_telemetry_event_insert / _delete
+--   Apply one aggregated delta per device for the whole statement
+--   (a multi-row INSERT or COPY touches each counter row once).
+--   Rows are upserted in device_uuid order so concurrent multi-device
+--   statements lock counters in the same order (see header: this
+--   holds per statement, not across statements of one transaction).
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_insert()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO app.telemetry_device_count AS c (device_uuid, event_count, updated_at)
+    SELECT device_uuid, COUNT(*), NOW()
+    FROM new_rows
+    GROUP BY device_uuid
+    ORDER BY device_uuid
+    ON CONFLICT (device_uuid) DO UPDATE
+    SET
+        event_count = c.event_count + EXCLUDED.event_count,
+        updated_at  = EXCLUDED.updated_at;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_delete()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE app.telemetry_device_count AS c
+    SET
+        event_count = c.event_count - d.deleted,
+        updated_at  = NOW()
+    FROM (
+        SELECT device_uuid, COUNT(*) AS deleted
+        FROM old_rows
+        GROUP BY device_uuid
+        ORDER BY device_uuid
+    ) AS d
+    WHERE c.device_uuid = d.device_uuid;
+
+    RETURN NULL;
+END;
+$$;
+
+------------------------------------------------------------
+-- Triggers: statement-level, with transition tables
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_event_count_insert ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_count_insert
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_count_telemetry_event_insert();
+
+DROP TRIGGER IF EXISTS trg_telemetry_event_count_delete ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_count_delete
+AFTER DELETE ON app.telemetry_event
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_count_telemetry_event_delete();
+
+-- ==========================================
+-- Function: fn_reconcile_telemetry_device_count
+--   Verify and repair the counters of the next p_limit registered
+--   devices after p_after (keyset over device_uuid).
+--   Each counter row is locked before counting, so inserts for that
+--   device wait and then apply their delta to the repaired value.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_reconcile_telemetry_device_count(
+    p_after UUID,
+    p_limit INTEGER
+)
+RETURNS TABLE (
+    checked_device_uuid UUID,
+    stored_count        BIGINT,
+    actual_count        BIGINT
+)
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_device UUID;
+BEGIN
+    FOR v_device IN
+        SELECT dr.device_uuid
+        FROM app.device_registry AS dr
+        WHERE p_after IS NULL OR dr.device_uuid > p_after
+        ORDER BY dr.device_uuid
+        LIMIT p_limit
+    LOOP
+        INSERT INTO app.telemetry_device_count (device_uuid, event_count)
+        VALUES (v_device, 0)
+        ON CONFLICT (device_uuid) DO NOTHING;
+
+        SELECT c.event_count INTO stored_count
+        FROM app.telemetry_device_count AS c
+        WHERE c.device_uuid = v_device
+        FOR UPDATE;
+
+        SELECT COUNT(*) INTO actual_count
+        FROM app.telemetry_event AS e
+        WHERE e.device_uuid = v_device;
+
+        IF stored_count <> actual_count THEN
+            UPDATE app.telemetry_device_count AS c
+            SET event_count = actual_count, updated_at = NOW()
+            WHERE c.device_uuid = v_device;
+        END IF;
+
+        checked_device_uuid := v_device;
+        RETURN NEXT;
+    END LOOP;
+END;
+$$;
+
+------------------------------------------------------------
+-- Backfill: counters for events stored before this migration
+------------------------------------------------------------
+INSERT INTO app.telemetry_device_count (device_uuid, event_count)
+SELECT device_uuid, COUNT(*)
+FROM app.telemetry_event
+GROUP BY device_uuid
+ON CONFLICT (device_uuid) DO UPDATE
+SET event_count = EXCLUDED.event_count, updated_at = NOW();
+
+RESET ROLE;
@@ -0,0 +1,122 @@
+-- V026__create_tb_telemetry_count_stripe.sql
+------------------------------------------------------------
+-- Create table app.telemetry_count_stripe
+--  global telemetry_event total, split into stripes so concurrent
+--  inserts from different connections do not contend on one row.
+--
+--  Connections whose pg_backend_pid() % 16 collide share a stripe
+--  row. Its lock is taken after the statement's device counters,
+--  so single-statement transactions (see V025) still lock in one
+--  global order; colliding connections only queue on the stripe.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Table: app.telemetry_count_stripe
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app.telemetry_count_stripe (
+    stripe            SMALLINT         PRIMARY KEY,
+    event_count       BIGINT           NOT NULL DEFAULT 0,
+    updated_at        TIMESTAMPTZ      NOT NULL DEFAULT NOW()
+);
+
+-- 16 stripes; a connection always writes stripe pg_backend_pid() % 16
+INSERT INTO app.telemetry_count_stripe (stripe)
+SELECT s FROM generate_series(0, 15) AS s
+ON CONFLICT (stripe) DO NOTHING;
+
+-- ==========================================
+-- Function: fn_count_telemetry_event_insert / _delete
+--   Extends V025: besides the per-device counters, add the statement's
+--   row count to this connection's stripe.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_insert()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    INSERT INTO app.telemetry_device_count AS c (device_uuid, event_count, updated_at)
+    SELECT device_uuid, COUNT(*), NOW()
+    FROM new_rows
+    GROUP BY device_uuid
+    ORDER BY device_uuid
+    ON CONFLICT (device_uuid) DO UPDATE
+    SET
+        event_count = c.event_count + EXCLUDED.event_count,
+        updated_at  = EXCLUDED.updated_at;
+
+    SELECT COUNT(*) INTO v_rows FROM new_rows;
+
+    UPDATE app.telemetry_count_stripe
+    SET event_count = event_count + v_rows, updated_at = NOW()
+    WHERE stripe = pg_backend_pid() % 16;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_delete()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_rows BIGINT;
+BEGIN
+    UPDATE app.telemetry_device_count AS c
+    SET
+        event_count = c.event_count - d.deleted,
+        updated_at  = NOW()
+    FROM (
+        SELECT device_uuid, COUNT(*) AS deleted
+        FROM old_rows
+        GROUP BY device_uuid
+        ORDER BY device_uuid
+    ) AS d
+    WHERE c.device_uuid = d.device_uuid;
+
+    SELECT COUNT(*) INTO v_rows FROM old_rows;
+
+    UPDATE app.telemetry_count_stripe
+    SET event_count = event_count - v_rows, updated_at = NOW()
+    WHERE stripe = pg_backend_pid() % 16;
+
+    RETURN NULL;
+END;
+$$;
+
+-- ==========================================
+-- Function: fn_count_telemetry_event_truncate
+--   TRUNCATE fires no row/transition triggers; reset every counter.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_count_telemetry_event_truncate()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    UPDATE app.telemetry_device_count SET event_count = 0, updated_at = NOW();
+    UPDATE app.telemetry_count_stripe SET event_count = 0, updated_at = NOW();
+
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_telemetry_event_count_truncate ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_count_truncate
+AFTER TRUNCATE ON app.telemetry_event
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_count_telemetry_event_truncate();
+
+------------------------------------------------------------
+-- Backfill: the existing total goes into stripe 0
+------------------------------------------------------------
+UPDATE app.telemetry_count_stripe
+SET
+    event_count = CASE WHEN stripe = 0
+                       THEN (SELECT COUNT(*) FROM app.telemetry_event)
+                       ELSE 0 END,
+    updated_at  = NOW();
+
+RESET ROLE;
@@ -0,0 +1,193 @@
+-- V027__create_tb_telemetry_rollup_minute.sql
+------------------------------------------------------------
+-- Create table app.telemetry_rollup_minute
+--  per-device, per-minute aggregates of telemetry_event,
+--  maintained per statement. Coarser resolutions are merged
+--  from these rows at query time (sums and counts, not averages,
+--  are stored so merging stays exact).
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Table: app.telemetry_rollup_minute
+------------------------------------------------------------
+CREATE TABLE IF NOT EXISTS app.telemetry_rollup_minute (
+    device_uuid       UUID             NOT NULL,
+    bucket_start      TIMESTAMPTZ      NOT NULL,
+    event_count       BIGINT           NOT NULL,
+    sum_x             DOUBLE PRECISION NOT NULL,
+    sum_y             DOUBLE PRECISION NOT NULL,
+    min_x             DOUBLE PRECISION NOT NULL,
+    max_x             DOUBLE PRECISION NOT NULL,
+    min_y             DOUBLE PRECISION NOT NULL,
+    max_y             DOUBLE PRECISION NOT NULL,
+    first_time        TIMESTAMPTZ      NOT NULL,
+    last_time         TIMESTAMPTZ      NOT NULL,
+    updated_at        TIMESTAMPTZ      NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (device_uuid, bucket_start)
+);
+
+-- ==========================================
+-- Function: fn_rollup_telemetry_event_insert
+--   Merge one aggregated row per (device, minute) of the statement
+--   into the rollup, in key order so concurrent statements lock
+--   rollup rows in the same order.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_rollup_telemetry_event_insert()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO app.telemetry_rollup_minute AS r (
+        device_uuid, bucket_start, event_count,
+        sum_x, sum_y, min_x, max_x, min_y, max_y,
+        first_time, last_time, updated_at
+    )
+    SELECT
+        device_uuid,
+        date_trunc('minute', system_time_utc),
+        COUNT(*),
+        SUM(x_coord), SUM(y_coord),
+        MIN(x_coord), MAX(x_coord),
+        MIN(y_coord), MAX(y_coord),
+        MIN(system_time_utc), MAX(system_time_utc),
+        NOW()
+    FROM new_rows
+    GROUP BY 1, 2
+    ORDER BY 1, 2
+    ON CONFLICT (device_uuid, bucket_start) DO UPDATE
+    SET
+        event_count = r.event_count + EXCLUDED.event_count,
+        sum_x       = r.sum_x + EXCLUDED.sum_x,
+        sum_y       = r.sum_y + EXCLUDED.sum_y,
+        min_x       = LEAST(r.min_x, EXCLUDED.min_x),
+        max_x       = GREATEST(r.max_x, EXCLUDED.max_x),
+        min_y       = LEAST(r.min_y, EXCLUDED.min_y),
+        max_y       = GREATEST(r.max_y, EXCLUDED.max_y),
+        first_time  = LEAST(r.first_time, EXCLUDED.first_time),
+        last_time   = GREATEST(r.last_time, EXCLUDED.last_time),
+        updated_at  = EXCLUDED.updated_at;
+
+    RETURN NULL;
+END;
+$$;
+
+-- ==========================================
+-- Function: fn_rollup_telemetry_event_delete
+--   Min/max cannot be decremented, so the minutes touched by the
+--   statement are recomputed from the remaining telemetry_event rows
+--   (deletes are rare: retention and cleanup jobs).
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_rollup_telemetry_event_delete()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM app.telemetry_rollup_minute AS r
+    USING (
+        SELECT DISTINCT device_uuid, date_trunc('minute', system_time_utc) AS bucket_start
+        FROM old_rows
+    ) AS t
+    WHERE r.device_uuid = t.device_uuid
+      AND r.bucket_start = t.bucket_start;
+
+    INSERT INTO app.telemetry_rollup_minute AS r (
+        device_uuid, bucket_start, event_count,
+        sum_x, sum_y, min_x, max_x, min_y, max_y,
+        first_time, last_time, updated_at
+    )
+    SELECT
+        e.device_uuid,
+        t.bucket_start,
+        COUNT(*),
+        SUM(e.x_coord), SUM(e.y_coord),
+        MIN(e.x_coord), MAX(e.x_coord),
+        MIN(e.y_coord), MAX(e.y_coord),
+        MIN(e.system_time_utc), MAX(e.system_time_utc),
+        NOW()
+    FROM (
+        SELECT DISTINCT device_uuid, date_trunc('minute', system_time_utc) AS bucket_start
+        FROM old_rows
+    ) AS t
+    JOIN app.telemetry_event AS e
+      ON e.device_uuid = t.device_uuid
+     AND e.system_time_utc >= t.bucket_start
+     AND e.system_time_utc <  t.bucket_start + INTERVAL '1 minute'
+    GROUP BY 1, 2
+    ORDER BY 1, 2
+    ON CONFLICT (device_uuid, bucket_start) DO UPDATE
+    SET
+        event_count = EXCLUDED.event_count,
+        sum_x       = EXCLUDED.sum_x,
+        sum_y       = EXCLUDED.sum_y,
+        min_x       = EXCLUDED.min_x,
+        max_x       = EXCLUDED.max_x,
+        min_y       = EXCLUDED.min_y,
+        max_y       = EXCLUDED.max_y,
+        first_time  = EXCLUDED.first_time,
+        last_time   = EXCLUDED.last_time,
+        updated_at  = EXCLUDED.updated_at;
+
+    RETURN NULL;
+END;
+$$;
+
+-- ==========================================
+-- Function: fn_rollup_telemetry_event_truncate
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_rollup_telemetry_event_truncate()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    DELETE FROM app.telemetry_rollup_minute;
+
+    RETURN NULL;
+END;
+$$;
+
+------------------------------------------------------------
+-- Triggers: statement-level, with transition tables
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_event_rollup_insert ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_rollup_insert
+AFTER INSERT ON app.telemetry_event
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_rollup_telemetry_event_insert();
+
+DROP TRIGGER IF EXISTS trg_telemetry_event_rollup_delete ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_rollup_delete
+AFTER DELETE ON app.telemetry_event
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_rollup_telemetry_event_delete();
+
+DROP TRIGGER IF EXISTS trg_telemetry_event_rollup_truncate ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_event_rollup_truncate
+AFTER TRUNCATE ON app.telemetry_event
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_rollup_telemetry_event_truncate();
+
+------------------------------------------------------------
+-- Backfill: rollups for events stored before this migration
+------------------------------------------------------------
+INSERT INTO app.telemetry_rollup_minute (
+    device_uuid, bucket_start, event_count,
+    sum_x, sum_y, min_x, max_x, min_y, max_y,
+    first_time, last_time
+)
+SELECT
+    device_uuid,
+    date_trunc('minute', system_time_utc),
+    COUNT(*),
+    SUM(x_coord), SUM(y_coord),
+    MIN(x_coord), MAX(x_coord),
+    MIN(y_coord), MAX(y_coord),
+    MIN(system_time_utc), MAX(system_time_utc)
+FROM app.telemetry_event
+GROUP BY 1, 2
+ON CONFLICT (device_uuid, bucket_start) DO NOTHING;
+
+RESET ROLE;
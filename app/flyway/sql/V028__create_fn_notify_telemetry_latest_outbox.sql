@@ -0,0 +1,36 @@
+-- V028__create_fn_notify_telemetry_latest_outbox.sql
+------------------------------------------------------------
+-- Wake the Redis sync worker when telemetry_latest_outbox
+-- receives rows, instead of waiting for its next poll.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+-- ==========================================
+-- Function: fn_notify_telemetry_latest_outbox
+--   NOTIFY once per INSERT statement on telemetry_event (whose
+--   row trigger fills the outbox). Identical notifications are
+--   folded by Postgres within a transaction and delivered at
+--   commit, so listeners never see uncommitted outbox rows.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_notify_telemetry_latest_outbox()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify('telemetry_latest_outbox', '');
+
+    RETURN NULL;
+END;
+$$;
+
+------------------------------------------------------------
+-- Trigger: statement-level, after insert on telemetry_event
+------------------------------------------------------------
+DROP TRIGGER IF EXISTS trg_telemetry_latest_outbox_notify ON app.telemetry_event;
+CREATE TRIGGER trg_telemetry_latest_outbox_notify
+AFTER INSERT ON app.telemetry_event
+FOR EACH STATEMENT
+EXECUTE FUNCTION app.fn_notify_telemetry_latest_outbox();
+
+RESET ROLE;
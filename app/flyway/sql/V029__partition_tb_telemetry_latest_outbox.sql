@@ -0,0 +1,279 @@
+-- V029__partition_tb_telemetry_latest_outbox.sql
+------------------------------------------------------------
+-- Partition app.telemetry_latest_outbox by created_at (one
+-- partition per UTC day) so old messages are removed by
+-- dropping partitions instead of DELETE + VACUUM.
+--
+--  - PRIMARY KEY becomes (outbox_id, created_at): unique
+--    constraints must include the partition key. The unique
+--    index on telemetry_event_id is dropped with it; the row
+--    trigger fires once per event, so it never deduplicated.
+--  - outbox_id moves from an identity column to a sequence
+--    default, which partitioned tables support on Postgres 16.
+--  - A DEFAULT partition catches rows when no daily partition
+--    exists yet, so telemetry inserts never fail on a missing
+--    partition.
+------------------------------------------------------------
+
+SET LOCAL ROLE app_owner;
+
+------------------------------------------------------------
+-- Keep the old table aside until unprocessed rows are copied
+------------------------------------------------------------
+ALTER TABLE app.telemetry_latest_outbox RENAME TO telemetry_latest_outbox_legacy;
+ALTER TABLE app.telemetry_latest_outbox_legacy
+    RENAME CONSTRAINT telemetry_latest_outbox_pkey TO telemetry_latest_outbox_legacy_pkey;
+
+CREATE SEQUENCE IF NOT EXISTS app.telemetry_latest_outbox_outbox_id_seq AS BIGINT;
+
+SELECT setval(
+    'app.telemetry_latest_outbox_outbox_id_seq',
+    COALESCE((SELECT MAX(outbox_id) FROM app.telemetry_latest_outbox_legacy), 0) + 1,
+    false
+);
+
+------------------------------------------------------------
+-- Table: app.telemetry_latest_outbox (partitioned)
+------------------------------------------------------------
+CREATE TABLE app.telemetry_latest_outbox (
+    outbox_id           BIGINT      NOT NULL DEFAULT nextval('app.telemetry_latest_outbox_outbox_id_seq'),
+    telemetry_event_id  BIGINT      NOT NULL,
+    device_uuid         UUID        NOT NULL,
+    -- metadata
+    event_type          TEXT        NOT NULL DEFAULT 'TELEMETRY_EVENT_INSERTED',
+    version             BIGINT      NOT NULL,
+    system_time_utc     TIMESTAMPTZ NOT NULL,
+    created_at          TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    -- delivery
+    status              TEXT        NOT NULL DEFAULT 'NEW'
+                         CHECK (status IN ('NEW','PROCESSING','PROCESSED','FAILED')),
+    attempts            INTEGER     NOT NULL DEFAULT 0,
+    processed_at        TIMESTAMPTZ NULL,
+    last_error          TEXT        NULL,
+
+    payload             JSONB       NOT NULL,
+
+    PRIMARY KEY (outbox_id, created_at)
+) PARTITION BY RANGE (created_at);
+
+ALTER SEQUENCE app.telemetry_latest_outbox_outbox_id_seq
+    OWNED BY app.telemetry_latest_outbox.outbox_id;
+
+CREATE TABLE IF NOT EXISTS app.telemetry_latest_outbox_default
+    PARTITION OF app.telemetry_latest_outbox DEFAULT;
+
+-- ==========================================
+-- Function: fn_create_telemetry_latest_outbox_partitions
+--   Create the daily partitions for today .. today + p_days_ahead
+--   (UTC) that do not exist yet; returns how many were created.
+--   SECURITY DEFINER so the application role can run it.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_create_telemetry_latest_outbox_partitions(
+    p_days_ahead INTEGER
+)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, pg_temp
+SET lock_timeout = '2s'
+AS $$
+DECLARE
+    v_today   DATE := (NOW() AT TIME ZONE 'UTC')::DATE;
+    v_day     DATE;
+    v_part    TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    FOR v_day IN
+        SELECT d::DATE
+        FROM generate_series(v_today, v_today + p_days_ahead, INTERVAL '1 day') AS d
+    LOOP
+        v_part := 'telemetry_latest_outbox_p' || to_char(v_day, 'YYYYMMDD');
+        CONTINUE WHEN to_regclass('app.' || v_part) IS NOT NULL;
+
+        BEGIN
+            EXECUTE format(
+                'CREATE TABLE app.%I PARTITION OF app.telemetry_latest_outbox '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_part,
+                v_day::TIMESTAMP AT TIME ZONE 'UTC',
+                (v_day + 1)::TIMESTAMP AT TIME ZONE 'UTC'
+            );
+            v_created := v_created + 1;
+        EXCEPTION
+            -- rows for this day already sit in the default partition
+            WHEN check_violation OR lock_not_available THEN
+                RAISE WARNING 'Could not create outbox partition %: %', v_part, SQLERRM;
+        END;
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$;
+
+-- ==========================================
+-- Functions: expired / drop / purge
+--   Partition removal is split so the caller can run each step in
+--   its own short transaction: DETACH PARTITION locks the parent
+--   table (blocking telemetry inserts, whose trigger writes the
+--   outbox) until commit, so that lock must not also cover the
+--   pending-row scans of other partitions or the default cleanup.
+-- ==========================================
+
+-- Daily partitions that ended more than p_retention ago (no locks)
+CREATE OR REPLACE FUNCTION app.fn_expired_telemetry_latest_outbox_partitions(
+    p_retention INTERVAL
+)
+RETURNS TABLE (partition_name TEXT)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT c.relname::TEXT
+    FROM pg_inherits AS i
+    JOIN pg_class AS c ON c.oid = i.inhrelid
+    WHERE i.inhparent = 'app.telemetry_latest_outbox'::REGCLASS
+      AND c.relname ~ '^telemetry_latest_outbox_p[0-9]{8}$'
+      AND (to_date(right(c.relname, 8), 'YYYYMMDD') + 1)::TIMESTAMP AT TIME ZONE 'UTC'
+          <= NOW() - p_retention
+    ORDER BY c.relname;
+$$;
+
+-- Drop one expired daily partition unless it still holds NEW/PROCESSING
+-- rows (PROCESSED and FAILED are final). Returns whether it was dropped.
+CREATE OR REPLACE FUNCTION app.fn_drop_telemetry_latest_outbox_partition(
+    p_partition TEXT
+)
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, pg_temp
+SET lock_timeout = '2s'
+AS $$
+DECLARE
+    v_pending BOOLEAN;
+BEGIN
+    -- SECURITY DEFINER: only ever touch daily partitions of the outbox
+    IF p_partition !~ '^telemetry_latest_outbox_p[0-9]{8}$' OR NOT EXISTS (
+        SELECT 1
+        FROM pg_inherits AS i
+        WHERE i.inhparent = 'app.telemetry_latest_outbox'::REGCLASS
+          AND i.inhrelid = to_regclass('app.' || p_partition)
+    ) THEN
+        RETURN FALSE;
+    END IF;
+
+    -- scan before DETACH so the parent lock is held only for detach + drop
+    EXECUTE format(
+        'SELECT EXISTS (SELECT 1 FROM app.%I WHERE status IN (''NEW'', ''PROCESSING''))',
+        p_partition
+    ) INTO v_pending;
+    IF v_pending THEN
+        RETURN FALSE;
+    END IF;
+
+    EXECUTE format('ALTER TABLE app.telemetry_latest_outbox DETACH PARTITION app.%I', p_partition);
+    EXECUTE format('DROP TABLE app.%I', p_partition);
+    RETURN TRUE;
+EXCEPTION
+    WHEN lock_not_available THEN
+        RAISE WARNING 'Could not drop outbox partition %: %', p_partition, SQLERRM;
+        RETURN FALSE;
+END;
+$$;
+
+-- Delete finished rows older than p_retention that landed in the
+-- default partition (row locks only); returns the number deleted.
+CREATE OR REPLACE FUNCTION app.fn_purge_telemetry_latest_outbox_default(
+    p_retention INTERVAL
+)
+RETURNS BIGINT
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, pg_temp
+AS $$
+DECLARE
+    v_deleted BIGINT;
+BEGIN
+    DELETE FROM app.telemetry_latest_outbox_default
+    WHERE status IN ('PROCESSED', 'FAILED')
+      AND created_at < NOW() - p_retention;
+
+    GET DIAGNOSTICS v_deleted = ROW_COUNT;
+    RETURN v_deleted;
+END;
+$$;
+
+SELECT app.fn_create_telemetry_latest_outbox_partitions(3);
+
+------------------------------------------------------------
+-- Carry over undelivered messages, then drop the old table
+------------------------------------------------------------
+INSERT INTO app.telemetry_latest_outbox (
+    outbox_id, telemetry_event_id, device_uuid, event_type, version,
+    system_time_utc, created_at, status, attempts, processed_at,
+    last_error, payload
+)
+SELECT
+    outbox_id, telemetry_event_id, device_uuid, event_type, version,
+    system_time_utc, created_at, status, attempts, processed_at,
+    last_error, payload
+FROM app.telemetry_latest_outbox_legacy
+WHERE status IN ('NEW', 'PROCESSING');
+
+DROP TABLE app.telemetry_latest_outbox_legacy;
+
+------------------------------------------------------------
+-- Indexes (created on every partition)
+------------------------------------------------------------
+-- Index for status and created_at
+CREATE INDEX IF NOT EXISTS idx_outbox_status_created_at
+    ON app.telemetry_latest_outbox (status, created_at);
+
+-- Index for device_uuid
+CREATE INDEX IF NOT EXISTS idx_outbox_device_uuid_created_at
+    ON app.telemetry_latest_outbox (device_uuid, created_at);
+
+-- Index for unprocessed rows
+CREATE INDEX IF NOT EXISTS idx_outbox_new_created_at
+    ON app.telemetry_latest_outbox (created_at)
+    WHERE status = 'NEW';
+
+-- ==========================================
+-- Function: fn_outbox_telemetry_latest
+--   Same as V013 without ON CONFLICT (telemetry_event_id), which
+--   has no unique index to target on the partitioned table.
+-- ==========================================
+CREATE OR REPLACE FUNCTION app.fn_outbox_telemetry_latest()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    INSERT INTO app.telemetry_latest_outbox (
+        telemetry_event_id,
+        device_uuid,
+        event_type,
+        version,
+        system_time_utc,
+        payload
+    )
+    VALUES (
+        NEW.id,
+        NEW.device_uuid,
+        'TELEMETRY_EVENT_INSERTED',
+        NEW.id,
+        NEW.system_time_utc,
+        jsonb_build_object(
+            'id', NEW.id,
+            'device_uuid', NEW.device_uuid,
+            'x_coord', NEW.x_coord,
+            'y_coord', NEW.y_coord,
+            'device_time', NEW.device_time,
+            'system_time_utc', NEW.system_time_utc
+        )
+    );
+
+    RETURN NEW;
+END;
+$$;
+
+RESET ROLE;
@@ -10,6 +10,7 @@ from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from .mq.kafka_consumer import init_consumer, close_consumer, get_consumer
+from .mq import CODEC_BINARY, CODEC_JSON, decode_binary, header_codec
 from .db import async_session_maker
 from .models import TelemetryEvent
 from .schemas import TelemetryItem
@@ -35,6 +36,21 @@ def to_db_row(item: TelemetryItem) -> dict:
     }
 
 
+def decode_message(value: bytes, headers) -> dict:
+    """
+    Decode a Kafka message value into a TelemetryEvent row dict.
+
+    The `codec` header selects the format; messages without it are JSON.
+    Binary payloads have a fixed layout and skip pydantic validation.
+    """
+    codec = header_codec(headers)
+    if codec == CODEC_BINARY:
+        return decode_binary(value)
+    if codec == CODEC_JSON:
+        return to_db_row(TelemetryItem.model_validate_json(value))
+    raise ValueError(f"Unsupported telemetry codec: {codec}")
+
+
 async def flush_batch(
     *,
     consumer,
@@ -50,6 +66,9 @@ async def flush_batch(
     if not rows:
         return
 
+    # device order, so telemetry_event triggers lock rows like other writers
+    rows.sort(key=lambda r: r["device_uuid"])
+
     async with async_session_maker() as db:
         try:
             await db.execute(insert(TelemetryEvent).values(rows))
@@ -110,13 +129,11 @@ async def main() -> None:
             if records_map:
                 for tp, records in records_map.items():
                     for msg in records:
-                        payload = msg.value  # already dict via value_deserializer
-
                         try:
-                            item = TelemetryItem.model_validate(payload)
+                            row = decode_message(msg.value, msg.headers)
                         except Exception:
                             logger.exception(
-                                "Invalid TelemetryItem payload; skipping",
+                                "Invalid telemetry payload; skipping",
                                 extra={
                                     "topic": msg.topic, "partition": msg.partition, "offset": msg.offset},
                             )
@@ -125,7 +142,7 @@ async def main() -> None:
                             await consumer.commit({TopicPartition(msg.topic, msg.partition): msg.offset + 1})
                             continue
 
-                        rows.append(to_db_row(item))
+                        rows.append(row)
 
                         msg_tp = TopicPartition(msg.topic, msg.partition)
                         first_offsets.setdefault(msg_tp, msg.offset)
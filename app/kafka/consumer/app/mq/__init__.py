@@ -1,7 +1,12 @@
 from .kafka_consumer import init_consumer, close_consumer, get_consumer
+from .telemetry_codec import CODEC_BINARY, CODEC_JSON, decode_binary, header_codec
 
 __all__ = [
     "init_consumer",
     "close_consumer",
-    "get_consumer"
+    "get_consumer",
+    "CODEC_BINARY",
+    "CODEC_JSON",
+    "decode_binary",
+    "header_codec",
 ]
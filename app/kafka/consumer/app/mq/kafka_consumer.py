@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import ssl
 from typing import Optional
 
@@ -45,7 +44,7 @@ async def init_consumer() -> AIOKafkaConsumer:
             "group_id": settings.kafka.group_id,
             "auto_offset_reset": settings.kafka.auto_offset_reset,
             "enable_auto_commit": False,
-            "value_deserializer": lambda v: json.loads(v.decode("utf-8")),
+            # raw bytes: payloads are decoded per message by telemetry_codec
             "request_timeout_ms": 40000,
             "session_timeout_ms": 30000,
             "heartbeat_interval_ms": 10000,
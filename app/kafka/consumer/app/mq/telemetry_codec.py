@@ -0,0 +1,92 @@
+# mq/telemetry_codec.py
+from __future__ import annotations
+
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+from typing import Literal, Optional, Sequence
+from uuid import UUID
+
+# Kafka header naming the payload encoding. Messages without it are JSON, so
+# producers and consumers can be upgraded independently.
+CODEC_HEADER = "codec"
+CODEC_JSON = "json"
+CODEC_BINARY = "tlm-bin"
+
+Codec = Literal["json", "tlm-bin"]
+
+# Binary layout, version 1 (big-endian, 49 bytes):
+#   version u8 | device_uuid 16B | x_coord f64 | y_coord f64
+#   | device_time i64 µs | system_time_utc i64 µs   (µs since Unix epoch, UTC)
+BINARY_VERSION = 1
+_BINARY_V1 = struct.Struct(">B16sddqq")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def encode_binary(
+    device_uuid: UUID,
+    x_coord: float,
+    y_coord: float,
+    device_time: datetime,
+    system_time_utc: datetime,
+) -> bytes:
+    """Encode one telemetry event in the fixed binary layout."""
+    return _BINARY_V1.pack(
+        BINARY_VERSION,
+        device_uuid.bytes,
+        x_coord,
+        y_coord,
+        _to_micros(device_time),
+        _to_micros(system_time_utc),
+    )
+
+
+def decode_binary(data: bytes) -> dict:
+    """
+    Decode a binary telemetry event into a telemetry_event row dict.
+
+    Raises ValueError on an unknown version or a malformed payload.
+    """
+    if not data or data[0] != BINARY_VERSION:
+        raise ValueError(f"Unsupported telemetry binary version: {data[:1]!r}")
+    if len(data) != _BINARY_V1.size:
+        raise ValueError(f"Invalid telemetry binary length: {len(data)}")
+
+    _, uuid_bytes, x_coord, y_coord, device_us, system_us = _BINARY_V1.unpack(data)
+    return {
+        "device_uuid": UUID(bytes=uuid_bytes),
+        "x_coord": x_coord,
+        "y_coord": y_coord,
+        "device_time": _from_micros(device_us),
+        "system_time_utc": _from_micros(system_us),
+    }
+
+
+def codec_headers(codec: Codec) -> list[tuple[str, bytes]]:
+    """Kafka headers announcing the payload encoding."""
+    return [(CODEC_HEADER, codec.encode("ascii"))]
+
+
+def header_codec(headers: Optional[Sequence[tuple[str, bytes]]]) -> str:
+    """Return the codec named in message headers; JSON when absent."""
+    for key, value in headers or ():
+        if key == CODEC_HEADER:
+            return value.decode("ascii")
+    return CODEC_JSON
+
+
+def encode_json(value: dict) -> bytes:
+    """Encode a JSON-mode telemetry dict."""
+    return json.dumps(value).encode("utf-8")
@@ -1,7 +1,25 @@
-from .func import fetch_all_latest, sync_latest_rows_to_redis, sync_telemetry_count
+from .func import (
+    fetch_all_latest,
+    shard_filter,
+    stream_all_latest,
+    sync_latest_rows_to_redis,
+    sync_telemetry_count,
+)
+from .outbox import (
+    claim_outbox_batch,
+    collapse_newest_per_device,
+    drain_outbox,
+    process_outbox_batch,
+)
 
 __all__ = [
     "fetch_all_latest",
+    "shard_filter",
+    "stream_all_latest",
     "sync_latest_rows_to_redis",
     "sync_telemetry_count",
+    "claim_outbox_batch",
+    "collapse_newest_per_device",
+    "drain_outbox",
+    "process_outbox_batch",
 ]
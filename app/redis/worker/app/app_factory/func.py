@@ -1,20 +1,27 @@
 # app_factory/func.py
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Sequence, Iterable
+from typing import AsyncIterable, AsyncIterator, Collection, Sequence, Iterable
 
-from sqlalchemy import select, update, func
+from sqlalchemy import Integer, Text, any_, bindparam, cast, select, true, update, func
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models import TelemetryLatest, TelemetryEvent
+from ..models import TelemetryCountStripe, TelemetryLatest
 from ..db.redis import redis_client
 
 logger = logging.getLogger(__name__)
 
+# Rows per Redis pipeline and per server-side cursor fetch
 BATCH_SIZE = 1000
+# Pipelines in flight at once; bounds worker memory and Redis bursts
+MAX_INFLIGHT_PIPELINES = 4
 TELEMETRY_COUNT_KEY = "telemetry:count"
+TELEMETRY_COUNT_AS_OF_KEY = "telemetry:count:as_of"
 TELEMETRY_LATEST = "telemetry:latest"
 LUA_SET_IF_NEWER = """
 local data_key = KEYS[1]
@@ -46,12 +53,53 @@ def _redis_keys(device_uuid: str) -> tuple[str, str]:
     return data_key, ver_key
 
 
-async def fetch_all_latest(session: AsyncSession) -> Sequence[TelemetryLatest]:
-    stmt = select(TelemetryLatest)
+def shard_filter(device_uuid_column, shards: Collection[int], slots: int) -> ColumnElement[bool]:
+    """
+    WHERE clause keeping devices whose shard is in `shards`.
+
+    shard = (hashtext(device_uuid::text) & 0x7fffffff) % slots, computed by
+    Postgres so every replica agrees; with one slot everything matches.
+    """
+    if slots <= 1:
+        return true()
+    shard = func.hashtext(cast(device_uuid_column, Text)).op("&")(0x7FFFFFFF) % slots
+    return shard == any_(bindparam("shards", value=sorted(shards), type_=ARRAY(Integer)))
+
+
+async def fetch_all_latest(
+    session: AsyncSession,
+    shards: Collection[int] = (0,),
+    slots: int = 1,
+) -> Sequence[TelemetryLatest]:
+    stmt = select(TelemetryLatest).where(
+        shard_filter(TelemetryLatest.device_uuid, shards, slots)
+    )
     result = await session.execute(stmt)
     return result.scalars().all()
 
 
+async def stream_all_latest(
+    session: AsyncSession,
+    shards: Collection[int] = (0,),
+    slots: int = 1,
+) -> AsyncIterator:
+    """
+    Like fetch_all_latest, but streamed from a server-side cursor.
+
+    Rows are fetched BATCH_SIZE at a time as plain column rows (no ORM
+    identity map), so memory stays flat however large the fleet is.
+    """
+    latest = TelemetryLatest.__table__
+    stmt = (
+        select(latest)
+        .where(shard_filter(latest.c.device_uuid, shards, slots))
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    result = await session.stream(stmt)
+    async for row in result:
+        yield row
+
+
 def _row_to_payload(row: TelemetryLatest) -> dict:
     return {
         "device_uuid": str(row.device_uuid),
@@ -63,50 +111,117 @@ def _row_to_payload(row: TelemetryLatest) -> dict:
     }
 
 
-async def sync_latest_rows_to_redis(session: AsyncSession, rows: Iterable[TelemetryLatest]) -> int:
-    """
-    Full refresh: writes every device latest row to Redis.
-    Version guard ensures Redis never regresses.
-
-    Returns:
-        Number of rows that actually updated Redis (Lua returned 1).
-    """
-    sha = await _get_lua_sha()
+async def _chunked(
+    rows: Iterable[TelemetryLatest] | AsyncIterable[TelemetryLatest],
+    size: int,
+) -> AsyncIterator[list[TelemetryLatest]]:
+    """Group rows (sync or async iterable) into lists of at most size."""
+    chunk: list[TelemetryLatest] = []
+    if isinstance(rows, AsyncIterable):
+        async for r in rows:
+            chunk.append(r)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for r in rows:
+            chunk.append(r)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _flush_chunk(sha: str, rows: Sequence[TelemetryLatest]) -> tuple[int, int]:
+    """Run one pipeline of Lua calls; returns (updated, total)."""
     pipe = redis_client.pipeline(transaction=False)
-
-    # Queue all Lua calls in a pipeline
     for r in rows:
-        device_uuid_str = str(r.device_uuid)
-        data_key, ver_key = _redis_keys(device_uuid_str)
+        data_key, ver_key = _redis_keys(str(r.device_uuid))
         version = int(r.system_time_utc.timestamp() * 1000)
         payload_json = json.dumps(_row_to_payload(
             r), separators=(",", ":"), default=str)
-
-        logger.debug(f"{payload_json}")
-
         pipe.evalsha(sha, 2, data_key, ver_key, str(version), payload_json)
 
     results = await pipe.execute()
+    return sum(1 for x in results if int(x) == 1), len(results)
+
+
+async def sync_latest_rows_to_redis(
+    session: AsyncSession,
+    rows: Iterable[TelemetryLatest] | AsyncIterable[TelemetryLatest],
+) -> int:
+    """
+    Full refresh: writes every device latest row to Redis.
+    Version guard ensures Redis never regresses.
+
+    Rows (a list or a stream such as stream_all_latest) are sent in
+    pipelines of BATCH_SIZE, with at most MAX_INFLIGHT_PIPELINES in flight;
+    reading the next chunk waits for a free slot, so neither the worker nor
+    Redis ever holds more than a few chunks.
+
+    Returns:
+        Number of rows that actually updated Redis (Lua returned 1).
+    """
+    sha = await _get_lua_sha()
+    inflight: set[asyncio.Task] = set()
+    updated_count = 0
+    total = 0
+
+    def collect(done: set[asyncio.Task]) -> None:
+        nonlocal updated_count, total
+        for task in done:
+            updated, sent = task.result()
+            updated_count += updated
+            total += sent
+
+    try:
+        async for chunk in _chunked(rows, BATCH_SIZE):
+            if len(inflight) >= MAX_INFLIGHT_PIPELINES:
+                done, inflight = await asyncio.wait(
+                    inflight, return_when=asyncio.FIRST_COMPLETED,
+                )
+                collect(done)
+            inflight.add(asyncio.create_task(_flush_chunk(sha, chunk)))
+
+        if inflight:
+            done, inflight = await asyncio.wait(inflight)
+            collect(done)
+    finally:
+        # first failure (or cancellation) stops the remaining pipelines
+        for task in inflight:
+            task.cancel()
+        if inflight:
+            await asyncio.gather(*inflight, return_exceptions=True)
 
-    updated_count = sum(1 for x in results if int(x) == 1)
     logger.debug("Redis sync completed. updated=%d total=%d",
-                 updated_count, len(results))
+                 updated_count, total)
     return updated_count
 
 
 async def sync_telemetry_count(session: AsyncSession) -> int:
     """
-    Read total telemetry event count from Postgres and write it to Redis.
+    Read the maintained telemetry event total from Postgres and write it to Redis.
+
+    The total is the sum of the telemetry_count_stripe rows (constant cost),
+    stored with the Postgres time it was read at under TELEMETRY_COUNT_AS_OF_KEY.
 
     Returns:
         The telemetry_count written to Redis.
     """
-    stmt = select(func.count()).select_from(TelemetryEvent)
+    stmt = select(
+        func.coalesce(func.sum(TelemetryCountStripe.event_count), 0),
+        func.now(),
+    )
     result = await session.execute(stmt)
-    telemetry_count = int(result.scalar_one())
+    telemetry_count, as_of = result.one()
+    telemetry_count = int(telemetry_count)
 
     # Store as string (Redis stores strings); easy to INCR/GET later too
-    await redis_client.set(TELEMETRY_COUNT_KEY, str(telemetry_count))
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.set(TELEMETRY_COUNT_KEY, str(telemetry_count))
+    pipe.set(TELEMETRY_COUNT_AS_OF_KEY, as_of.isoformat())
+    await pipe.execute()
 
     logger.debug("Synced telemetry count to Redis: %s=%d",
                  TELEMETRY_COUNT_KEY, telemetry_count)
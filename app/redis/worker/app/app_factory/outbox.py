@@ -0,0 +1,170 @@
+# app_factory/outbox.py
+from __future__ import annotations
+
+import logging
+from typing import Collection, Iterable, Sequence
+from uuid import UUID
+
+from sqlalchemy import BigInteger, Row, any_, bindparam, case, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db import async_session_maker
+from ..models import TelemetryLatest, TelemetryLatestOutbox
+from .func import shard_filter, sync_latest_rows_to_redis
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_NEW = "NEW"
+OUTBOX_PROCESSED = "PROCESSED"
+OUTBOX_FAILED = "FAILED"
+
+MAX_ERROR_LENGTH = 1000
+
+
+async def claim_outbox_batch(
+    session: AsyncSession,
+    batch_size: int,
+    shards: Collection[int] = (0,),
+    slots: int = 1,
+) -> Sequence[Row]:
+    """
+    Lock up to batch_size NEW outbox rows of the given shards, oldest first.
+
+    SKIP LOCKED lets several workers drain the outbox concurrently without
+    waiting on (or double-processing) each other's rows. The locks are held
+    until the caller's transaction ends.
+    """
+    outbox = TelemetryLatestOutbox
+    stmt = (
+        select(outbox.outbox_id, outbox.device_uuid, outbox.version, outbox.system_time_utc)
+        # inlined so generic plans can still use the partial "status = 'NEW'" index
+        .where(
+            outbox.status == literal(OUTBOX_NEW, literal_execute=True),
+            shard_filter(outbox.device_uuid, shards, slots),
+        )
+        .order_by(outbox.created_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(stmt)
+    return result.all()
+
+
+def collapse_newest_per_device(rows: Iterable[Row]) -> dict[UUID, Row]:
+    """Keep only the newest outbox row per device, by (system_time_utc, version)."""
+    newest: dict[UUID, Row] = {}
+    for row in rows:
+        current = newest.get(row.device_uuid)
+        if current is None or (row.system_time_utc, row.version) > (
+            current.system_time_utc, current.version
+        ):
+            newest[row.device_uuid] = row
+    return newest
+
+
+async def process_outbox_batch(
+    session: AsyncSession,
+    batch_size: int,
+    max_attempts: int,
+    shards: Collection[int] = (0,),
+    slots: int = 1,
+) -> int:
+    """
+    Claim one outbox batch of the given shards, push the changed devices to
+    Redis and mark the rows.
+
+    The newest change per device is pushed from its telemetry_latest row,
+    which carries the alias the outbox payload lacks; the Lua version guard
+    keeps Redis from regressing if a newer snapshot was already pushed.
+
+    On success the rows become PROCESSED. On a Redis error their attempts
+    are incremented, the error recorded, and they return to NEW for a
+    retry, or become FAILED after max_attempts; the error is then re-raised.
+
+    Returns:
+        Number of outbox rows claimed (0 when the outbox is drained).
+    """
+    outbox = TelemetryLatestOutbox
+    error: Exception | None = None
+
+    async with session.begin():
+        rows = await claim_outbox_batch(session, batch_size, shards, slots)
+        if not rows:
+            return 0
+
+        newest = collapse_newest_per_device(rows)
+        claimed = outbox.outbox_id == any_(bindparam(
+            "outbox_ids", value=[r.outbox_id for r in rows], type_=ARRAY(BigInteger),
+        ))
+
+        result = await session.execute(
+            select(TelemetryLatest).where(TelemetryLatest.device_uuid == any_(bindparam(
+                "device_uuids", value=list(newest), type_=ARRAY(PG_UUID(as_uuid=True)),
+            )))
+        )
+        latest_rows = result.scalars().all()
+
+        try:
+            updated = await sync_latest_rows_to_redis(session, latest_rows)
+        except Exception as exc:
+            error = exc
+            await session.execute(
+                update(outbox)
+                .where(claimed)
+                .values(
+                    attempts=outbox.attempts + 1,
+                    last_error=str(exc)[:MAX_ERROR_LENGTH],
+                    status=case(
+                        (outbox.attempts + 1 >= max_attempts, OUTBOX_FAILED),
+                        else_=OUTBOX_NEW,
+                    ),
+                )
+            )
+        else:
+            await session.execute(
+                update(outbox)
+                .where(claimed)
+                .values(
+                    attempts=outbox.attempts + 1,
+                    status=OUTBOX_PROCESSED,
+                    processed_at=func.now(),
+                    last_error=None,
+                )
+            )
+
+    if error is not None:
+        raise error
+
+    logger.debug(
+        "Outbox batch synced. claimed=%d devices=%d updated=%d",
+        len(rows), len(newest), updated,
+    )
+    return len(rows)
+
+
+async def drain_outbox(
+    batch_size: int,
+    max_attempts: int,
+    shards: Collection[int] = (0,),
+    slots: int = 1,
+) -> int:
+    """
+    Process outbox batches of the given shards until fewer than batch_size
+    rows are claimed.
+
+    Each batch is its own transaction, so row locks are held only while
+    that batch is pushed.
+
+    Returns:
+        Total number of outbox rows processed.
+    """
+    total = 0
+    while True:
+        async with async_session_maker() as session:
+            claimed = await process_outbox_batch(
+                session, batch_size, max_attempts, shards, slots,
+            )
+        total += claimed
+        if claimed < batch_size:
+            return total
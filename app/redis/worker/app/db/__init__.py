@@ -1,8 +1,16 @@
 from .redis import redis_client
 from .postgres import get_db, async_session_maker
+from .notify import OUTBOX_NOTIFY_CHANNEL, NotifyListener
+from .shards import MEMBER_LOCK_CLASS, SHARD_LOCK_CLASS, ShardOwnership, assign_shards
 
 __all__ = [
     "redis_client",
     "get_db",
     "async_session_maker",
+    "OUTBOX_NOTIFY_CHANNEL",
+    "NotifyListener",
+    "MEMBER_LOCK_CLASS",
+    "SHARD_LOCK_CLASS",
+    "ShardOwnership",
+    "assign_shards",
 ]
@@ -0,0 +1,119 @@
+# db/notify.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Channel notified (once per transaction) when telemetry_latest_outbox gets rows
+OUTBOX_NOTIFY_CHANNEL = "telemetry_latest_outbox"
+
+
+class NotifyListener:
+    """
+    Dedicated LISTEN connection that turns Postgres notifications into wakeups.
+
+    - Holds one asyncpg connection outside the SQLAlchemy pool.
+    - Notifications only set an event; the caller does the work, so a burst
+      of notifications collapses into a single wakeup.
+    - The connection is probed every keepalive_seconds and re-established
+      after reconnect_seconds when lost. Every (re)connect also wakes the
+      caller, since notifications sent while disconnected are lost.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str,
+        *,
+        keepalive_seconds: float = 30.0,
+        reconnect_seconds: float = 1.0,
+    ) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self.keepalive_seconds = keepalive_seconds
+        self.reconnect_seconds = reconnect_seconds
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.connected = False
+        self.notifications = 0
+        self.connects = 0
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        self.notifications += 1
+        self._wakeup.set()
+
+    async def _listen_once(self) -> None:
+        """Connect, LISTEN and block until the connection is lost."""
+        connection = await asyncpg.connect(self.dsn, timeout=5)
+        try:
+            lost = asyncio.Event()
+            connection.add_termination_listener(lambda _: lost.set())
+            await connection.add_listener(self.channel, self._on_notify)
+
+            self.connected = True
+            self.connects += 1
+            self._wakeup.set()
+
+            while not lost.is_set():
+                try:
+                    await asyncio.wait_for(lost.wait(), timeout=self.keepalive_seconds)
+                except asyncio.TimeoutError:
+                    # detect half-open connections
+                    await connection.execute("SELECT 1")
+        finally:
+            self.connected = False
+            if not connection.is_closed():
+                await connection.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("LISTEN connection failed")
+
+            await asyncio.sleep(self.reconnect_seconds)
+
+    async def wait(self, timeout: float) -> bool:
+        """
+        Wait for a notification or timeout seconds.
+
+        The event is cleared on return, before the caller works, so
+        notifications arriving during that work trigger the next wakeup.
+
+        Returns:
+            True if woken by a notification (or reconnect), False on timeout.
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._wakeup.clear()
+        return True
+
+    async def start(self) -> None:
+        """Start the LISTEN connection loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Close the LISTEN connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
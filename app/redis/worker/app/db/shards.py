@@ -0,0 +1,161 @@
+# db/shards.py
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Two-key advisory locks: (class, id). Members lock (MEMBER_LOCK_CLASS, member_id),
+# shard owners lock (SHARD_LOCK_CLASS, shard).
+MEMBER_LOCK_CLASS = 0x72736D62  # "rsmb"
+SHARD_LOCK_CLASS = 0x72737368   # "rssh"
+
+LIVE_MEMBERS_SQL = """
+SELECT objid::int AS member_id
+FROM pg_locks
+WHERE locktype = 'advisory'
+  AND database = (SELECT oid FROM pg_database WHERE datname = current_database())
+  AND classid = $1::int::oid
+  AND objsubid = 2
+  AND granted
+ORDER BY member_id
+"""
+
+TRY_LOCK_SQL = """
+SELECT s FROM unnest($2::int[]) AS s WHERE pg_try_advisory_lock($1::int, s)
+"""
+
+UNLOCK_SQL = """
+SELECT pg_advisory_unlock($1::int, s) FROM unnest($2::int[]) AS s
+"""
+
+
+def assign_shards(members: list[int], member_id: int, slots: int) -> frozenset[int]:
+    """Shards a member should own: every len(members)-th shard, offset by its rank."""
+    if member_id not in members:
+        return frozenset()
+    rank = members.index(member_id)
+    return frozenset(range(rank, slots, len(members)))
+
+
+class ShardOwnership:
+    """
+    Device-space sharding for Redis sync replicas via Postgres advisory locks.
+
+    - Devices map to `slots` shards by a hash of device_uuid.
+    - Each replica holds a session-level member lock on a dedicated
+      connection; live replicas are read back from pg_locks.
+    - Every rebalance_seconds the replica computes its share of the shards
+      from its rank among live members, releases shards it should no longer
+      own and try-locks the ones it should. A shard freed by another
+      replica is picked up on a later round, so each shard has at most one
+      owner at a time.
+    - A replica that dies or loses its connection releases every lock with
+      it; the others take over its shards on their next round.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        slots: int,
+        rebalance_seconds: float,
+        reconnect_seconds: float = 1.0,
+    ) -> None:
+        self.dsn = dsn
+        self.slots = slots
+        self.rebalance_seconds = rebalance_seconds
+        self.reconnect_seconds = reconnect_seconds
+
+        self.member_id: Optional[int] = None
+        self.owned: frozenset[int] = frozenset()
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.members = 0
+        self.rebalances = 0
+
+    async def _join(self, connection: asyncpg.Connection) -> int:
+        """Take the lowest free member id."""
+        for member_id in range(self.slots):
+            if await connection.fetchval(
+                "SELECT pg_try_advisory_lock($1::int, $2::int)", MEMBER_LOCK_CLASS, member_id,
+            ):
+                return member_id
+        raise RuntimeError(f"All {self.slots} sync worker member slots are taken")
+
+    async def rebalance(self, connection: asyncpg.Connection) -> None:
+        """Release and acquire shards to match this replica's share."""
+        members = [r["member_id"] for r in await connection.fetch(LIVE_MEMBERS_SQL, MEMBER_LOCK_CLASS)]
+        target = assign_shards(members, self.member_id, self.slots)
+
+        release = sorted(self.owned - target)
+        if release:
+            await connection.execute(UNLOCK_SQL, SHARD_LOCK_CLASS, release)
+            self.owned = self.owned - set(release)
+
+        acquire = sorted(target - self.owned)
+        if acquire:
+            rows = await connection.fetch(TRY_LOCK_SQL, SHARD_LOCK_CLASS, acquire)
+            self.owned = self.owned | {r["s"] for r in rows}
+
+        if release or acquire or len(members) != self.members:
+            self.rebalances += 1
+            logger.info(
+                "Shard ownership: member=%d members=%d owned=%d/%d",
+                self.member_id, len(members), len(self.owned), self.slots,
+            )
+        self.members = len(members)
+
+    async def _hold_once(self) -> None:
+        """Connect, join and rebalance until the connection is lost."""
+        connection = await asyncpg.connect(self.dsn, timeout=5)
+        try:
+            lost = asyncio.Event()
+            connection.add_termination_listener(lambda _: lost.set())
+
+            self.member_id = await self._join(connection)
+            while not lost.is_set():
+                await self.rebalance(connection)
+                try:
+                    await asyncio.wait_for(lost.wait(), timeout=self.rebalance_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # locks die with the session
+            self.owned = frozenset()
+            self.member_id = None
+            if not connection.is_closed():
+                await connection.close()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._hold_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Shard ownership connection failed")
+
+            await asyncio.sleep(self.reconnect_seconds)
+
+    async def start(self) -> None:
+        """Join the sync worker group."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Leave the group, releasing every shard."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._task = None
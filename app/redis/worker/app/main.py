@@ -5,9 +5,13 @@ import asyncio
 import logging
 
 from .config import get_settings, setup_logging
-from .db import async_session_maker
-from .models import TelemetryLatestOutbox
-from .app_factory import fetch_all_latest, sync_latest_rows_to_redis, sync_telemetry_count
+from .db import OUTBOX_NOTIFY_CHANNEL, NotifyListener, ShardOwnership, async_session_maker
+from .app_factory import (
+    drain_outbox,
+    stream_all_latest,
+    sync_latest_rows_to_redis,
+    sync_telemetry_count,
+)
 
 POLL_INTERVAL_SEC = 0.5
 
@@ -17,20 +21,64 @@ logger = logging.getLogger(__name__)
 
 
 async def main() -> None:
+    # outbox mode: one full sync seeds each owned shard, then only changed devices are pushed
+    seeded: frozenset[int] = frozenset()
+
+    # Each replica syncs only the device shards it holds
+    ownership = None
+    slots = 1
+    if settings.sharding_enabled:
+        slots = settings.shard_slots
+        ownership = ShardOwnership(
+            settings.postgres.dsn,
+            slots=slots,
+            rebalance_seconds=settings.rebalance_interval,
+        )
+        await ownership.start()
+
+    # Wake on NOTIFY from telemetry inserts; polling remains as a heartbeat
+    listener = None
+    if settings.listen_enabled:
+        listener = NotifyListener(
+            settings.postgres.dsn,
+            OUTBOX_NOTIFY_CHANNEL,
+            keepalive_seconds=settings.heartbeat_interval,
+        )
+        await listener.start()
 
     while True:
+        failed = False
+        owned = ownership.owned if ownership is not None else frozenset({0})
         try:
             async with async_session_maker() as session:
                 telemetry_count = await sync_telemetry_count(session)
                 logger.debug(f"Sync telemetry count {telemetry_count}.")
 
-                rows = await fetch_all_latest(session)
-                await sync_latest_rows_to_redis(session, rows)
+                # shards taken over from another replica are re-seeded too
+                to_seed = owned if settings.sync_mode == "full" else owned - seeded
+                if to_seed:
+                    rows = stream_all_latest(session, to_seed, slots)
+                    await sync_latest_rows_to_redis(session, rows)
+                seeded = (seeded & owned) | to_seed
+
+            if settings.sync_mode == "outbox" and owned:
+                processed = await drain_outbox(
+                    settings.outbox_batch_size,
+                    settings.outbox_max_attempts,
+                    owned,
+                    slots,
+                )
+                logger.debug(f"Synced {processed} outbox rows.")
 
         except Exception:
+            failed = True
             logger.exception("Worker error")
 
-        await asyncio.sleep(settings.poll_interval)
+        # retry failures, and wait for shards, on the short poll interval
+        if listener is not None and listener.connected and owned and not failed:
+            await listener.wait(settings.heartbeat_interval)
+        else:
+            await asyncio.sleep(settings.poll_interval)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # models/__init__.py
 from .base import Base
 from .device_registry import DeviceRegistry
+from .telemetry_count_stripe import TelemetryCountStripe
 from .telemetry_event import TelemetryEvent
 from .telemetry_latest import TelemetryLatest
 from .telemetry_latest_outbox import TelemetryLatestOutbox
@@ -8,6 +9,7 @@ from .telemetry_latest_outbox import TelemetryLatestOutbox
 __all__ = [
     "Base",
     "DeviceRegistry",
+    "TelemetryCountStripe",
     "TelemetryEvent",
     "TelemetryLatest",
     "TelemetryLatestOutbox",
@@ -16,6 +16,9 @@ from .base import Base
 class TelemetryLatestOutbox(Base):
     """
     Outbox messages produced from telemetry_event inserts.
+
+    Partitioned by created_at (one partition per UTC day); old partitions
+    are dropped by the API's outbox maintenance job.
     """
 
     __tablename__ = "telemetry_latest_outbox"
@@ -50,6 +53,12 @@ class TelemetryLatestOutbox(Base):
         doc="Type of outbox message.",
     )
 
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        doc="Message version (the source telemetry_event.id).",
+    )
+
     system_time_utc: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -58,9 +67,9 @@ class TelemetryLatestOutbox(Base):
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        nullable=False,
+        primary_key=True,
         server_default=func.now(),
-        doc="Timestamp when the outbox row was created.",
+        doc="Timestamp when the outbox row was created (partition key, part of the primary key).",
     )
 
     # delivery management
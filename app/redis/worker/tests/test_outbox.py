@@ -0,0 +1,38 @@
+# tests/test_outbox.py
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+from app.app_factory import collapse_newest_per_device
+
+NOW = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def _row(device, outbox_id, age_seconds, version):
+    return SimpleNamespace(
+        outbox_id=outbox_id,
+        device_uuid=UUID(int=device),
+        version=version,
+        system_time_utc=NOW - timedelta(seconds=age_seconds),
+    )
+
+
+def test_newest_row_per_device_by_system_time():
+    rows = [_row(1, 1, 10, 5), _row(1, 2, 5, 3), _row(2, 3, 1, 9), _row(1, 4, 20, 8)]
+
+    newest = collapse_newest_per_device(rows)
+
+    assert {device: row.outbox_id for device, row in newest.items()} == {
+        UUID(int=1): 2,
+        UUID(int=2): 3,
+    }
+
+
+def test_version_breaks_system_time_ties():
+    rows = [_row(1, 1, 0, 7), _row(1, 2, 0, 9), _row(1, 3, 0, 8)]
+
+    assert collapse_newest_per_device(rows)[UUID(int=1)].outbox_id == 2
+
+
+def test_empty_batch():
+    assert collapse_newest_per_device([]) == {}
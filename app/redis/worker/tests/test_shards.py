@@ -0,0 +1,48 @@
+# tests/test_shards.py
+from app.db import assign_shards
+
+SLOTS = 8
+
+
+def ownership(members):
+    return {member: assign_shards(members, member, SLOTS) for member in members}
+
+
+def assert_partition(owned):
+    shards = [shard for share in owned.values() for shard in share]
+    assert sorted(shards) == list(range(SLOTS))
+
+
+def test_single_member_owns_every_shard():
+    assert assign_shards([0], 0, SLOTS) == frozenset(range(SLOTS))
+
+
+def test_shards_split_by_rank_and_offset():
+    owned = ownership([0, 1, 2])
+
+    assert owned[0] == {0, 3, 6}
+    assert owned[1] == {1, 4, 7}
+    assert owned[2] == {2, 5}
+    assert_partition(owned)
+
+
+def test_rebalance_when_member_joins():
+    before = ownership([0, 1])
+    after = ownership([0, 1, 2])
+
+    assert before[0] == {0, 2, 4, 6}
+    assert after[0] == {0, 3, 6}
+    assert_partition(after)
+
+
+def test_rebalance_when_member_leaves_uses_rank_not_id():
+    # member 1 left; member 2 now has rank 1
+    owned = ownership([0, 2])
+
+    assert owned[2] == {1, 3, 5, 7}
+    assert_partition(owned)
+
+
+def test_unknown_member_owns_nothing():
+    assert assign_shards([0, 1], 5, SLOTS) == frozenset()
+
@@ -0,0 +1,132 @@
+# tests/test_sync_pipelines.py
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+import pytest
+
+from app.app_factory import func
+
+NOW = datetime(2025, 11, 17, 12, 0, tzinfo=timezone.utc)
+
+
+def _rows(count):
+    return [
+        SimpleNamespace(
+            device_uuid=UUID(int=i), alias=None, x_coord=1.0, y_coord=2.0,
+            device_time=NOW, system_time_utc=NOW,
+        )
+        for i in range(count)
+    ]
+
+
+async def _as_stream(items):
+    for item in items:
+        yield item
+
+
+async def _collect_chunks(rows, size):
+    return [chunk async for chunk in func._chunked(rows, size)]
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_chunked_splits_list_and_async_input(stream):
+    rows = list(range(7))
+    source = _as_stream(rows) if stream else rows
+
+    chunks = asyncio.run(_collect_chunks(source, 3))
+
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunked_empty_input():
+    assert asyncio.run(_collect_chunks([], 3)) == []
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = 0
+
+    def evalsha(self, *args):
+        self.commands += 1
+
+    async def execute(self):
+        return await self.redis.execute(self.commands)
+
+
+class FakeRedis:
+    """Pipelines block until released; the one numbered fail_on raises."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.release = asyncio.Event()
+        self.started = 0
+        self.inflight = 0
+        self.max_inflight = 0
+        self.cancelled = 0
+
+    def pipeline(self, transaction=False):
+        return FakePipeline(self)
+
+    async def script_load(self, script):
+        return "sha"
+
+    async def execute(self, commands):
+        self.started += 1
+        number = self.started
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            if number == self.fail_on:
+                await asyncio.sleep(0)
+                raise ConnectionError("redis down")
+            await self.release.wait()
+            return [1] * commands
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.inflight -= 1
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    def install(**kwargs):
+        redis = FakeRedis(**kwargs)
+        monkeypatch.setattr(func, "redis_client", redis)
+        monkeypatch.setattr(func, "_lua_sha", None)
+        monkeypatch.setattr(func, "BATCH_SIZE", 2)
+        return redis
+    return install
+
+
+def test_pipelines_are_chunked_with_bounded_concurrency(fake_redis):
+    async def scenario():
+        redis = fake_redis()
+        redis.release.set()
+        updated = await func.sync_latest_rows_to_redis(None, _as_stream(_rows(11)))
+        return redis, updated
+
+    redis, updated = asyncio.run(scenario())
+
+    assert updated == 11
+    assert redis.started == 6
+    assert redis.max_inflight <= func.MAX_INFLIGHT_PIPELINES
+
+
+def test_inflight_pipelines_are_cancelled_when_one_fails(fake_redis):
+    async def scenario():
+        redis = fake_redis(fail_on=2)
+        with pytest.raises(ConnectionError):
+            await func.sync_latest_rows_to_redis(None, _rows(20))
+        return redis
+
+    redis = asyncio.run(scenario())
+
+    # the failure surfaces while MAX_INFLIGHT_PIPELINES are running; the
+    # others are cancelled and no further chunks are sent
+    assert redis.started == func.MAX_INFLIGHT_PIPELINES
+    assert redis.cancelled == func.MAX_INFLIGHT_PIPELINES - 1
+    assert redis.inflight == 0
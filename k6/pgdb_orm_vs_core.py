@@ -0,0 +1,114 @@
+"""
+Micro-benchmark: ORM vs Core on the telemetry hot paths.
+
+Runs against the baseline app's database (configure with the same env vars,
+e.g. POSTGRES__HOST=localhost) and reports mean/p99 latency per operation:
+
+- insert: ORM add + commit + refresh   vs  Core insert().returning() + commit
+- list:   select(TelemetryEvent)       vs  select(columns)
+
+Usage:
+    python k6/pgdb_orm_vs_core.py [iterations]
+"""
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app" / "fastapi_baseline"))
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from app.db import async_session_maker  # noqa: E402
+from app.models import DeviceRegistry, TelemetryEvent  # noqa: E402
+from app.schemas import TelemetryItem  # noqa: E402
+
+ITEM_COLUMNS = (
+    TelemetryEvent.device_uuid,
+    TelemetryEvent.x_coord,
+    TelemetryEvent.y_coord,
+    TelemetryEvent.device_time,
+    TelemetryEvent.system_time_utc,
+)
+
+
+async def orm_insert(session, device_uuid):
+    now = datetime.now(timezone.utc)
+    telemetry = TelemetryEvent(
+        device_uuid=device_uuid, x_coord=1.0, y_coord=2.0,
+        device_time=now, system_time_utc=now,
+    )
+    session.add(telemetry)
+    await session.commit()
+    await session.refresh(telemetry)
+    return TelemetryItem.model_validate(telemetry)
+
+
+async def core_insert(session, device_uuid):
+    now = datetime.now(timezone.utc)
+    stmt = (
+        insert(TelemetryEvent)
+        .values(device_uuid=device_uuid, x_coord=1.0, y_coord=2.0,
+                device_time=now, system_time_utc=now)
+        .returning(*ITEM_COLUMNS)
+    )
+    row = (await session.execute(stmt)).one()
+    await session.commit()
+    return TelemetryItem.model_validate(row)
+
+
+async def orm_list(session, device_uuid):
+    stmt = (
+        select(TelemetryEvent)
+        .where(TelemetryEvent.device_uuid == device_uuid)
+        .order_by(TelemetryEvent.system_time_utc.desc())
+        .limit(100)
+    )
+    rows = (await session.execute(stmt)).scalars().all()
+    return [TelemetryItem.model_validate(r) for r in rows]
+
+
+async def core_list(session, device_uuid):
+    stmt = (
+        select(*ITEM_COLUMNS)
+        .where(TelemetryEvent.device_uuid == device_uuid)
+        .order_by(TelemetryEvent.system_time_utc.desc())
+        .limit(100)
+    )
+    rows = (await session.execute(stmt)).all()
+    return [TelemetryItem.model_validate(r) for r in rows]
+
+
+async def measure(name, func, device_uuid, iterations):
+    timings = []
+    for _ in range(iterations):
+        # fresh session per call, as per request in the API
+        async with async_session_maker() as session:
+            started = time.perf_counter()
+            await func(session, device_uuid)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+    print(f"{name:<12} mean={statistics.mean(timings):7.3f} ms  p99={p99:7.3f} ms")
+
+
+async def main(iterations: int) -> None:
+    async with async_session_maker() as session:
+        device_uuid = (await session.execute(
+            select(DeviceRegistry.device_uuid).limit(1)
+        )).scalar_one()
+
+    for name, func in (
+        ("orm_insert", orm_insert),
+        ("core_insert", core_insert),
+        ("orm_list", orm_list),
+        ("core_list", core_list),
+    ):
+        await measure(name, func, device_uuid, iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))